@@ -0,0 +1,126 @@
+import json, os
+from settings import load_image, RENDER_SCALE
+from sprites import SpriteStrip, load_sprites
+from registry import registry
+
+BAKED_DIR = "assets/baked"
+MANIFEST_PATH = os.path.join(BAKED_DIR, "manifest.json")
+# Set by sim.headless(): strips carry their frame count and timings but no
+# pixels, so entities can be updated without a display
+timing_only = False
+
+# Every animation strip in the game. "duration" is seconds per frame (a
+# single number or one value per frame). Run `python bake.py` after editing
+# this table or the source art so the atlas matches.
+ANIMATIONS = {
+    "protag/idle":       {"src": "assets/protag/idle.png", "frames": 4, "scale": 2.0, "duration": 0.25},
+    "protag/walk":       {"src": "assets/protag/walk.png", "frames": 2, "scale": 2.0, "duration": 0.15},
+    "protag/windup":     {"src": "assets/protag/windup.png", "frames": 2, "scale": 2.0, "duration": 0.10},
+    "protag/attack":     {"src": "assets/protag/attack.png", "frames": 1, "scale": 2.0, "duration": 0.20},
+    "protag/recovery":   {"src": "assets/protag/recovery.png", "frames": 1, "scale": 2.0, "duration": 0.20},
+    "protag/dash":       {"src": "assets/protag/dash.png", "frames": 1, "scale": 2.0, "duration": 0.1},
+
+    "papia/idle":        {"src": "assets/papia/idle..png", "frames": 7, "frame_size": [256, 256], "scale": 1.5, "duration": 0.15},
+    "papia/cast":        {"src": "assets/papia/cast.png", "frames": 7, "frame_size": [256, 256], "scale": 1.5, "duration": 0.15},
+
+    "harus/idle":        {"src": "assets/harus/idle.png", "frames": 4, "frame_size": [256, 256], "scale": 2.0, "duration": 0.25},
+    "harus/walk":        {"src": "assets/harus/walk.png", "frames": 4, "frame_size": [256, 256], "scale": 2.0, "duration": 0.15},
+    "harus/windup":      {"src": "assets/harus/windup.png", "frames": 4, "frame_size": [256, 256], "scale": 2.0, "duration": 0.12},
+    "harus/attack":      {"src": "assets/harus/attack.png", "frames": 3, "frame_size": [256, 256], "scale": 2.0, "duration": 0.10},
+    "harus/recover":     {"src": "assets/harus/recover.png", "frames": 4, "frame_size": [256, 256], "scale": 2.0, "duration": 0.18},
+    "harus/spin":        {"src": "assets/harus/spin.png", "frames": 4, "frame_size": [256, 256], "scale": 2.0, "duration": 0.10},
+
+    # 128px meteor frames are drawn at 64px * 1.5
+    "effects/meteor":    {"src": "assets/effects/meteor.png", "frames": 4, "frame_size": [128, 128], "size": [96, 96], "flip": False, "duration": 1 / 12},
+    "effects/shockwave": {"src": "assets/effects/shockwave.png", "frames": 3, "frame_size": [256, 256], "scale": 0.8, "duration": 0.10},
+}
+
+def render_spec(spec):
+    """A table entry as drawn at RENDER_SCALE: the sizes the strip is baked
+    and loaded at. Identical to the entry at scale 1."""
+    if RENDER_SCALE == 1: return spec
+    spec = dict(spec, scale=spec.get("scale", 1.0) / RENDER_SCALE)
+    if spec.get("size"):
+        spec["size"] = [n // RENDER_SCALE for n in spec["size"]]
+    return spec
+
+def spec_args(spec):
+    """Normalise a table entry into the arguments the sprite layer takes."""
+    w, h = spec.get("frame_size") or (None, None)
+    size = spec.get("size")
+    duration = spec.get("duration", 0.2)
+    if not isinstance(duration, (list, tuple)):
+        duration = [duration] * spec["frames"]
+    return {
+        "path": spec["src"],
+        "frame_count": spec["frames"],
+        "frame_w": w,
+        "frame_h": h,
+        "scale": spec.get("scale", 1.0),
+        "size": tuple(size) if size else None,
+        "flip": spec.get("flip", True),
+        "trim": spec.get("trim", True),
+        "durations": list(duration),
+    }
+
+def load_manifest(path=MANIFEST_PATH):
+    def read():
+        with open(path) as f:
+            return json.load(f)
+    try:
+        return registry.acquire(("manifest", path), read)
+    except (OSError, ValueError):
+        return None
+
+def strip_from_atlas(name, entry, pages, base_dir=BAKED_DIR):
+    images = {}
+    def page(i):
+        if i not in images:
+            images[i] = load_image(os.path.join(base_dir, pages[i]))
+        return images[i]
+
+    variants, offsets = {}, {}
+    for facing, frames in entry["facings"].items():
+        facing = int(facing)
+        variants[facing] = [page(f["page"]).subsurface(f["rect"]) for f in frames]
+        offsets[facing] = [tuple(f["offset"]) for f in frames]
+    return SpriteStrip(variants, offsets, tuple(entry["size"]), entry["durations"], name)
+
+def timing_strip(name):
+    """A SpriteStrip with the frame count and durations of `name` and no frames."""
+    args = spec_args(render_spec(ANIMATIONS[name]))
+    count = args["frame_count"]
+    return SpriteStrip({1: [None] * count}, {1: [(0, 0)] * count}, (0, 0), args["durations"], name)
+
+def load_animation(name):
+    """Load a strip from ANIMATIONS, from the baked atlas when it is up to date
+    with the table, otherwise from the loose PNG."""
+    if timing_only:
+        return registry.acquire(("timing", name), lambda: timing_strip(name))
+    spec = render_spec(ANIMATIONS[name])
+    manifest = load_manifest()
+    entry = manifest["strips"].get(name) if manifest else None
+    if entry is not None and entry["spec"] == spec_json(spec):
+        return registry.acquire(("animation", name), lambda: strip_from_atlas(name, entry, manifest["pages"]))
+    return load_sprites(**spec_args(spec))
+
+def animation_files(names):
+    """The image files load_animation reads for these strips, for preloading."""
+    manifest = load_manifest()
+    files = []
+    for name in names:
+        spec = render_spec(ANIMATIONS[name])
+        entry = manifest["strips"].get(name) if manifest else None
+        if entry is not None and entry["spec"] == spec_json(spec):
+            paths = [os.path.join(BAKED_DIR, manifest["pages"][f["page"]])
+                     for frames in entry["facings"].values() for f in frames]
+        else:
+            paths = [spec["src"]]
+        for p in paths:
+            if p not in files: files.append(p)
+    if manifest: registry.release(("manifest", MANIFEST_PATH))
+    return files
+
+def spec_json(spec):
+    # Round-trip through JSON so table entries compare equal to manifest ones
+    return json.loads(json.dumps(spec))
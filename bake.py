@@ -0,0 +1,153 @@
+"""Bake every strip in animations.ANIMATIONS into texture atlas pages.
+
+    python bake.py [--force]
+
+Frames are flipped, scaled (for settings.RENDER_SCALE) and trimmed exactly as
+the game would do at load time, packed into PNG pages under assets/baked/ (one set per character) and described by
+assets/baked/manifest.json (frame rects, anchor offsets, per-frame
+durations). Strips whose source PNG and table entry are unchanged since the
+last bake are copied from the previous atlas instead of being re-baked.
+"""
+import hashlib, json, os, sys
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+from animations import ANIMATIONS, BAKED_DIR, MANIFEST_PATH, render_spec, spec_args, spec_json
+from sprites import bake_frames
+from surfaces import classify, ALPHA
+
+PAGE_SIZE = 2048
+PADDING = 1
+# Bumped when the page layout changes, so old atlases are repacked
+VERSION = 2
+
+def digest(spec):
+    h = hashlib.sha1(json.dumps(spec, sort_keys=True).encode())
+    with open(spec["src"], "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+def bake_strip(spec):
+    """Returns ({facing: [frames]}, {facing: [offsets]}, full_size, durations)."""
+    args = spec_args(spec)
+    sheet = pygame.image.load(args["path"])
+    w, h = args["frame_w"], args["frame_h"]
+    if w is None:
+        w, h = sheet.get_width() // args["frame_count"], sheet.get_height()
+    frames = [sheet.subsurface((i * w, 0, w, h)) for i in range(args["frame_count"])]
+    variants, offsets = {}, {}
+    full_size = (0, 0)
+    for facing in ((1, -1) if args["flip"] else (1,)):
+        variants[facing], offsets[facing], full_size = bake_frames(
+            frames, args["scale"], args["size"], args["trim"], facing == -1)
+    return variants, offsets, full_size, args["durations"]
+
+def reuse_strip(entry, old_pages):
+    variants, offsets = {}, {}
+    for facing, frames in entry["facings"].items():
+        variants[int(facing)] = [old_pages[f["page"]].subsurface(f["rect"]).copy() for f in frames]
+        offsets[int(facing)] = [tuple(f["offset"]) for f in frames]
+    return variants, offsets, tuple(entry["size"]), entry["durations"]
+
+def pack(items):
+    """Shelf-pack (key, surface) items. Returns ({key: (page, rect)}, page sizes)."""
+    placed = {}
+    pages = []
+    x = y = shelf_h = 0
+    page = -1
+    for key, surf in sorted(items, key=lambda t: -t[1].get_height()):
+        w, h = surf.get_width() + PADDING, surf.get_height() + PADDING
+        if page < 0 or x + w > PAGE_SIZE:
+            x, y, shelf_h = 0, y + shelf_h, 0
+        if page < 0 or y + h > PAGE_SIZE:
+            page += 1
+            pages.append([0, 0])
+            x = y = shelf_h = 0
+        placed[key] = (page, [x, y, surf.get_width(), surf.get_height()])
+        pages[page][0] = max(pages[page][0], x + w)
+        pages[page][1] = max(pages[page][1], y + h)
+        x += w
+        shelf_h = max(shelf_h, h)
+    return placed, pages
+
+def main(force=False):
+    pygame.init()
+    previous = None
+    if os.path.exists(MANIFEST_PATH):
+        with open(MANIFEST_PATH) as f:
+            previous = json.load(f)
+    old = None if force else previous
+    old_pages = []
+    if old:
+        try:
+            old_pages = [pygame.image.load(os.path.join(BAKED_DIR, p)) for p in old["pages"]]
+        except (pygame.error, FileNotFoundError):
+            old = None
+
+    strips = {}
+    baked = 0
+    for name, spec in ANIMATIONS.items():
+        spec = render_spec(spec)
+        key = digest(spec)
+        entry = old["strips"].get(name) if old else None
+        if entry and entry["digest"] == key:
+            strips[name] = (key, reuse_strip(entry, old_pages))
+        else:
+            strips[name] = (key, bake_strip(spec))
+            baked += 1
+            print(f"baked {name}")
+
+    if old and old.get("version") == VERSION and baked == 0 and set(old["strips"]) == set(ANIMATIONS):
+        print("atlas is up to date")
+        return
+
+    # One set of pages per group ("protag", "papia", ...) so a scene only
+    # keeps the pages of the characters it shows. Frames without partial
+    # alpha go on separate "_key" pages, which load as colorkeyed surfaces
+    groups = {}
+    for name, (_, (variants, _, _, _)) in strips.items():
+        for facing, frames in variants.items():
+            for i, f in enumerate(frames):
+                page_set = name.split("/")[0] + ("" if classify(f) == ALPHA else "_key")
+                groups.setdefault(page_set, []).append(((name, facing, i), f))
+    items, placed, page_sizes, page_names = [], {}, [], []
+    for group, group_items in groups.items():
+        group_placed, group_sizes = pack(group_items)
+        for key, (page, rect) in group_placed.items():
+            placed[key] = (len(page_sizes) + page, rect)
+        page_names += [f"{group}{i}.png" for i in range(len(group_sizes))]
+        page_sizes += group_sizes
+        items += group_items
+
+    os.makedirs(BAKED_DIR, exist_ok=True)
+    surfaces = [pygame.Surface(size, pygame.SRCALPHA) for size in page_sizes]
+    for (name, facing, i), surf in items:
+        page, rect = placed[(name, facing, i)]
+        surfaces[page].blit(surf, rect[:2])
+    for page_name, surf in zip(page_names, surfaces):
+        pygame.image.save(surf, os.path.join(BAKED_DIR, page_name))
+    for stale in (previous["pages"] if previous else []):
+        if stale not in page_names and os.path.exists(os.path.join(BAKED_DIR, stale)):
+            os.remove(os.path.join(BAKED_DIR, stale))
+
+    manifest = {"version": VERSION, "pages": page_names, "strips": {}}
+    for name, (key, (variants, offsets, full_size, durations)) in strips.items():
+        manifest["strips"][name] = {
+            "src": ANIMATIONS[name]["src"],
+            "digest": key,
+            "spec": spec_json(render_spec(ANIMATIONS[name])),
+            "size": list(full_size),
+            "durations": list(durations),
+            "facings": {
+                str(facing): [{"page": placed[(name, facing, i)][0],
+                               "rect": placed[(name, facing, i)][1],
+                               "offset": list(offsets[facing][i])} for i in range(len(frames))]
+                for facing, frames in variants.items()
+            },
+        }
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump(manifest, f, indent=1)
+    print(f"{baked} strips baked, {len(strips) - baked} reused, "
+          f"{len(page_names)} page(s): {', '.join(f'{w}x{h}' for w, h in page_sizes)}")
+
+if __name__ == "__main__":
+    main(force="--force" in sys.argv)
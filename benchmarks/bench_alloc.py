@@ -0,0 +1,102 @@
+"""Objects a fight tick creates, and the memory each entity takes.
+
+    python -m benchmarks.bench_alloc [ticks]
+
+Plays headless fights against the chase bot and counts the Rects, Vector2s,
+collision shapes, colliders and hits constructed per tick, plus the peak
+memory allocated and dropped again within a tick (tracemalloc). Then sizes
+the player, the bosses and the collision objects as the slotted instances
+they are, next to the same attributes held in a per-instance __dict__.
+"""
+import sys, time, tracemalloc
+from contextlib import contextmanager
+import pygame
+import benchmarks.common  # repo root and dummy SDL drivers; no display is opened
+import sim, player, bosses, collision
+from collision import Box, Circle, Collider
+from policies import chase
+from projectiles import FLOAT_FIELDS, INT_FIELDS
+from settings import SIM_HZ
+import numpy as np
+
+@contextmanager
+def count_constructions():
+    """Count Rects, Vector2s (made by name, not by arithmetic) and collision
+    objects constructed inside the block, by type name."""
+    counts = dict.fromkeys(("Rect", "Vector2", "Box", "Circle", "Collider", "Hit"), 0)
+    def counting(base):
+        class Counted(base):
+            def __init__(self, *args, **kwargs):
+                counts[base.__name__] += 1
+                super().__init__(*args, **kwargs)
+        return Counted
+    def counted_init(cls):
+        init = cls.__init__
+        def __init__(self, *args, **kwargs):
+            counts[cls.__name__] += 1
+            init(self, *args, **kwargs)
+        return __init__
+    patches = [(pygame, "Rect", counting(pygame.Rect))]
+    patches += [(module, "Vector2", counting(module.Vector2)) for module in (player, bosses)]
+    # Collision classes keep their identity: overlaps() dispatches on type()
+    patches += [(cls, "__init__", counted_init(cls)) for cls in (Box, Circle, Collider)]
+    original_hit = collision.Hit
+    def hit(*args):
+        counts["Hit"] += 1
+        return original_hit(*args)
+    patches.append((collision, "Hit", hit))
+    originals = [(module, name, getattr(module, name)) for module, name, _ in patches]
+    for module, name, value in patches: setattr(module, name, value)
+    try:
+        yield counts
+    finally:
+        for module, name, value in originals: setattr(module, name, value)
+
+def per_tick(name, ticks):
+    fight = sim.new_fight(name, seed=0)
+    with count_constructions() as counts:
+        for _ in range(ticks):
+            fight.step(1.0 / SIM_HZ, sim.Held(chase(fight)))
+            if fight.outcome: fight = sim.new_fight(name, seed=fight.tick)
+    tracemalloc.start()
+    transient = 0
+    for _ in range(ticks):
+        keys = sim.Held(chase(fight))
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        fight.step(1.0 / SIM_HZ, keys)
+        transient += tracemalloc.get_traced_memory()[1] - base
+        if fight.outcome: fight = sim.new_fight(name, seed=fight.tick)
+    tracemalloc.stop()
+    return {k: v / ticks for k, v in counts.items()}, transient / ticks
+
+def instance_bytes(obj):
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"): size += sys.getsizeof(obj.__dict__)
+    return size
+
+def as_dict_backed(obj):
+    """The same attribute values on an instance of a plain class."""
+    plain = type(type(obj).__name__, (), {})()
+    for name in type(obj).__slots__: setattr(plain, name, getattr(obj, name, None))
+    return plain
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    sim.headless()
+    for name in sim.BOSSES:
+        start = time.perf_counter()
+        counts, transient = per_tick(name, ticks)
+        made = "  ".join(f"{k} {v:5.2f}" for k, v in counts.items())
+        print(f"{name:6s} per tick: {made}  peak transient {transient:6.0f} B  ({time.perf_counter() - start:.1f}s)")
+    fight = sim.new_fight("harus", seed=0)
+    entities = [fight.player, fight.boss, sim.new_fight("papia", seed=0).boss,
+                Collider("player", None, None, None, False, 0), Box(pygame.Rect(0, 0, 1, 1)), Circle(0, 0)]
+    for entity in entities:
+        print(f"{type(entity).__name__:12s} {instance_bytes(entity):5d} B slotted  "
+              f"{instance_bytes(as_dict_backed(entity)):5d} B with a __dict__")
+    slot = sum(np.dtype(np.float64).itemsize for _ in FLOAT_FIELDS) + sum(np.dtype(np.int8).itemsize for _ in INT_FIELDS)
+    print(f"{'projectile':12s} {slot:5d} B per array slot")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Time entity construction with a cold and a warm asset registry.
+
+    python -m benchmarks.bench_asset_registry
+"""
+from benchmarks.common import init_display, timed
+from player import Player
+from bosses import PapiaBoss, HarusBoss
+from registry import registry
+
+def build(cls):
+    obj = cls()
+    obj.cleanup()
+    return obj
+
+def main():
+    init_display()
+    for cls in (Player, PapiaBoss, HarusBoss):
+        before = registry.misses
+        cold, _ = timed(build, cls)
+        loads = registry.misses - before
+        before = registry.misses
+        warm, _ = timed(build, cls, repeat=20)
+        print(f"{cls.__name__:10s} cold {cold*1000:7.2f} ms ({loads} loads)   "
+              f"warm {warm*1000:7.3f} ms ({registry.misses - before} loads)")
+
+    boss, player = PapiaBoss(), Player()
+    before = registry.misses
+    boss.start_meteor_shower(player)
+    print(f"meteor shower: {registry.misses - before} loads for {boss.projectiles.n} meteors")
+    boss.cleanup()
+    player.cleanup()
+    print("registry:", registry.stats())
+
+if __name__ == "__main__":
+    main()
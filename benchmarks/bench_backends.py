@@ -0,0 +1,60 @@
+"""Fight rendering on the Surface backend vs the SDL2 Renderer/Texture backend.
+
+    python -m benchmarks.bench_backends [frames]
+
+Each backend runs in its own process. The sdl2 one is forced onto SDL's
+software renderer so both run anywhere, including the dummy video driver.
+Times cover drawing the world and presenting it (flip / Renderer.present),
+since the renderer only does its work at present.
+"""
+import subprocess, sys, time
+
+def run(backend, frames):
+    import pygame
+    from benchmarks.common import init_display, scripted_keys
+    from settings import load_img, WIDTH, HEIGHT, VIEW_W, VIEW_H, RENDER_SCALE
+    from canvas import open_texture_canvas
+    from player import Player
+    from bosses import PapiaBoss, HarusBoss
+
+    if backend == "sdl2":
+        pygame.init()
+        screen = open_texture_canvas("bench", (WIDTH, HEIGHT), software=True)
+        present = screen.present
+    else:
+        screen = init_display()
+        present = pygame.display.flip
+    bg = load_img("assets/story/bg1.png", (VIEW_W, VIEW_H))
+    for boss_cls in (PapiaBoss, HarusBoss):
+        player, boss = Player(), boss_cls()
+        dt = 1 / 60
+        start = time.perf_counter()
+        for f in range(frames):
+            player.update(dt, scripted_keys(f))
+            boss.update(dt, player)
+            player.hp = player.max_hp
+            if backend == "sdl2":
+                with screen.layer((0, 0), RENDER_SCALE):
+                    screen.blit(bg, (0, 0))
+                    boss.draw(screen)
+                    player.draw(screen)
+            else:
+                screen.blit(bg, (0, 0))
+                boss.draw(screen)
+                player.draw(screen)
+            present()
+        elapsed = time.perf_counter() - start
+        boss.cleanup()
+        uploads = f"  {screen.uploads} texture uploads" if backend == "sdl2" else ""
+        print(f"{backend:8s} {boss_cls.__name__:10s} {elapsed*1000/frames:6.3f} ms/frame{uploads}")
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--backend":
+        run(sys.argv[2], int(sys.argv[3]))
+        return
+    frames = sys.argv[1] if len(sys.argv) > 1 else "1200"
+    for backend in ("surface", "sdl2"):
+        subprocess.run([sys.executable, "-m", "benchmarks.bench_backends", "--backend", backend, frames], check=True)
+
+if __name__ == "__main__":
+    main()
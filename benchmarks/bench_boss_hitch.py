@@ -0,0 +1,34 @@
+"""Measure the frame hitch of constructing a boss with and without preloading.
+
+    python -m benchmarks.bench_boss_hitch [dialogue_seconds]
+
+"sync" builds the boss from a cold registry the way the fight used to
+start. "preloaded" first hands the boss' files to the preloader and waits
+as long as a short dialogue would, then builds it.
+"""
+import sys, time
+from benchmarks.common import init_display, timed
+from registry import registry
+from preload import preloader
+from bosses import PapiaBoss, HarusBoss
+
+def build(cls):
+    boss = cls()
+    boss.cleanup()
+
+def main():
+    dialogue = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    init_display()
+    for cls in (PapiaBoss, HarusBoss):
+        registry.clear()
+        sync, _ = timed(build, cls)
+
+        registry.clear()
+        preloader.preload(cls.asset_files())
+        time.sleep(dialogue)
+        preloaded, _ = timed(build, cls)
+        print(f"{cls.__name__:10s} sync {sync*1000:7.1f} ms   preloaded {preloaded*1000:7.1f} ms"
+              f"   (frame budget {1000/60:.1f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Boss update() cost per tick, by the state the boss was in.
+
+    python -m benchmarks.bench_boss_update [ticks]
+
+Plays headless fights against the chase bot and times every boss.update(),
+filed under the boss's state at the start of the tick. The attack scripts
+only run when their wait runs out, so a boss that is waiting (idle between
+spells, in a telegraph or recovery) costs little more than its animation
+and projectiles.
+"""
+import sys, time
+import benchmarks.common  # repo root and dummy SDL drivers; no display is opened
+import sim
+from policies import chase
+from settings import SIM_HZ
+
+def per_state(name, ticks):
+    cls = sim.BOSSES[name]
+    update, times = cls.update, {}
+    def timed_update(boss, dt, player):
+        state, start = boss.state, time.perf_counter()
+        update(boss, dt, player)
+        total, count = times.get(state, (0.0, 0))
+        times[state] = (total + time.perf_counter() - start, count + 1)
+    cls.update = timed_update
+    try:
+        fight = sim.new_fight(name, seed=0)
+        for _ in range(ticks):
+            fight.step(1.0 / SIM_HZ, sim.Held(chase(fight)))
+            if fight.outcome:
+                fight.cleanup()
+                fight = sim.new_fight(name, seed=fight.tick)
+        fight.cleanup()
+    finally:
+        cls.update = update
+    return times
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    sim.headless()
+    for name in sim.BOSSES:
+        for state, (total, count) in sorted(per_state(name, ticks).items(), key=lambda item: -item[1][1]):
+            print(f"{name:6s} {state:16s} {count:6d} ticks  {total / count * 1e6:6.2f} us/tick")
+
+if __name__ == "__main__":
+    main()
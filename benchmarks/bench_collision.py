@@ -0,0 +1,51 @@
+"""Collision world cost as the number of colliders grows.
+
+    python -m benchmarks.bench_collision [ticks]
+
+Scatters 8 to 2000 small shots and hazards over the screen around one player
+and times clear(), add() and collide() per tick with the spatial hash, against
+checking every attacker against every target of the same rules.
+"""
+import random, sys, time
+import pygame
+import benchmarks.common  # repo root and dummy SDL drivers; no display is opened
+from collision import Box, Circle, CollisionWorld, overlaps
+from settings import WIDTH, HEIGHT, GROUND_Y
+
+RULES = [("sword", "hazard", "cut"), ("hazard", "player", "hurt"), ("shot", "hazard", "pop")]
+
+def scatter(rng, count):
+    return [Circle(rng.uniform(0, WIDTH), rng.uniform(0, HEIGHT), rng.uniform(4, 12)) for _ in range(count)]
+
+def run(world, player, sword, shots, hazards):
+    world.clear()
+    world.add("player", player)
+    world.add("sword", sword)
+    for shape in shots: world.add("shot", shape)
+    for shape in hazards: world.add("hazard", shape)
+    return len(world.collide())
+
+def brute(player, sword, shots, hazards):
+    hits = sum(overlaps(sword, h) for h in hazards) + sum(overlaps(h, player) for h in hazards)
+    return hits + sum(overlaps(s, h) for s in shots for h in hazards)
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    player = Box(pygame.Rect(WIDTH // 2 - 20, GROUND_Y - 80, 40, 80))
+    sword = Box(pygame.Rect(WIDTH // 2 + 20, GROUND_Y - 70, 70, 50))
+    for count in (8, 64, 256, 1000, 2000):
+        rng = random.Random(1)
+        shots, hazards = scatter(rng, count // 2), scatter(rng, count - count // 2)
+        world = CollisionWorld(RULES)
+        start = time.perf_counter()
+        for _ in range(ticks): hits = run(world, player, sword, shots, hazards)
+        grid = (time.perf_counter() - start) / ticks
+        repeats = max(1, ticks * 64 // count)
+        start = time.perf_counter()
+        for _ in range(repeats): pairs = brute(player, sword, shots, hazards)
+        every = (time.perf_counter() - start) / repeats
+        print(f"{count:5d} colliders  grid {grid * 1e6:9.1f} us/tick  all pairs {every * 1e6:10.1f} us/tick  "
+              f"{every / grid:6.1f}x  ({hits} hits, {pairs} overlapping pairs)")
+
+if __name__ == "__main__":
+    main()
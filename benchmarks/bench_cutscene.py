@@ -0,0 +1,43 @@
+"""Per-frame cost of drawing cutscene slides.
+
+    python -m benchmarks.bench_cutscene [frames]
+
+Times CutsceneManager.draw over the intro (with its fades) and the ending
+slide, and how long composing the slides in start_sequence takes.
+"""
+import sys
+from benchmarks.common import init_display, timed
+from settings import load_img
+from story import CutsceneManager
+from sprites import count_transforms
+
+INTRO = [
+    ("assets/story/marriage.png", "She was my beloved", 3.0),
+    ("assets/story/hand1.png", "But they...", 2.0),
+    ("assets/story/hand2.png", "They took her from me", 2.5),
+    ("assets/story/cave.png", "I finally tracked them, I must take my revenge", 3.0),
+]
+ENDING = [("assets/story/end.png", "My revenge is complete, yet I cannot remember her name", 999)]
+
+def play(mgr, screen, frames):
+    dt = 1 / 60
+    with count_transforms() as counts:
+        for _ in range(frames):
+            screen.fill((0, 0, 0))
+            mgr.draw()
+            mgr.update(dt)
+    return counts
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    screen = init_display()
+    mgr = CutsceneManager(screen)
+    for name, slides in (("intro", INTRO), ("ending", ENDING)):
+        data = [{"image": load_img(path), "text": text, "duration": d} for path, text, d in slides]
+        setup, _ = timed(mgr.start_sequence, data)
+        elapsed, counts = timed(play, mgr, screen, frames)
+        print(f"{name:7s} compose {setup*1000:6.1f} ms   draw {elapsed*1000/frames:6.3f} ms/frame   "
+              f"transforms during draw: {sum(counts.values())}")
+
+if __name__ == "__main__":
+    main()
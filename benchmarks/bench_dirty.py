@@ -0,0 +1,72 @@
+"""Full redraw + flip vs the dirty-rect renderer on a fight.
+
+    python -m benchmarks.bench_dirty [frames]
+
+Draws the background, boss and player to the world layer each frame the
+way main.py does,
+either in full with display.flip() or through DirtyRenderer, and reports
+wall and CPU time per frame and how much of the screen was pushed. Run it
+with SDL_VIDEODRIVER set to a real (software) driver to include the cost of
+presenting; the default dummy driver only measures drawing.
+"""
+import sys, time
+import pygame
+from benchmarks.common import init_display, scripted_keys
+from settings import load_img, WIDTH, HEIGHT, BLACK
+from dirty import DirtyRenderer
+from player import Player
+from bosses import PapiaBoss, HarusBoss
+
+def run(screen, boss_cls, frames, dirty):
+    bg = load_img("assets/story/bg1.png", (WIDTH, HEIGHT))
+    world = pygame.Surface((WIDTH, HEIGHT)).convert()
+    renderer = DirtyRenderer(screen, world)
+    player = Player()
+    boss = boss_cls()
+    pushed = 0
+    update, flip = pygame.display.update, pygame.display.flip
+    def count_update(rects):
+        nonlocal pushed
+        pushed += sum(r.w * r.h for r in rects)
+        update(rects)
+    def count_flip():
+        nonlocal pushed
+        pushed += WIDTH * HEIGHT
+        flip()
+    pygame.display.update, pygame.display.flip = count_update, count_flip
+    dt = 1 / 60
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        for f in range(frames):
+            player.update(dt, scripted_keys(f))
+            boss.update(dt, player)
+            player.hp = player.max_hp
+            if dirty and renderer.begin(bg):
+                drawn = boss.draw(world) + player.draw(world)
+                renderer.copy(drawn)
+                renderer.present(drawn)
+                continue
+            world.fill(BLACK)
+            world.blit(bg, (0, 0))
+            drawn = boss.draw(world) + player.draw(world)
+            screen.blit(world, (0, 0))
+            if dirty: renderer.present(drawn)
+            else: pygame.display.flip()
+    finally:
+        pygame.display.update, pygame.display.flip = update, flip
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    boss.cleanup()
+    return wall / frames, cpu / frames, pushed / (frames * WIDTH * HEIGHT)
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    screen = init_display()
+    print(f"video driver: {pygame.display.get_driver()}")
+    for boss_cls in (PapiaBoss, HarusBoss):
+        for dirty in (False, True):
+            wall, cpu, pushed = run(screen, boss_cls, frames, dirty)
+            print(f"{boss_cls.__name__:10s} {'dirty' if dirty else 'full ':5s}  {wall*1000:6.3f} ms/frame "
+                  f"({1/wall:6.0f} fps)  cpu {cpu*1000:6.3f} ms/frame  pushed {pushed:6.1%} of the screen")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Count pygame.transform calls made while drawing fights.
+
+    python -m benchmarks.bench_draw_transforms [frames]
+"""
+import sys
+from benchmarks.common import init_display, scripted_keys, timed
+from player import Player
+from bosses import PapiaBoss, HarusBoss
+from sprites import count_transforms, transform_stats
+
+def run_fight(screen, boss_cls, frames):
+    player = Player()
+    player.can_dash = True
+    boss = boss_cls()
+    dt = 1 / 60
+    with count_transforms() as counts:
+        for f in range(frames):
+            player.update(dt, scripted_keys(f))
+            boss.update(dt, player)
+            player.hp = player.max_hp
+            screen.fill((0, 0, 0))
+            boss.draw(screen)
+            player.draw(screen)
+    boss.cleanup()
+    return counts
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    screen = init_display()
+    for boss_cls in (PapiaBoss, HarusBoss):
+        elapsed, counts = timed(run_fight, screen, boss_cls, frames)
+        total = sum(counts.values())
+        print(f"{boss_cls.__name__:10s} {frames} frames  {elapsed*1000/frames:6.3f} ms/frame  "
+              f"transforms during draw: {total} {counts or ''}")
+    print(f"sprite layer: {transform_stats['baked']} frames baked at load, "
+          f"{transform_stats['runtime']} transformed at runtime")
+
+if __name__ == "__main__":
+    main()
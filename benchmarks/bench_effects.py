@@ -0,0 +1,58 @@
+"""Count surfaces allocated while drawing a Papia combo.
+
+    python -m benchmarks.bench_effects [frames]
+
+Runs the second phase (meteor grid plus orb) and counts every
+pygame.Surface created inside boss.draw, along with the effect cache's
+hit/miss counters.
+"""
+import sys
+import pygame
+from benchmarks.common import init_display, scripted_keys, timed
+import effects
+from player import Player
+from bosses import PapiaBoss
+
+class counted_surfaces:
+    """Patch pygame.Surface so constructions are counted."""
+
+    def __enter__(self):
+        self.count = 0
+        self.original = pygame.Surface
+        bench = self
+        class Counted(self.original):
+            def __init__(self, *args, **kwargs):
+                bench.count += 1
+                super().__init__(*args, **kwargs)
+        pygame.Surface = Counted
+        return self
+
+    def __exit__(self, *exc):
+        pygame.Surface = self.original
+
+def run_combo(screen, frames):
+    player = Player()
+    boss = PapiaBoss()
+    boss.hp = boss.half_hp
+    dt = 1 / 60
+    with counted_surfaces() as allocs:
+        for f in range(frames):
+            player.update(dt, scripted_keys(f))
+            boss.update(dt, player)
+            player.hp = player.max_hp
+            screen.fill((0, 0, 0))
+            boss.draw(screen)
+    boss.cleanup()
+    return allocs.count
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    screen = init_display()
+    elapsed, allocs = timed(run_combo, screen, frames)
+    print(f"PapiaBoss combo {frames} frames  {elapsed*1000/frames:6.3f} ms/frame  "
+          f"surfaces allocated during draw: {allocs}")
+    print(f"effect cache: {len(effects._circles)} surfaces, "
+          f"{effects.stats['hits']} hits, {effects.stats['misses']} misses")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Fight rendering at full resolution vs a low-res render target.
+
+    python -m benchmarks.bench_lowres [frames]
+
+Each RENDER_SCALE runs in its own process (the setting is read at import).
+Reports time per frame for drawing the world, and the fill rate: pixels
+written by the background, sprite and effect blits plus the final upscale.
+"""
+import subprocess, sys, time
+
+def run(scale, frames):
+    import settings
+    settings.RENDER_SCALE = scale
+    settings.VIEW_W, settings.VIEW_H = settings.WIDTH // scale, settings.HEIGHT // scale
+    import pygame
+    from benchmarks.common import init_display, scripted_keys
+    from settings import load_img, WIDTH, HEIGHT, VIEW_W, VIEW_H, BLACK, to_view
+    from player import Player
+    from bosses import PapiaBoss, HarusBoss
+
+    screen = init_display()
+    world = screen if scale == 1 else pygame.Surface((VIEW_W, VIEW_H)).convert()
+    bg = load_img("assets/story/bg1.png", (VIEW_W, VIEW_H))
+    for boss_cls in (PapiaBoss, HarusBoss):
+        player, boss = Player(), boss_cls()
+        dt = 1 / 60
+        pixels = 0
+        start = time.perf_counter()
+        for f in range(frames):
+            player.update(dt, scripted_keys(f))
+            boss.update(dt, player)
+            player.hp = player.max_hp
+            world.blit(bg, to_view(0, 0))
+            drawn = boss.draw(world) + player.draw(world)
+            pixels += VIEW_W * VIEW_H + sum(r.w * r.h for r in drawn if r)
+            if world is not screen:
+                pygame.transform.scale(world, (WIDTH, HEIGHT), screen)
+                pixels += WIDTH * HEIGHT
+        elapsed = time.perf_counter() - start
+        boss.cleanup()
+        print(f"scale {scale}  {boss_cls.__name__:10s} {VIEW_W}x{VIEW_H}  {elapsed*1000/frames:6.3f} ms/frame  "
+              f"fill {pixels/frames/1e6:5.2f} Mpx/frame")
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] == "--scale":
+        run(int(sys.argv[2]), int(sys.argv[3]))
+        return
+    frames = sys.argv[1] if len(sys.argv) > 1 else "1200"
+    for scale in (1, 2):
+        subprocess.run([sys.executable, "-m", "benchmarks.bench_lowres", "--scale", str(scale), frames], check=True)
+
+if __name__ == "__main__":
+    main()
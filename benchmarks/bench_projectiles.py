@@ -0,0 +1,51 @@
+"""Projectile engine cost per tick as the number of projectiles grows.
+
+    python -m benchmarks.bench_projectiles [ticks]
+
+Keeps 8 to 2000 meteors, orbs and shockwaves in flight (respawning whatever
+dies) and times update() plus adding their colliders to a collision world
+and colliding them with the player, the work a boss fight does with them at
+SIM_HZ.
+"""
+import random, sys, time
+import pygame
+import benchmarks.common  # repo root and dummy SDL drivers; no display is opened
+from collision import Box, Circle, CollisionWorld
+from projectiles import Projectiles
+from sim import RULES
+from settings import WIDTH, GROUND_Y, SIM_HZ
+
+def populate(proj, rng, count):
+    while proj.n < count:
+        kind = rng.random()
+        if kind < 0.5: proj.add_meteor(rng.uniform(0, WIDTH), delay=rng.uniform(0, 1.0))
+        elif kind < 0.8: proj.add_orb(rng.uniform(0, WIDTH), rng.uniform(0, 300), 560.0, 1.7, windup=rng.uniform(0, 0.45))
+        else: proj.add_shockwave(rng.uniform(0, WIDTH), GROUND_Y, rng.choice((-1, 1)))
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    hurtbox = pygame.Rect(WIDTH // 2 - 20, GROUND_Y - 80, 40, 80)
+    target = (hurtbox.centerx, hurtbox.bottom)
+    world = CollisionWorld(RULES)
+    dt = 1.0 / SIM_HZ
+    for count in (8, 64, 256, 1000, 2000):
+        rng, proj = random.Random(1), Projectiles()
+        populate(proj, rng, count)
+        elapsed = hits = 0
+        for _ in range(ticks):
+            start = time.perf_counter()
+            proj.update(dt, target)
+            world.clear()
+            world.add("player", Box(hurtbox))
+            world.add("player_center", Circle(*hurtbox.center))
+            world.add("player_feet", Circle(*target))
+            proj.add_colliders(world)
+            hits += bool(world.collide())
+            elapsed += time.perf_counter() - start
+            populate(proj, rng, count)
+        per_tick = elapsed / ticks
+        print(f"{count:5d} projectiles  {per_tick * 1e6:7.1f} us/tick  {per_tick * 1e9 / count:7.1f} ns/projectile  "
+              f"({hits} ticks with a hit, capacity {proj.capacity})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Walk the story's scenes and report resident asset memory after each one.
+
+    python -m benchmarks.bench_scenes [budget_mb]
+"""
+import sys, time
+from benchmarks.common import init_display
+from settings import *
+from registry import registry
+from scenes import story_scenes
+from player import Player
+from bosses import PapiaBoss, HarusBoss
+
+FLOW = [STATE_MENU, STATE_CUTSCENE, STATE_DIALOGUE, STATE_GAME_PAPIA,
+        STATE_DIALOGUE, STATE_GAME_HARUS, STATE_ENDING, STATE_MENU]
+BOSSES = {STATE_GAME_PAPIA: PapiaBoss, STATE_GAME_HARUS: HarusBoss}
+
+def mib(n):
+    return f"{n / (1024 * 1024):6.1f} MiB"
+
+def main():
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else ASSET_BUDGET_MB
+    init_display()
+    registry.budget = int(budget * 1024 * 1024)
+    scene = story_scenes()
+
+    start = time.perf_counter()
+    scene.enter(STATE_MENU)
+    player = Player()
+    print(f"time to menu: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    peak = 0
+    boss = None
+    for state in FLOW:
+        if boss:
+            boss.cleanup()
+            boss = None
+        scene.enter(state)
+        if state in BOSSES:
+            boss = BOSSES[state]()
+        peak = max(peak, registry.resident_bytes)
+        live = sum(e.size for e in registry.entries.values() if e.refs > 0)
+        print(f"{state:12s} resident {mib(registry.resident_bytes)}  in use {mib(live)}")
+    print(f"peak resident {mib(peak)} with a {budget:.0f} MiB budget, "
+          f"{registry.evictions} evictions")
+    player.cleanup()
+
+if __name__ == "__main__":
+    main()
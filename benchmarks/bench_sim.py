@@ -0,0 +1,31 @@
+"""Headless fight simulation speed.
+
+    python -m benchmarks.bench_sim [fights]
+
+Runs whole fights through sim.simulate with no display and no mixer,
+against a bot that walks to the boss and attacks in range, and reports
+ticks per second and how much faster than real time that is.
+"""
+import sys, time
+import benchmarks.common  # repo root and dummy SDL drivers; no display is opened
+import sim
+from policies import chase
+from settings import SIM_HZ
+
+def main():
+    fights = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    sim.headless()
+    for name in sim.BOSSES:
+        ticks = 0
+        outcomes = {}
+        start = time.perf_counter()
+        for seed in range(fights):
+            state, _ = sim.simulate(name, chase, SIM_HZ * 600, seed=seed)
+            ticks += state["tick"]
+            outcomes[state["outcome"]] = outcomes.get(state["outcome"], 0) + 1
+        elapsed = time.perf_counter() - start
+        print(f"{name:6s} {fights} fights  {ticks:7d} ticks  {ticks/elapsed:8.0f} ticks/s  "
+              f"({ticks/elapsed/SIM_HZ:5.0f}x real time)  {outcomes}")
+
+if __name__ == "__main__":
+    main()
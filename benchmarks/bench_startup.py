@@ -0,0 +1,57 @@
+"""Compare asset load times from assets.pak and from loose PNG/WAV files.
+
+    python pak.py                       # build assets.pak first
+    python -m benchmarks.bench_startup [repeat]
+
+"cold" runs each mode in a fresh interpreter (the OS file cache is still
+warm; drop it by hand for a true cold disk). "warm" reloads in-process after
+clearing the asset registry.
+"""
+import subprocess, sys, time
+from benchmarks.common import init_display, ROOT
+import pak
+from registry import registry
+from settings import load_image, load_sound
+
+IMAGES = ["assets/story/wife.png", "assets/story/bg1.png", "assets/story/title.png",
+          "assets/story/marriage.png", "assets/story/hand1.png", "assets/story/hand2.png",
+          "assets/story/cave.png", "assets/story/end.png", "assets/baked/protag0.png", "assets/baked/effects0.png", "assets/baked/papia0.png", "assets/baked/harus0.png"]
+SOUNDS = ["assets/SFX/DASH.wav", "assets/SFX/SWORD SLASH.wav", "assets/SFX/SPELL ATTACK #1.wav",
+          "assets/SFX/AXE SWING.wav", "assets/SFX/MALE GRUNT.wav", "assets/SFX/BIG FOOTSTEPS(arush).wav"]
+
+def use_pak(enabled):
+    pak._default[:] = [pak.Pak(pak.PAK_PATH) if enabled else None]
+
+def load_all():
+    registry.clear()
+    start = time.perf_counter()
+    for path in IMAGES:
+        load_image(path)
+    for path in SOUNDS:
+        try:
+            load_sound(path)
+        except Exception:
+            pass
+    return time.perf_counter() - start
+
+def child(mode):
+    init_display()
+    use_pak(mode == "pak")
+    print(load_all())
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    init_display()
+    for mode in ("loose", "pak"):
+        out = subprocess.run([sys.executable, "-m", "benchmarks.bench_startup", "--child", mode],
+                             cwd=ROOT, capture_output=True, text=True).stdout.split()
+        cold = float(out[-1])
+        use_pak(mode == "pak")
+        warm = min(load_all() for _ in range(repeat))
+        print(f"{mode:5s} cold {cold*1000:7.1f} ms   warm {warm*1000:7.1f} ms")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--child":
+        child(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,42 @@
+"""Blit cost per surface format, and fight drawing with and without colorkeys.
+
+    python -m benchmarks.bench_surface_formats [frames]
+"""
+import sys
+from benchmarks.common import init_display, scripted_keys, timed
+import surfaces
+from registry import registry
+from settings import load_img, WIDTH, HEIGHT
+from player import Player
+from bosses import PapiaBoss, HarusBoss
+
+def draw_fight(screen, boss_cls, frames):
+    bg = load_img("assets/story/bg1.png", (WIDTH, HEIGHT))
+    player, boss = Player(), boss_cls()
+    dt = 1 / 60
+    for f in range(frames):
+        player.update(dt, scripted_keys(f))
+        boss.update(dt, player)
+        player.hp = player.max_hp
+        screen.blit(bg, (0, 0))
+        boss.draw(screen)
+        player.draw(screen)
+    boss.cleanup()
+    player.cleanup()
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    screen = init_display()
+    timings = surfaces.blit_timings(screen)
+    print("128px sprite blit: " + ", ".join(f"{k} {v:.1f} us" for k, v in timings.items()))
+    for use_colorkey in (False, True):
+        surfaces.use_colorkey = use_colorkey
+        for boss_cls in (PapiaBoss, HarusBoss):
+            registry.clear()
+            surfaces.formats.clear()
+            elapsed, _ = timed(draw_fight, screen, boss_cls, frames)
+            print(f"{'colorkey' if use_colorkey else 'alpha   '}  {boss_cls.__name__:10s} "
+                  f"{elapsed*1000/frames:6.3f} ms/frame   formats {surfaces.format_counts()}")
+
+if __name__ == "__main__":
+    main()
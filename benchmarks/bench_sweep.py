@@ -0,0 +1,29 @@
+"""How the balance sweep scales with worker processes.
+
+    python -m benchmarks.bench_sweep [fights]
+
+Plays the same Harus sweep (4 combinations) with 1, 2, 4, ... workers up to
+the core count and reports fights per second and the speedup over one.
+"""
+import os, sys, time
+import benchmarks.common  # repo root and dummy SDL drivers; no display is opened
+from sweep import run_sweep
+
+GRID = {"swing_telegraph_time": [0.5, 0.7], "swing_active_time": [0.3, 0.35]}
+
+def main():
+    fights = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    cores = os.cpu_count() or 1
+    counts = sorted({min(1 << i, cores) for i in range(cores.bit_length() + 1)})
+    base = None
+    for workers in counts:
+        start = time.perf_counter()
+        rows, ticks = run_sweep("harus", GRID, "dodge", fights, workers, batch=max(1, fights // (2 * workers)))
+        elapsed = time.perf_counter() - start
+        rate = len(rows) * fights / elapsed
+        base = base or rate
+        print(f"{workers:3d} workers  {rate:7.1f} fights/s  {ticks / elapsed:9.0f} ticks/s  "
+              f"speedup {rate / base:5.2f}x ({rate / base / workers:4.0%} of linear)")
+
+if __name__ == "__main__":
+    main()
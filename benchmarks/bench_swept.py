@@ -0,0 +1,46 @@
+"""Harus swing hits against the tick rate.
+
+    python -m benchmarks.bench_swept [step px]
+
+Holds the player still on the ground and in mid-air at every `step` px in
+front of and behind Harus, has him swing once, and counts the spots the
+swing (axe or shockwave) hits at 120 down to 15 ticks a second. With the
+tip swept along its arc every rate should hit the same spots; the time is
+what the fight steps cost at that rate.
+"""
+import sys, time
+import benchmarks.common  # repo root and dummy SDL drivers; no display is opened
+import sim
+from settings import GROUND_Y
+
+def swing_once(boss):
+    yield from boss.swing_attack()
+    yield from boss.recover(1.0)
+
+def swing_hits(x, y, hz):
+    fight = sim.new_fight("harus", seed=0)
+    player, boss = fight.player, fight.boss
+    player.place(x, y)
+    boss.facing = 1 if x > boss.pos.x else -1
+    boss.script = boss.scheduler.spawn(swing_once(boss))
+    dt, keys = 1.0 / hz, sim.Held()
+    hit = False
+    for _ in range(int(2.5 * hz)):
+        player.vel.y = -1300 * dt  # Cancels this tick's gravity: hang where placed
+        if any(name == "player_hit" for name, _ in fight.step(dt, keys)):
+            hit = True
+            break
+    fight.cleanup()
+    return hit
+
+def main():
+    step = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    sim.headless()
+    spots = [(x, y) for x in range(400, 1000, step) for y in (GROUND_Y, GROUND_Y - 120)]
+    for hz in (120, 60, 30, 20, 15):
+        start = time.perf_counter()
+        hits = sum(swing_hits(x, y, hz) for x, y in spots)
+        print(f"{hz:4d} Hz  {hits:4d} of {len(spots)} spots hit  ({time.perf_counter() - start:.1f}s)")
+
+if __name__ == "__main__":
+    main()
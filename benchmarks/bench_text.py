@@ -0,0 +1,34 @@
+"""Font rasterization on a steady dialogue screen, through the text cache.
+
+    python -m benchmarks.bench_text [frames]
+"""
+import sys
+from benchmarks.common import init_display, timed
+from story import DialogueSystem
+from textcache import text_cache
+
+def draw_frames(dialogue, screen, frames):
+    for f in range(frames):
+        # Move the cursor now and then, like a player deciding
+        if f % 30 == 0:
+            dialogue.selected_index = 1 - dialogue.selected_index
+        screen.fill((0, 0, 0))
+        dialogue.draw()
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+    screen = init_display()
+    dialogue = DialogueSystem(screen)
+    dialogue.start_dialogue("A Dark Cave...\nHARUS waits within.\nDo you wish to enter?", None)
+    text_cache.clear()
+    first, _ = timed(draw_frames, dialogue, screen, 1)
+    first_misses = text_cache.misses
+    elapsed, _ = timed(draw_frames, dialogue, screen, frames)
+    stats = text_cache.stats()
+    print(f"first frame {first*1000:6.3f} ms ({first_misses} renders)   "
+          f"steady {elapsed*1000/frames:6.3f} ms/frame "
+          f"({stats['misses'] - first_misses} renders over {frames} frames)")
+    print(f"text cache: {stats['entries']} entries, hit rate {stats['hit_rate']:.1%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Variable-dt updates vs fixed ticks over a frame-time trace with hitches.
+
+    python -m benchmarks.bench_timestep [seconds]
+
+The trace is ~60 fps with jitter and a 150 ms or 400 ms hitch every two
+seconds. "variable" feeds each frame time straight into update(), as the
+loop used to; "fixed" runs FixedTimestep ticks at SIM_HZ. Reports the
+longest single step, the furthest any meteor, orb or shockwave moved
+between two hit checks, and the game time lost to the catch-up clamp.
+"""
+import random, sys, time
+from benchmarks.common import init_display, scripted_keys
+from settings import SIM_HZ, MAX_CATCHUP_TICKS, MAX_FRAME_TIME
+from timestep import FixedTimestep
+from player import Player
+from bosses import PapiaBoss, HarusBoss
+
+def trace(seconds, seed=3):
+    rng = random.Random(seed)
+    frames, t = [], 0.0
+    while t < seconds:
+        ft = 1 / 60 + rng.uniform(-0.004, 0.004)
+        if int(t / 2) != int((t + ft) / 2): ft = rng.choice((0.15, 0.4))
+        frames.append(ft)
+        t += ft
+    return frames
+
+def furthest_move(boss):
+    p, n = boss.projectiles, boss.projectiles.n
+    if not n: return 0.0
+    return float((abs(p.x[:n] - p.prev_x[:n]) + abs(p.y[:n] - p.prev_y[:n])).max())
+
+def run(boss_cls, frames, fixed):
+    random.seed(1)
+    player, boss = Player(), boss_cls()
+    timestep = FixedTimestep(SIM_HZ, MAX_CATCHUP_TICKS, MAX_FRAME_TIME)
+    longest = moved = 0.0
+    ticks = 0
+    start = time.perf_counter()
+    for ft in frames:
+        steps = [timestep.step] * timestep.advance(ft) if fixed else [ft]
+        for dt in steps:
+            player.update(dt, scripted_keys(ticks))
+            boss.update(dt, player)
+            player.hp = player.max_hp
+            moved = max(moved, furthest_move(boss))
+            longest = max(longest, dt)
+            ticks += 1
+    elapsed = time.perf_counter() - start
+    boss.cleanup()
+    return longest, moved, timestep.skipped if fixed else 0.0, ticks, elapsed
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 30
+    init_display()
+    frames = trace(seconds)
+    for boss_cls in (PapiaBoss, HarusBoss):
+        for fixed in (False, True):
+            longest, moved, skipped, ticks, elapsed = run(boss_cls, frames, fixed)
+            print(f"{boss_cls.__name__:10s} {'fixed' if fixed else 'variable':8s} longest step {longest*1000:6.1f} ms  "
+                  f"max projectile move {moved:6.1f} px  skipped {skipped:5.2f} s  "
+                  f"{ticks:6d} updates  {elapsed*1000/seconds:5.2f} ms cpu / game s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compare blit cost of full and trimmed boss frames and report bytes saved.
+
+    python -m benchmarks.bench_trim [repeat]
+"""
+import sys
+from benchmarks.common import init_display, timed
+from sprites import load_sprites, trim_report, format_trim
+
+STRIPS = [
+    ("assets/papia/idle..png", 7, 1.5),
+    ("assets/papia/cast.png", 7, 1.5),
+    ("assets/harus/idle.png", 4, 2.0),
+    ("assets/harus/walk.png", 4, 2.0),
+    ("assets/harus/windup.png", 4, 2.0),
+    ("assets/harus/attack.png", 3, 2.0),
+    ("assets/harus/recover.png", 4, 2.0),
+    ("assets/harus/spin.png", 4, 2.0),
+]
+
+def blit_all(screen, strip, repeat):
+    for _ in range(repeat):
+        for i in range(len(strip)):
+            ox, oy = strip.offset(i)
+            screen.blit(strip.frame(i), (200 + ox, 20 + oy))
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    screen = init_display()
+    total_full = total_trim = 0.0
+    for path, count, scale in STRIPS:
+        full = load_sprites(path, count, 256, 256, scale=scale)
+        trimmed = load_sprites(path, count, 256, 256, scale=scale, trim=True)
+        t_full, _ = timed(blit_all, screen, full, repeat)
+        t_trim, _ = timed(blit_all, screen, trimmed, repeat)
+        total_full += t_full
+        total_trim += t_trim
+        per = repeat * count
+        print(f"{path:28s} full {t_full*1e6/per:7.1f} us/blit   trimmed {t_trim*1e6/per:7.1f} us/blit")
+    print(f"total blit time: full {total_full*1000:.1f} ms, trimmed {total_trim*1000:.1f} ms "
+          f"({100 * (1 - total_trim / total_full):.0f}% less)")
+    for name, full, trimmed in trim_report:
+        print(format_trim(name, full, trimmed))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Batched NumPy fights against the object simulation.
+
+    python -m benchmarks.bench_vecenv [seconds]
+
+Steps VecFightEnv with 1 to 4096 fights at once against a chase bot (walk up,
+attack in reach) and reports fight-steps per second, next to sim.simulate
+playing the same bot one fight at a time.
+"""
+import sys, time
+import numpy as np
+import benchmarks.common  # repo root and dummy SDL drivers; no display is opened
+import sim
+from policies import chase, REACH
+from vecenv import VecFightEnv, ATTACK, LEFT, RIGHT
+
+def vec_chase(env):
+    return np.where(np.abs(env.bx - env.px) < REACH, ATTACK, np.where(env.bx > env.px, RIGHT, LEFT))
+
+def main():
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 1.0
+    sim.headless()
+    for boss in sim.BOSSES:
+        ticks, start = 0, time.perf_counter()
+        while time.perf_counter() - start < seconds:
+            state, _ = sim.simulate(boss, chase, 600 * 120, seed=ticks)
+            ticks += state["tick"]
+        base = ticks / (time.perf_counter() - start)
+        print(f"{boss:6s} sim.simulate      {base:10.0f} steps/s")
+        for n in (1, 16, 256, 4096):
+            env = VecFightEnv(boss, n, seed=0)
+            steps, start = 0, time.perf_counter()
+            while time.perf_counter() - start < seconds:
+                env.step(vec_chase(env))
+                steps += 1
+            rate = steps * n / (time.perf_counter() - start)
+            print(f"{boss:6s} VecFightEnv {n:5d} {rate:10.0f} steps/s  {rate / base:7.1f}x")
+
+if __name__ == "__main__":
+    main()
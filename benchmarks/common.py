@@ -0,0 +1,42 @@
+import os, sys, time
+
+# Benchmarks run from the repo root without a real window or sound card
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.chdir(ROOT)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pygame
+from settings import WIDTH, HEIGHT
+
+def init_display(flags=0):
+    pygame.init()
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        pass
+    return pygame.display.set_mode((WIDTH, HEIGHT), flags)
+
+class Keys:
+    """Stand-in for pygame.key.get_pressed() driven by a set of held keys."""
+
+    def __init__(self, held=()):
+        self.held = set(held)
+
+    def __getitem__(self, key):
+        return key in self.held
+
+def scripted_keys(frame):
+    # Walk back and forth, jump and attack on a fixed rhythm
+    held = {pygame.K_d if (frame // 90) % 2 == 0 else pygame.K_a}
+    if frame % 40 == 0: held.add(pygame.K_w)
+    if frame % 25 == 0: held.add(pygame.K_j)
+    return Keys(held)
+
+def timed(fn, *args, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(*args)
+    return (time.perf_counter() - start) / repeat, result
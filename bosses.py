@@ -1,24 +1,67 @@
 import pygame, math, random
 from pygame.math import Vector2
 from settings import *
-
-def rect_point_distance(rect: pygame.Rect, point: Vector2) -> float:
-    dx = 0
-    if point.x < rect.left: dx = rect.left - point.x
-    elif point.x > rect.right: dx = point.x - rect.right
-    dy = 0
-    if point.y < rect.top: dy = rect.top - point.y
-    elif point.y > rect.bottom: dy = point.y - rect.bottom
-    return math.hypot(dx, dy)
+from animations import load_animation, animation_files
+from effects import blit_circle, warm_ring_pulse
+from canvas import draw_rect
+from projectiles import Projectiles, METEOR, ORB_WINDUP, SHOCKWAVE, WINDUP
+from collision import Box, ShapePool
+from scripts import Scheduler
+from registry import AssetScope
 
 def ease_out(t):
     return 1 - (1 - t) * (1 - t)
 
+SWING_SAMPLES = 128
+_swing_arcs = {}
+
+def swing_arc(start, target):
+    """The axe's (angle, cos, sin) at SWING_SAMPLES + 1 even steps in time
+    through an eased swing from `start` to `target` degrees."""
+    arc = _swing_arcs.get((start, target))
+    if arc is None:
+        arc = []
+        for i in range(SWING_SAMPLES + 1):
+            e = ease_out(i / SWING_SAMPLES)
+            angle = (1 - e) * start + e * target
+            arc.append((angle, math.cos(math.radians(angle)), math.sin(math.radians(angle))))
+        _swing_arcs[start, target] = arc
+    return arc
+
+def arc_at(arc, t):
+    """(angle, cos, sin) `t` (0 to 1) of the way through a swing_arc()."""
+    f = t * SWING_SAMPLES
+    i = min(int(f), SWING_SAMPLES - 1)
+    f -= i
+    (a0, c0, s0), (a1, c1, s1) = arc[i], arc[i + 1]
+    return a0 + (a1 - a0) * f, c0 + (c1 - c0) * f, s0 + (s1 - s0) * f
+
+def arc_path(arc, t0, t1):
+    """(cos, sin) along a swing_arc() from t0 to t1: both ends and every step
+    of the table in between."""
+    inner = range(int(t0 * SWING_SAMPLES) + 1, math.ceil(t1 * SWING_SAMPLES))
+    return [arc_at(arc, t0)[1:]] + [arc[i][1:] for i in inner] + [arc_at(arc, t1)[1:]]
+
 # ==========================================
 # PAPIA (Boss 1)
 # ==========================================
 class PapiaBoss:
-    def __init__(self):
+    # What load_assets reads, listed so the fight can be preloaded
+    ANIMATIONS = {"idle": "papia/idle", "cast": "papia/cast", "meteor": "effects/meteor"}
+    SOUNDS = {"whisper": "assets/SFX/PAPIA IDLE CARELESS WHISPERS.wav", "spell": "assets/SFX/SPELL ATTACK #1.wav"}
+    __slots__ = ("rng", "pos", "hp", "max_hp", "half_hp", "half_width", "hurt_height", "state", "facing",
+                 "next_action_cooldown", "projectiles", "grid_positions", "meteor_count", "meteor_delay_between",
+                 "current_parity", "orb_speed", "orb_life", "use_phase_combo", "combo_enabled",
+                 "is_casting", "shake_requested", "frame_index", "anim_timer",
+                 "assets", "anim_idle", "anim_cast", "meteor_frames", "sfx_whisper", "sfx_spell",
+                 "hurt_rect", "body", "scheduler", "script", "casting")
+
+    @classmethod
+    def asset_files(cls):
+        return animation_files(cls.ANIMATIONS.values()) + list(cls.SOUNDS.values())
+
+    def __init__(self, rng=None):
+        self.rng = rng or random  # Anything with random()/randint()/choice()/shuffle()
         self.pos = Vector2(700, GROUND_Y)
         self.hp = 25
         self.max_hp = 25
@@ -26,11 +69,16 @@ class PapiaBoss:
         
         self.half_width = 36
         self.hurt_height = 120
+        self.hurt_rect = pygame.Rect(0, 0, 0, 0)
+        self.body = Box(self.hurt_rect)
+        self.update_geometry()
         self.state = "idle"
         self.facing = -1
         self.next_action_cooldown = 0.8
-        self.meteors = []
-        self.orb = None
+        self.projectiles = Projectiles()  # Meteors and orbs
+        self.scheduler = Scheduler()
+        self.script = None  # The fight script, started on the first update
+        self.casting = None  # The cast animation's task
 
         self.grid_positions = list(range(80, WIDTH-80, 40)) 
         self.meteor_count = 6
@@ -43,87 +91,115 @@ class PapiaBoss:
         self.combo_enabled = False
 
         self.is_casting = False
-        self.cast_anim = 0.0
         
         self.shake_requested = 0
 
-        # Sprites
-        self.anim_idle = load_strip("assets/papia/idle..png", 7, 256, 256) 
-        self.anim_cast = load_strip("assets/papia/cast.png", 7, 256, 256)
         self.frame_index = 0
         self.anim_timer = 0
 
+        self.assets = AssetScope()
+        with self.assets:
+            self.load_assets()
+        self.warm_effects()
+
+        # Start whispering immediately
+        if self.sfx_whisper: self.sfx_whisper.play(-1)
+
+    def load_assets(self):
+        # Sprites
+        self.anim_idle = load_animation(self.ANIMATIONS["idle"])
+        self.anim_cast = load_animation(self.ANIMATIONS["cast"])
+        self.meteor_frames = load_animation(self.ANIMATIONS["meteor"])
+        self.projectiles.animate(METEOR, self.meteor_frames)
+
         # SFX
         try:
-            self.sfx_whisper = pygame.mixer.Sound("assets/SFX/PAPIA IDLE CARELESS WHISPERS.wav")
-            self.sfx_whisper.set_volume(0.1) 
-            self.sfx_spell = pygame.mixer.Sound("assets/SFX/SPELL ATTACK #1.wav")
-            self.sfx_spell.set_volume(0.1) 
-            
-            # Start whispering immediately
-            self.sfx_whisper.play(-1)
+            self.sfx_whisper = load_sound(self.SOUNDS["whisper"], 0.1)
+            self.sfx_spell = load_sound(self.SOUNDS["spell"], 0.1)
         except:
             self.sfx_whisper = None
             self.sfx_spell = None
 
+    def warm_effects(self):
+        # Every radius the telegraphs, impacts and orb rings pulse through, so
+        # the first combo doesn't render them mid-fight
+        warm_ring_pulse({view_len(12)}, (220,70,40), view_len(3))
+        warm_ring_pulse({view_len(r) for r in range(32, 37)}, (220,90,40), view_len(3))
+        warm_ring_pulse({view_len(r) for r in range(31, 68)}, (240,120,60))
+        warm_ring_pulse({view_len(r) for r in range(20, 31)}, (140,80,200), view_len(3))
+        warm_ring_pulse({view_len(40)}, (120,60,180))
+
     def hurtbox(self):
-        return pygame.Rect(self.pos.x-self.half_width, self.pos.y-self.hurt_height, self.half_width*2, self.hurt_height)
+        return self.hurt_rect
+
+    def update_geometry(self):
+        self.hurt_rect.update(self.pos.x-self.half_width, self.pos.y-self.hurt_height, self.half_width*2, self.hurt_height)
+
+    def add_colliders(self, world):
+        world.add("boss", self.body, self)
+        self.projectiles.add_colliders(world)
+
+    def on_struck(self):
+        """The player's swing landed; True if it parried an attack."""
+        return False
 
     def cleanup(self):
         if self.sfx_whisper:
             self.sfx_whisper.stop()
+        self.assets.release()
 
     def update(self, dt, player):
         self.shake_requested = 0
         self.facing = 1 if player.pos.x > self.pos.x else -1
         
         self.anim_timer += dt
-        if self.anim_timer > 0.15:
+        frames = self.anim_cast if self.is_casting else self.anim_idle
+        if self.anim_timer > frames.duration(self.frame_index):
             self.anim_timer = 0
-            frames = self.anim_cast if self.is_casting else self.anim_idle
             self.frame_index = (self.frame_index + 1) % len(frames)
 
         # Meteor + Shake
-        for m in self.meteors:
-            was_impact = m.impact
-            m.update(dt)
-            if not was_impact and m.impact:
-                self.shake_requested = 5
-
-        self.meteors = [m for m in self.meteors if not (m.impact and m.impact_timer <= 0)]
-        
-        if self.orb:
-            if not self.orb.update(dt): self.orb = None
-
-        if self.next_action_cooldown > 0: self.next_action_cooldown -= dt
-        if self.cast_anim > 0:
-            self.cast_anim -= dt
-            if self.cast_anim <= 0: self.is_casting = False
-
-        if self.use_phase_combo and not self.combo_enabled and self.hp <= self.half_hp:
-            self.combo_enabled = True
-
-        can_pick = (self.next_action_cooldown <= 0) and (len(self.meteors) == 0) and (self.orb is None) and (not self.is_casting)
-        
-        if self.state == "idle" and can_pick:
-            r = random.random()
+        if self.projectiles.update(dt, player.pos): self.shake_requested = 5
+
+        if self.script is None: self.script = self.scheduler.spawn(self.fight(player))
+        self.scheduler.update(dt)
+        self.update_geometry()
+
+    # --- Scripts (see scripts.py) ---
+    def fight(self, player):
+        """Spell after spell: each waits out the pause the last one set and
+        for its meteors and orb to be gone."""
+        while True:
+            yield self.next_action_cooldown
+            while self.projectiles.n or self.is_casting: yield
+            if self.use_phase_combo and self.hp <= self.half_hp: self.combo_enabled = True
+            r = self.rng.random()
             combo_chance = 0.38 if self.combo_enabled else 0.0
             if r < combo_chance: self.start_combo(player)
             else:
-                if random.random() < 0.65: self.start_meteor_shower(player)
+                if self.rng.random() < 0.65: self.start_meteor_shower(player)
                 else: self.start_single_orb(player)
 
-        if self.state != "idle" and not self.is_casting: self.state = "idle"
+    def cast(self, seconds):
+        """Play the cast animation from the start for `seconds`, cutting off
+        one already playing."""
+        if self.casting: self.scheduler.cancel(self.casting)
+        self.casting = self.scheduler.spawn(self.cast_animation(seconds))
+
+    def cast_animation(self, seconds):
+        self.is_casting = True
+        self.frame_index = 0
+        yield seconds
+        self.is_casting = False
+        self.state = "idle"
 
     def start_meteor_shower(self, player):
         if self.sfx_spell: self.sfx_spell.play()
         self.state = "casting_meteors"
-        self.is_casting = True
-        self.cast_anim = 0.9
-        self.next_action_cooldown = 1.0 + random.random()*0.6
-        self.frame_index = 0
+        self.cast(0.9)
+        self.next_action_cooldown = 1.0 + self.rng.random()*0.6
         
-        self.current_parity = random.choice([0,1])
+        self.current_parity = self.rng.choice([0,1])
         parity_positions = [ (i,x) for i,x in enumerate(self.grid_positions) if (i % 2) == self.current_parity ]
         base_x = int(player.pos.x)
         parity_positions.sort(key=lambda t: abs(t[1]-base_x))
@@ -138,258 +214,92 @@ class PapiaBoss:
                 temp_set.add(x)
         
         available = [x for i,x in parity_positions]
-        random.shuffle(available)
+        self.rng.shuffle(available)
         for x in available:
             if len(chosen) < self.meteor_count and x not in temp_set:
                 chosen.append(x)
                 
         for i,x in enumerate(chosen):
-            m = Meteor(x, delay=0.9 + i*self.meteor_delay_between)
-            self.meteors.append(m)
+            self.projectiles.add_meteor(x, delay=0.9 + i*self.meteor_delay_between)
 
     def start_single_orb(self, player, delayed=0.0):
         if self.sfx_spell and delayed == 0: self.sfx_spell.play()
         self.state = "casting_orb"
-        self.is_casting = True
-        self.cast_anim = 0.55 + delayed
-        self.next_action_cooldown = 1.0 + random.random()*0.5 + delayed
-        self.frame_index = 0
+        self.cast(0.55 + delayed)
+        self.next_action_cooldown = 1.0 + self.rng.random()*0.5 + delayed
         
-        spawn_x = self.pos.x + random.randint(-40, 40)
-        spawn_y = self.pos.y - 120 + random.randint(-10,10)
-        orb = LargeOrb(Vector2(spawn_x, spawn_y), player, speed=self.orb_speed, life=self.orb_life)
-        orb.windup += delayed
-        self.orb = orb
+        spawn_x = self.pos.x + self.rng.randint(-40, 40)
+        spawn_y = self.pos.y - 120 + self.rng.randint(-10,10)
+        self.projectiles.add_orb(spawn_x, spawn_y, self.orb_speed, self.orb_life, windup=ORB_WINDUP + delayed)
 
     def start_combo(self, player):
         self.state = "casting_combo"
-        self.is_casting = True
-        self.cast_anim = 1.1
-        self.next_action_cooldown = 1.6 + random.random()*0.6
-        self.frame_index = 0
+        self.cast(1.1)
+        self.next_action_cooldown = 1.6 + self.rng.random()*0.6
         self.start_meteor_shower(player)
         self.start_single_orb(player, delayed=0.45)
 
-    def draw(self, screen, offset=(0,0)):
+    def draw(self, screen, offset=(0,0), alpha=1.0):
+        drawn = []
         frames = self.anim_cast if self.is_casting else self.anim_idle
         if frames:
-            img = frames[self.frame_index % len(frames)]
-            SCALE = 1.5
-            if self.facing == -1: img = pygame.transform.flip(img, True, False)
-            img = pygame.transform.scale(img, (int(img.get_width()*SCALE), int(img.get_height()*SCALE)))
-            draw_x = self.pos.x - img.get_width() // 2 + offset[0]
-            draw_y = self.pos.y - img.get_height() + offset[1]
-            screen.blit(img, (draw_x, draw_y))
+            # Frames are trimmed: place the full frame, then step in to the opaque part
+            img = frames.frame(self.frame_index, self.facing)
+            ox, oy = frames.offset(self.frame_index, self.facing)
+            x, y = to_view(self.pos.x + offset[0], self.pos.y + offset[1])
+            draw_x = x - frames.width // 2 + ox
+            draw_y = y - frames.height + oy
+            drawn.append(screen.blit(img, (draw_x, draw_y)))
         
-        for m in self.meteors: m.draw(screen, offset)
-        if self.orb: self.orb.draw(screen, offset)
+        drawn += self.projectiles.draw(screen, offset, alpha)
         
-        if any((not m.active and not m.impact) for m in self.meteors):
+        if self.projectiles.count(METEOR, WINDUP):
             for i, x in enumerate(self.grid_positions):
                 if (i % 2) == self.current_parity:
-                    surf = pygame.Surface((30,30), pygame.SRCALPHA)
                     a = int(120 + 120 * (0.5 + 0.5*math.sin(pygame.time.get_ticks()/180 + i)))
-                    pygame.draw.circle(surf, (220,70,40,a), (15,15), 12, 3)
-                    screen.blit(surf, (x-15 + offset[0], GROUND_Y-15 + offset[1]))
-
-class Meteor:
-    def __init__(self, x, delay=1.1):
-        self.x = x
-        self.y = -80
-        self.target_y = GROUND_Y - 6
-        self.radius = 26
-        self.windup = delay
-        self.fall_speed = 700.0
-        self.active = False
-        self.impact = False
-        self.impact_timer = 0.0
-        
-        # ANIMATION VARIABLES
-        self.frames = load_strip("assets/effects/meteor.png", 4, 128, 128)
-        self.frame_index = 0.0
-        self.anim_speed = 12.0 # Speed of animation
-
-    def update(self, dt):
-        if self.impact:
-            self.impact_timer -= dt
-            return self.impact_timer > 0
-        
-        if self.windup > 0:
-            self.windup -= dt
-            if self.windup <= 0: self.active = True
-            return True
-            
-        if self.active:
-            # Animate while falling
-            self.frame_index += self.anim_speed * dt
-            
-            self.y += self.fall_speed * dt
-            if self.y >= self.target_y:
-                self.y = self.target_y
-                self.impact = True
-                self.impact_timer = 0.30
-                self.active = False
-            return True
-        return True
-
-    def hits_player(self, player):
-        # 1. Check Impact (Explosion on ground)
-        if self.impact:
-            center = Vector2(player.hurtbox().centerx, player.hurtbox().centery)
-            d = math.hypot(center.x - self.x, center.y - GROUND_Y)
-            return d <= (self.radius + 20)
-        
-        # 2. Check Air Collision (Falling)
-        if self.active:
-            tip = Vector2(self.x, self.y)
-            d = rect_point_distance(player.hurtbox(), tip)
-            return d <= 30 # Slightly larger for sprite
-        return False
-
-    def draw(self, screen, offset=(0,0)):
-        x_draw = int(self.x + offset[0])
-        y_draw_g = int(GROUND_Y + offset[1])
-        y_draw_cur = int(self.y + offset[1])
-
-        # 1. Telegraph (Shadow/Indicator on ground)
-        if not self.active and not self.impact:
-            t = max(0.0, min(1.0, 1.0 - self.windup / 1.0))
-            r = int(self.radius + 10 * (0.8 + 0.2 * math.sin(pygame.time.get_ticks()/150)))
-            surf = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
-            alpha = int(100 + 120 * t)
-            pygame.draw.circle(surf, (220,90,40, alpha), (r, r), r, 3)
-            screen.blit(surf, (x_draw - r, y_draw_g - r))
-
-        # 2. Falling Meteor (New Sprite)
-        if self.active:
-            if self.frames:
-                # Get current frame
-                frame = self.frames[int(self.frame_index) % len(self.frames)]
-                
-                # Optional: Rotate frame to face down if needed (or random rotation)
-                # frame = pygame.transform.rotate(frame, -90) 
-                
-                # Scale if 64x64 is too small/big
-                SCALE = 1.5 
-                frame = pygame.transform.scale(frame, (int(64*SCALE), int(64*SCALE)))
-                
-                # Center sprite on x,y
-                draw_x = x_draw - frame.get_width() // 2
-                draw_y = y_draw_cur - frame.get_height() // 2
-                screen.blit(frame, (draw_x, draw_y))
-            else:
-                # Fallback if image fails to load
-                pygame.draw.circle(screen, ORANGE, (x_draw, y_draw_cur), 12)
-
-        # 3. Impact (Explosion)
-        if self.impact:
-            # You can also use the sprite here if you want it to "poof"
-            # For now, keeping the shape-based explosion or use a single frame
-            t = max(0.0, min(1.0, self.impact_timer / 0.30))
-            r = int(self.radius * (1.2 + 1.4 * (1-t)))
-            surf = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
-            a = int(180 * t)
-            pygame.draw.circle(surf, (240,120,60,a), (r,r), r)
-            screen.blit(surf, (x_draw - r, y_draw_g - r))
-
-class LargeOrb:
-    def __init__(self, pos, target_player, speed=520.0, life=2.0):
-        self.pos = Vector2(pos)
-        self.target_player = target_player
-        self.speed = speed
-        self.life = life
-        self.radius = 20
-        self.windup = 0.45
-        self.launched = False
-        self.vel = Vector2(0,0)
-        self.color = PURPLE
-
-    def update(self, dt):
-        if self.windup > 0:
-            self.windup -= dt
-            if self.windup <= 0:
-                dir = (self.target_player.pos - self.pos)
-                if dir.length() == 0: dir = Vector2(1,0)
-                self.vel = dir.normalize() * self.speed
-                self.launched = True
-            return True
-        if self.life <= 0: return False
-        if self.launched:
-            to_player = (self.target_player.pos - self.pos)
-            if to_player.length() > 0.1:
-                desired = to_player.normalize() * self.speed
-                self.vel = self.vel.lerp(desired, min(1.0, 2.0 * dt))
-            self.pos += self.vel * dt
-            self.pos.x = max(0, min(WIDTH, self.pos.x))
-            self.pos.y = max(-200, min(HEIGHT+200, self.pos.y))
-            self.life -= dt
-        return True
-
-    def draw(self, screen, offset=(0,0)):
-        x_draw = int(self.pos.x + offset[0])
-        y_draw = int(self.pos.y + offset[1])
-
-        if self.windup > 0:
-            t = max(0.0, min(1.0, 1.0 - self.windup / 0.45))
-            r = int(self.radius + 10 * (1.0 - t))
-            s = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
-            pygame.draw.circle(s, (140,80,200, int(130*t)), (r,r), r, 3)
-            screen.blit(s, (x_draw-r, y_draw-r))
-        pygame.draw.circle(screen, self.color, (x_draw, y_draw), self.radius)
-        g = pygame.Surface((self.radius*4, self.radius*4), pygame.SRCALPHA)
-        pygame.draw.circle(g, (120,60,180,60), (self.radius*2, self.radius*2), self.radius*2)
-        screen.blit(g, (x_draw - self.radius*2, y_draw - self.radius*2))
-
+                    center = to_view(x + offset[0], GROUND_Y + offset[1])
+                    drawn.append(blit_circle(screen, center, view_len(12), (220,70,40), a, view_len(3)))
+        return drawn
 
 # ==========================================
 # HARUS (Boss 2)
 # ==========================================
-class Shockwave:
-    def __init__(self, x, y, direction, frames):
-        self.rect = pygame.Rect(x, y-40, 80, 60)
-        self.speed = 380 * direction
-        self.active = True
-        self.frames = frames
-        self.frame_idx = 0.0
-        self.anim_speed = 10.0 
-        self.direction = direction
-
-    def update(self, dt):
-        self.rect.x += self.speed * dt
-        if self.rect.right < 0 or self.rect.left > WIDTH:
-            self.active = False
-        if self.frames:
-            self.frame_idx += self.anim_speed * dt
-            if self.frame_idx >= len(self.frames):
-                self.frame_idx = 0.0
-
-    def draw(self, screen, offset=(0,0)):
-        if self.frames:
-            frame = self.frames[int(self.frame_idx) % len(self.frames)]
-            if self.direction == -1:
-                frame = pygame.transform.flip(frame, True, False)
-            SCALE = 0.8
-            frame = pygame.transform.scale(frame, (int(frame.get_width()*SCALE), int(frame.get_height()*SCALE)))
-            dx = self.rect.centerx - frame.get_width() // 2 + offset[0]
-            dy = self.rect.bottom - frame.get_height() + offset[1]
-            screen.blit(frame, (dx, dy))
-        else:
-            r = self.rect.copy()
-            r.x += offset[0]
-            r.y += offset[1]
-            pygame.draw.rect(screen, RED, r, 2)
-
-
 class HarusBoss:
-    def __init__(self):
+    # What load_assets reads, listed so the fight can be preloaded
+    ANIMATIONS = {state: f"harus/{state}" for state in ("idle", "walk", "windup", "attack", "recover", "spin")}
+    ANIMATIONS["shockwave"] = "effects/shockwave"
+    SOUNDS = {"swing": "assets/SFX/AXE SWING.wav", "grunt": "assets/SFX/MALE GRUNT.wav", "step": "assets/SFX/BIG FOOTSTEPS(arush).wav"}
+    __slots__ = ("rng", "pos", "prev_pos", "hp", "max_hp", "state", "facing", "half_width",
+                 "attack_hitbox", "parry_window", "attack_active", "was_parried", "rotation", "attack_type",
+                 "stunned_timer", "projectiles", "attack_facing",
+                 "swing_reach", "swing_tip_radius", "swing_telegraph_time", "swing_active_time",
+                 "spin_telegraph_time", "spin_active_time", "swing_start_angle", "swing_target_angle",
+                 "_shockwave_spawned", "prev_tip_y", "next_action_cooldown", "shake_requested",
+                 "anim_state", "anim_frame", "anim_timer", "assets", "is_walking_sfx",
+                 "animations", "shockwave_frames", "sfx_swing", "sfx_grunt", "sfx_step",
+                 "swing_arc", "swing_t", "swing_dir", "last_swing_t", "hurt_rect", "spin_rect", "body", "spin", "tips",
+                 "scheduler", "script")
+
+    @classmethod
+    def asset_files(cls):
+        return animation_files(cls.ANIMATIONS.values()) + list(cls.SOUNDS.values())
+
+    def __init__(self, rng=None):
+        self.rng = rng or random
         self.pos = Vector2(700, GROUND_Y)
+        self.prev_pos = Vector2(self.pos)
         self.hp = 45
         self.max_hp = 45
         self.state = "idle"
-        self.timer = 0
         self.facing = -1
         
         self.half_width = 70
+        self.hurt_rect = pygame.Rect(0, 0, 0, 0)
+        self.spin_rect = pygame.Rect(0, 0, 0, 0)
+        self.body = Box(self.hurt_rect)
+        self.spin = Box(self.spin_rect)
+        self.tips = ShapePool()
+        self.update_geometry()
         self.attack_hitbox = None
         self.parry_window = False
         self.attack_active = False
@@ -397,85 +307,126 @@ class HarusBoss:
         
         self.rotation = 0
         self.attack_type = None
+        self.swing_arc = None  # Precomputed path of the current swing, see swing_arc()
+        self.swing_t = 0.0  # How far through it, 0 to 1
+        self.swing_dir = (1.0, 0.0)  # cos, sin of rotation while swinging
+        self.last_swing_t = None  # swing_t when the tip last hit, the tick before
         self.stunned_timer = 0
-        self.shockwaves = []
+        self.projectiles = Projectiles()  # Shockwaves
+        self.scheduler = Scheduler()
+        self.script = None  # The fight script, started on the first update
         self.attack_facing = self.facing
         
         self.swing_reach = 160
         self.swing_tip_radius = 28
         self.swing_telegraph_time = 0.7
         self.swing_active_time = 0.35 
+        self.spin_telegraph_time = 0.8
+        self.spin_active_time = 0.75
         self._shockwave_spawned = False
         self.prev_tip_y = None
         
         self.next_action_cooldown = 0.0
         self.shake_requested = 0
 
-        self.animations = {
-            "idle": load_strip("assets/harus/idle.png", 4, 256, 256),
-            "walk": load_strip("assets/harus/walk.png", 4, 256, 256),
-            "windup": load_strip("assets/harus/windup.png", 4, 256, 256),
-            "attack": load_strip("assets/harus/attack.png", 3, 256, 256),
-            "recover": load_strip("assets/harus/recover.png", 4, 256, 256),
-            "spin": load_strip("assets/harus/spin.png", 4, 256, 256),
-        }
         self.anim_state = "idle"
         self.anim_frame = 0
         self.anim_timer = 0.0
-        self.anim_speed = {"idle": 0.25, "walk": 0.15, "windup": 0.12, "attack": 0.10, "recover": 0.18, "spin": 0.10}
 
-        self.shockwave_frames = load_strip("assets/effects/shockwave.png", 3, 256, 256)
+        self.assets = AssetScope()
+        with self.assets:
+            self.load_assets()
+        
+        self.is_walking_sfx = False
+
+    def load_assets(self):
+        self.animations = {state: load_animation(name) for state, name in self.ANIMATIONS.items()
+                           if state != "shockwave"}
 
-        self.meteor_frames = load_strip("assets/effects/meteor.png", 4, 64, 64)
+        self.shockwave_frames = load_animation(self.ANIMATIONS["shockwave"])
+        self.projectiles.animate(SHOCKWAVE, self.shockwave_frames)
 
         # SFX
         try:
-            self.sfx_swing = pygame.mixer.Sound("assets/SFX/AXE SWING.wav")
-            self.sfx_grunt = pygame.mixer.Sound("assets/SFX/MALE GRUNT.wav")
-            self.sfx_step = pygame.mixer.Sound("assets/SFX/BIG FOOTSTEPS(arush).wav")
-            self.sfx_step.set_volume(0.6)
+            self.sfx_swing = load_sound(self.SOUNDS["swing"])
+            self.sfx_grunt = load_sound(self.SOUNDS["grunt"])
+            self.sfx_step = load_sound(self.SOUNDS["step"], 0.6)
         except:
             self.sfx_swing = None
             self.sfx_grunt = None
             self.sfx_step = None
-        
-        self.is_walking_sfx = False
 
     def hurtbox(self):
-        return pygame.Rect(self.pos.x-self.half_width, self.pos.y-180, self.half_width*2, 180)
+        return self.hurt_rect
+
+    def update_geometry(self):
+        self.hurt_rect.update(self.pos.x-self.half_width, self.pos.y-180, self.half_width*2, 180)
+
+    def add_colliders(self, world):
+        world.add("boss", self.body, self)
+        if self.attack_active and self.attack_hitbox: world.add("weapon", self.spin, self, "weapon")
+        swinging = self.attack_type == "swing" and self.attack_active
+        ended = self.state == "recovery" and self.last_swing_t is not None
+        if swinging or ended: self.add_swing(world)
+        self.last_swing_t = self.swing_t if swinging else None
+        self.projectiles.add_colliders(world)
+
+    def add_swing(self, world):
+        """The axe tip moves several times its radius per tick, so sweep it along
+        the arc since last tick (on the tick the swing ends, to its end), a
+        straight piece per step of the table."""
+        t0 = self.swing_t if self.last_swing_t is None else self.last_swing_t
+        path = arc_path(self.swing_arc, t0, self.swing_t)
+        center, reach, r = self.axe_center(), self.swing_reach, self.swing_tip_radius
+        self.tips.reset()
+        for (c0, s0), (c1, s1) in zip(path, path[1:]):
+            tip = self.tips.circle(center.x + c1*reach, center.y + s1*reach, r, center.x + c0*reach, center.y + s0*reach)
+            world.add("weapon", tip, self, "weapon")
+
+    def on_struck(self):
+        """The player's swing landed; True if it parried an attack."""
+        if not self.parry_window: return False
+        self.on_parried()
+        return True
 
     def cleanup(self):
         if self.sfx_step: self.sfx_step.stop()
+        self.assets.release()
 
     def axe_center(self) -> Vector2:
         return Vector2(self.pos.x, self.pos.y - 120)
 
     def axe_tip_pos(self) -> Vector2:
         center = self.axe_center()
-        rad = math.radians(self.rotation)
-        tip = Vector2(math.cos(rad)*self.swing_reach, math.sin(rad)*self.swing_reach)
-        return center + tip
+        if self.attack_type == "swing": cos, sin = self.swing_dir
+        else:
+            rad = math.radians(self.rotation)
+            cos, sin = math.cos(rad), math.sin(rad)
+        return center + Vector2(cos*self.swing_reach, sin*self.swing_reach)
+
+    def set_swing(self, t):
+        """Put the axe `t` (0 to 1) of the way through the swing, read off its arc."""
+        self.swing_t = t
+        self.rotation, cos, sin = arc_at(self.swing_arc, t)
+        self.swing_dir = (cos, sin)
 
     def update(self, dt, player):
+        self.prev_pos.update(self.pos)
         self.shake_requested = 0
-        dist = abs(player.pos.x - self.pos.x)
-        
-        if self.state == "idle":
-            self.facing = 1 if player.pos.x > self.pos.x else -1
-            
+        if self.script is None: self.script = self.scheduler.spawn(self.fight(player))
+
         if self.state == "stunned":
-            self.stunned_timer -= dt
-            if self.stunned_timer <= 0:
-                self.state = "recovery"
-                self.timer = 0.7
+            self.scheduler.update(dt)
+            self.update_geometry()
             return
 
-        if self.next_action_cooldown > 0:
-            self.next_action_cooldown -= dt
+        if self.state == "idle":
+            self.facing = 1 if player.pos.x > self.pos.x else -1
+        # Only an idle boss walks up; he decides from where he stood this tick
+        moving = (self.state == "idle" and abs(player.pos.x - self.pos.x) > 350)
+        self.scheduler.update(dt)
 
         # Walk Sound Logic
-        moving = (self.state == "idle" and dist > 350)
-        
         if moving:
             self.pos.x += (1 if player.pos.x > self.pos.x else -1) * 90 * dt
             if not self.is_walking_sfx and self.sfx_step:
@@ -486,90 +437,36 @@ class HarusBoss:
                 self.sfx_step.stop()
                 self.is_walking_sfx = False
 
-        # AI Logic
-        if self.state == "idle":
-            if dist <= 350:
-                if self.next_action_cooldown <= 0:
-                    r = random.random()
-                    if dist < 160:
-                        if r < 0.7: self.start_spin()
-                        else: self.start_swing()
-                    elif dist < 350:
-                        if r < 0.2: self.start_spin()
-                        else: self.start_swing()
-                    else:
-                        self.next_action_cooldown = 0.6
-
-        elif self.state == "telegraph":
-            self.timer -= dt
-            if self.attack_type == "swing":
-                self.rotation = self.swing_start_angle
-                self.parry_window = False
-                self.attack_active = False
-            else:
-                self.rotation += 120 * dt
-                self.parry_window = False
-                
-            if self.timer <= 0:
-                self.state = "parry"
-                self.timer = 0.12
-                self.parry_window = False
-                self.attack_facing = self.facing
-                self._shockwave_spawned = False
-                
-        elif self.state == "parry":
-            self.timer -= dt
-            if self.timer <= 0:
-                self.start_active()
-                
-        elif self.state == "active":
-            tip = self.axe_tip_pos()
-            
-            if self.attack_type == "swing":
-                if self.prev_tip_y is not None:
-                    crossed_ground = (self.prev_tip_y < GROUND_Y - 6 and tip.y >= GROUND_Y - 6)
-                    if crossed_ground and not self._shockwave_spawned:
-                        self.spawn_shockwave()
-                        self._shockwave_spawned = True
-                        self.shake_requested = 10 
-                self.prev_tip_y = tip.y
-                
-                total = self.swing_active_time
-                elapsed = total - self.timer
-                t = max(0.0, min(1.0, elapsed / total))
-                t_eased = ease_out(t)
-                self.rotation = (1 - t_eased) * self.swing_start_angle + t_eased * self.swing_target_angle
-                self.attack_active = True
-                
-            self.timer -= dt
-            if self.timer <= 0:
-                self.end_attack()
-                
-        elif self.state == "recovery":
-            self.timer -= dt
-            if self.timer <= 0:
-                self.state = "idle"
-                self.was_parried = False
-                self.parry_window = False
-                self.attack_hitbox = None
-                self.attack_active = False
-                self.next_action_cooldown = 0.4
-                
-        for s in self.shockwaves: s.update(dt)
-        self.shockwaves = [s for s in self.shockwaves if s.active]
+        self.projectiles.update(dt, player.pos)
         
+        self.update_geometry()
         self.update_animation(dt, player)
 
-    def start_swing(self):
+    # --- Scripts (see scripts.py) ---
+    def fight(self, player):
+        """From wherever he is: shake off a parry, then close in (update()
+        walks him), attack, recover, and again."""
+        if self.state == "stunned":
+            yield self.stunned_timer
+            yield from self.recover(0.7)
+        while True:
+            yield self.next_action_cooldown
+            while abs(player.pos.x - self.pos.x) > 350: yield
+            dist = abs(player.pos.x - self.pos.x)
+            r = self.rng.random()
+            if dist < 160: attack = self.spin_attack if r < 0.7 else self.swing_attack
+            elif dist < 350: attack = self.spin_attack if r < 0.2 else self.swing_attack
+            else:
+                self.next_action_cooldown = 0.6
+                continue
+            yield from attack()
+            yield from self.recover(1.0)
+
+    def swing_attack(self):
         if self.sfx_swing: self.sfx_swing.play()
         self.attack_facing = self.facing
         self.state = "telegraph"
         self.attack_type = "swing"
-        self.swing_telegraph_time = 0.7
-        self.swing_active_time = 0.35
-        self.timer = self.swing_telegraph_time
-        self.swing_reach = 160
-        self.swing_tip_radius = 28
         
         if self.attack_facing == 1:
             self.swing_start_angle = -200
@@ -578,46 +475,72 @@ class HarusBoss:
             self.swing_start_angle = 20
             self.swing_target_angle = -240
             
-        self.rotation = self.swing_start_angle
+        self.swing_arc = swing_arc(self.swing_start_angle, self.swing_target_angle)
+        self.set_swing(0.0)
         self.prev_tip_y = None
         self.was_parried = False
         self.parry_window = False
         self.attack_active = False
         self.attack_hitbox = None
         self._shockwave_spawned = False
+        yield from self.wind_up(self.swing_telegraph_time)
 
-    def start_spin(self):
+        total = timer = self.swing_active_time
+        while True:
+            dt = yield
+            tip = self.axe_tip_pos()
+            if self.prev_tip_y is not None:
+                crossed_ground = (self.prev_tip_y < GROUND_Y - 6 and tip.y >= GROUND_Y - 6)
+                if crossed_ground and not self._shockwave_spawned:
+                    self.spawn_shockwave()
+                    self._shockwave_spawned = True
+                    self.shake_requested = 10 
+            self.prev_tip_y = tip.y
+            self.set_swing(max(0.0, min(1.0, (total - timer) / total)))
+            timer -= dt
+            if timer <= 0: break
+        # The rest of the arc still sweeps this tick, however coarse the ticks
+        self.set_swing(1.0)
+
+    def spin_attack(self):
         if self.sfx_swing: self.sfx_swing.play()
         self.attack_facing = self.facing
         self.state = "telegraph"
         self.attack_type = "spin"
-        self.swing_telegraph_time = 0.8
-        self.sw_spin_active_time = 0.75
-        self.timer = self.swing_telegraph_time
         self.rotation = 0
         self.was_parried = False
         self.parry_window = False
         reach = 400
         height = 70
         x = self.pos.x - reach // 2
-        self.attack_hitbox = pygame.Rect(x, self.pos.y - 90, reach, height)
-
-    def start_active(self):
+        self.attack_hitbox = self.spin_rect
+        self.attack_hitbox.update(x, self.pos.y - 90, reach, height)
+        yield from self.wind_up(self.spin_telegraph_time)
+        yield self.spin_active_time
+
+    def wind_up(self, telegraph_time):
+        """Telegraph, hold for the parry cue, then the attack goes active:
+        parryable, and its hitbox live."""
+        yield telegraph_time
+        self.state = "parry"
+        self.parry_window = False
+        self.attack_facing = self.facing
+        self._shockwave_spawned = False
+        yield 0.12
         self.state = "active"
         if self.sfx_grunt: self.sfx_grunt.play()
-        
-        self.timer = self.swing_active_time if self.attack_type == "swing" else self.sw_spin_active_time
         self.attack_active = True
         self.parry_window = True
-        if self.attack_type == "swing":
-            self.rotation = self.swing_start_angle
 
-    def end_attack(self):
+    def recover(self, seconds):
         self.state = "recovery"
-        self.timer = 1.0
         self.attack_active = False
         self.attack_hitbox = None
         self.parry_window = False
+        yield seconds
+        self.state = "idle"
+        self.was_parried = False
+        self.next_action_cooldown = 0.4
 
     def on_parried(self):
         self.was_parried = True
@@ -627,9 +550,13 @@ class HarusBoss:
         self.attack_active = False
         self.parry_window = False
         self.pos.x -= self.attack_facing * 30
+        self.update_geometry()
+        # The attack is cut off; the next update starts the fight script over, stunned
+        self.scheduler.cancel(self.script)
+        self.script = None
 
     def spawn_shockwave(self):
-        self.shockwaves.append(Shockwave(self.pos.x+5 + self.attack_facing*120, self.pos.y, self.attack_facing, self.shockwave_frames))
+        self.projectiles.add_shockwave(self.pos.x+5 + self.attack_facing*120, self.pos.y, self.attack_facing)
 
     def update_animation(self, dt, player):
         if self.state == "telegraph": state = "windup"
@@ -643,7 +570,7 @@ class HarusBoss:
             self.anim_timer = 0.0
             
         self.anim_timer += dt
-        if self.anim_timer >= self.anim_speed[self.anim_state]:
+        if self.anim_timer >= self.animations[self.anim_state].duration(self.anim_frame):
             self.anim_timer = 0
             self.anim_frame += 1
             if self.anim_frame >= len(self.animations[self.anim_state]):
@@ -652,20 +579,20 @@ class HarusBoss:
                 else:
                     self.anim_frame = 0
 
-    def draw(self, screen, offset=(0,0)):
+    def draw(self, screen, offset=(0,0), alpha=1.0):
         frames = self.animations[self.anim_state]
+        pos = self.prev_pos.lerp(self.pos, alpha)
         if frames:
-            frame = frames[self.anim_frame % len(frames)]
-            if self.facing == -1: frame = pygame.transform.flip(frame, True, False)
-            BOSS_SCALE = 2.0
-            frame = pygame.transform.scale(frame, (int(frame.get_width() * BOSS_SCALE), int(frame.get_height() * BOSS_SCALE)))
-            draw_x = self.pos.x - frame.get_width() // 2 + offset[0]
-            draw_y = self.pos.y - frame.get_height() + offset[1]
-            screen.blit(frame, (draw_x, draw_y))
+            # Frames are trimmed: place the full frame, then step in to the opaque part
+            frame = frames.frame(self.anim_frame, self.facing)
+            ox, oy = frames.offset(self.anim_frame, self.facing)
+            x, y = to_view(pos.x + offset[0], pos.y + offset[1])
+            draw_x = x - frames.width // 2 + ox
+            draw_y = y - frames.height + oy
+            drawn = [screen.blit(frame, (draw_x, draw_y))]
         else:
-            r = self.hurtbox()
-            r.x += offset[0]
-            r.y += offset[1]
-            pygame.draw.rect(screen, RED, r)
+            r = view_rect(self.hurtbox().move(pos.x - self.pos.x + offset[0], pos.y - self.pos.y + offset[1]))
+            drawn = [draw_rect(screen, RED, r)]
 
-        for s in self.shockwaves: s.draw(screen, offset)
\ No newline at end of file
+        drawn += self.projectiles.draw(screen, offset, alpha)
+        return drawn
\ No newline at end of file
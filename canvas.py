@@ -0,0 +1,139 @@
+"""Draw targets for the two render backends.
+
+Game code draws with target.blit()/blits()/fill() and the draw_rect and
+draw_circle helpers below. With the default "surface" backend the target is
+the display Surface itself. With "sdl2" it is a TextureCanvas, which turns
+the same calls into pygame._sdl2.video Renderer draws.
+"""
+from contextlib import contextmanager
+import weakref
+import pygame
+from effects import circle_surface
+
+BLENDMODE_BLEND = 1  # SDL_BLENDMODE_BLEND
+
+def draw_rect(target, color, rect, width=0):
+    if isinstance(target, TextureCanvas):
+        return target.draw_rect(color, rect, width)
+    return pygame.draw.rect(target, color, rect, width)
+
+def draw_circle(target, color, center, radius, width=0):
+    if isinstance(target, TextureCanvas):
+        return target.draw_circle(color, center, radius, width)
+    return pygame.draw.circle(target, color, center, radius, width)
+
+class TextureCanvas:
+    """Stands in for the display surface on an SDL2 Renderer.
+
+    Each Surface is uploaded as a Texture the first time it is blitted and
+    kept until the Surface is garbage collected; subsurfaces (atlas frames)
+    draw a source rect of their parent's texture. Surface alpha set with
+    set_alpha is applied at draw time, as are the layer offset and scale, so
+    shake and upscaling cost nothing per sprite. Surfaces must not be drawn
+    on after their first blit.
+    """
+
+    def __init__(self, renderer, size):
+        from pygame._sdl2.video import Texture
+        self.Texture = Texture
+        self.renderer = renderer
+        self.size = size
+        self.offset = (0, 0)
+        self.textures = weakref.WeakKeyDictionary()
+        self.uploads = 0
+
+    def get_size(self):
+        return self.size
+
+    def get_rect(self, **kwargs):
+        rect = pygame.Rect((0, 0), self.size)
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def texture(self, surf):
+        """(texture, blend mode SDL picked for it) for a Surface, uploaded once."""
+        entry = self.textures.get(surf)
+        if entry is None:
+            tex = self.Texture.from_surface(self.renderer, surf)
+            entry = self.textures[surf] = (tex, tex.blend_mode)
+            self.uploads += 1
+        return entry
+
+    @contextmanager
+    def layer(self, offset=(0, 0), scale=1):
+        """Draw the block shifted by `offset` screen pixels and scaled up by
+        `scale`, clipped to the shifted screen like a world layer blit."""
+        view = pygame.Rect(offset, self.size).clip(pygame.Rect((0, 0), self.size))
+        self.renderer.set_viewport(view)
+        self.renderer.scale = (scale, scale)
+        self.offset = ((offset[0] - view.x) / scale, (offset[1] - view.y) / scale)
+        try:
+            yield self
+        finally:
+            self.offset = (0, 0)
+            self.renderer.scale = (1, 1)
+            self.renderer.set_viewport(None)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        parent = source.get_abs_parent()
+        ax, ay = source.get_abs_offset()
+        src = pygame.Rect(ax, ay, *source.get_size())
+        if area is not None:
+            area = pygame.Rect(area)
+            src = src.clip(area.move(ax, ay))
+        x, y = int(dest[0]), int(dest[1])
+        tex, mode = self.texture(parent)
+        alpha = 255 if source.get_alpha() is None else source.get_alpha()
+        tex.alpha = alpha
+        # Opaque textures only blend while faded; blending them costs a lot
+        # on the software renderer
+        tex.blend_mode = BLENDMODE_BLEND if alpha < 255 else mode
+        tex.draw(srcrect=src, dstrect=(x + self.offset[0], y + self.offset[1], src.w, src.h))
+        return pygame.Rect(x, y, src.w, src.h)
+
+    def blits(self, blit_sequence, doreturn=True):
+        rects = [self.blit(*item) for item in blit_sequence]
+        return rects if doreturn else None
+
+    def fill(self, color, rect=None, special_flags=0):
+        self.renderer.draw_color = pygame.Color(color)
+        if rect is None:
+            self.renderer.clear()
+            return pygame.Rect((0, 0), self.size)
+        return self.draw_rect(color, rect)
+
+    def draw_rect(self, color, rect, width=0):
+        rect = pygame.Rect(rect)
+        r = rect.move(self.offset)
+        self.renderer.draw_color = pygame.Color(color)
+        if width <= 0:
+            self.renderer.fill_rect(r)
+        else:
+            # Same as pygame.draw.rect: the border is drawn inside the rect
+            for edge in ((r.x, r.y, r.w, width), (r.x, r.bottom - width, r.w, width),
+                         (r.x, r.y, width, r.h), (r.right - width, r.y, width, r.h)):
+                self.renderer.fill_rect(edge)
+        return rect
+
+    def draw_circle(self, color, center, radius, width=0):
+        radius = int(radius)
+        surf = circle_surface(radius, tuple(color)[:3], width)
+        surf.set_alpha(color[3] if len(color) > 3 else 255)
+        return self.blit(surf, (center[0] - radius, center[1] - radius))
+
+    def present(self):
+        self.renderer.present()
+
+def open_texture_canvas(title, size, software=False):
+    """A window with an SDL2 Renderer (SDL's software renderer if asked, or
+    if no accelerated one works). A hidden 1x1 display mode is still set so
+    Surface.convert() has a pixel format to convert to."""
+    from pygame._sdl2.video import Window, Renderer
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    window = Window(title, size)
+    try:
+        renderer = Renderer(window, accelerated=0 if software else -1)
+    except pygame.error:
+        renderer = Renderer(window, accelerated=0)
+    return TextureCanvas(renderer, size)
@@ -0,0 +1,292 @@
+"""Hit detection: shapes on named layers, found through a spatial hash.
+
+Every tick the fight clears the world, each entity adds its colliders
+(a Box or Circle on a layer, with the owner and any data it wants back),
+and a fast mover's circle is swept over the path from where it was last
+tick, so a mover never steps over something between two ticks,
+and collide() returns one list of Hit(rule, attacker, target) for every
+overlapping pair the rules allow. A crowded target layer is bucketed into
+a uniform grid when a rule first needs it, so an attacker only meets the
+colliders in the cells its bounds cover; a layer of a few colliders, or one
+no attacker is looking at this tick, is never hashed. An owner that keeps
+its shapes in NumPy columns (projectiles) adds them as one batch of Boxes
+or Circles per layer instead: one array pass over their bounds finds the
+members near each collider on the other side of a rule, and only those get
+the exact test and become Colliders. Colliders are pooled: clear() hands
+them back for the next tick's add(), so a Hit is only good until then.
+"""
+import math
+from collections import namedtuple
+import numpy as np
+import pygame
+
+Hit = namedtuple("Hit", "rule attacker target")
+
+SCAN_LIMIT = 8  # target layers this small are checked pair by pair
+
+class Box:
+    """An axis-aligned box (a pygame.Rect)."""
+    __slots__ = ("rect",)
+
+    def __init__(self, rect):
+        self.rect = rect
+
+    def bounds(self):
+        r = self.rect
+        return r.left, r.top, r.right, r.bottom
+
+class Circle:
+    """A disc; with r=0 a single point. Given where it was last tick
+    (px, py), it covers every disc along the straight path from there."""
+    __slots__ = ("x", "y", "r", "px", "py")
+
+    def __init__(self, x, y, r=0, px=None, py=None):
+        self.move(x, y, r, px, py)
+
+    def move(self, x, y, r, px=None, py=None):
+        self.x, self.y, self.r = x, y, r
+        self.px = x if px is None else px
+        self.py = y if py is None else py
+        return self
+
+    def bounds(self):
+        r = self.r
+        return min(self.x, self.px) - r, min(self.y, self.py) - r, max(self.x, self.px) + r, max(self.y, self.py) + r
+
+class ShapePool:
+    """Boxes and circles handed out again every tick, for an owner whose
+    number of colliders changes from tick to tick."""
+    __slots__ = ("boxes", "circles", "used_boxes", "used_circles")
+
+    def __init__(self):
+        self.boxes, self.circles = [], []
+        self.used_boxes = self.used_circles = 0
+
+    def reset(self):
+        self.used_boxes = self.used_circles = 0
+
+    def box(self, x, y, w, h):
+        if self.used_boxes == len(self.boxes): self.boxes.append(Box(pygame.Rect(0, 0, 0, 0)))
+        box = self.boxes[self.used_boxes]
+        self.used_boxes += 1
+        box.rect.update(x, y, w, h)
+        return box
+
+    def circle(self, x, y, r, px=None, py=None):
+        if self.used_circles == len(self.circles): self.circles.append(Circle(0, 0))
+        circle = self.circles[self.used_circles]
+        self.used_circles += 1
+        return circle.move(x, y, r, px, py)
+
+class Boxes:
+    """Many boxes as arrays of edges; any of them may be a plain number."""
+    __slots__ = ("left", "top", "right", "bottom")
+
+    def __init__(self, left, top, right, bottom):
+        self.left, self.top, self.right, self.bottom = left, top, right, bottom
+
+    def near(self, left, top, right, bottom):
+        """Which boxes reach into these bounds."""
+        return (self.left <= right) & (left <= self.right) & (self.top <= bottom) & (top <= self.bottom)
+
+    def shape(self, i, pool):
+        """Box i, from `pool`."""
+        l, t, r, b = (v[i] if isinstance(v, np.ndarray) else v for v in (self.left, self.top, self.right, self.bottom))
+        return pool.box(l, t, r - l, b - t)
+
+class Circles:
+    """Many (swept) circles as arrays, as Circle; any may be a plain number."""
+    __slots__ = ("x", "y", "r", "px", "py")
+
+    def __init__(self, x, y, r, px, py):
+        self.x, self.y, self.r, self.px, self.py = x, y, r, px, py
+
+    def near(self, left, top, right, bottom):
+        """Which circles' bounds reach into these bounds."""
+        r, x, y, px, py = self.r, self.x, self.y, self.px, self.py
+        # Passing the same array (or number) as x and px says it did not move
+        x0, x1 = (x, x) if px is x else (np.minimum(x, px), np.maximum(x, px))
+        y0, y1 = (y, y) if py is y else (np.minimum(y, py), np.maximum(y, py))
+        return (x0 <= right + r) & (left - r <= x1) & (y0 <= bottom + r) & (top - r <= y1)
+
+    def shape(self, i, pool):
+        """Circle i, from `pool`."""
+        return pool.circle(*(v[i] if isinstance(v, np.ndarray) else v for v in (self.x, self.y, self.r, self.px, self.py)))
+
+def rect_point_distance(rect, x, y):
+    dx = 0
+    if x < rect.left: dx = rect.left - x
+    elif x > rect.right: dx = x - rect.right
+    dy = 0
+    if y < rect.top: dy = rect.top - y
+    elif y > rect.bottom: dy = y - rect.bottom
+    return math.hypot(dx, dy)
+
+def segment_point_distance(x0, y0, x1, y1, x, y):
+    dx, dy = x1 - x0, y1 - y0
+    length2 = dx * dx + dy * dy
+    t = 0.0 if length2 == 0 else max(0.0, min(1.0, ((x - x0) * dx + (y - y0) * dy) / length2))
+    return math.hypot(x - x0 - t * dx, y - y0 - t * dy)
+
+def segment_enters_rect(rect, x0, y0, x1, y1):
+    """Does the segment touch the rect (edges included)? Liang-Barsky clipping."""
+    t0, t1 = 0.0, 1.0
+    dx, dy = x1 - x0, y1 - y0
+    for p, q in ((-dx, x0 - rect.left), (dx, rect.right - x0), (-dy, y0 - rect.top), (dy, rect.bottom - y0)):
+        if p == 0:
+            if q < 0: return False
+            continue
+        t = q / p
+        if p < 0: t0 = max(t0, t)
+        else: t1 = min(t1, t)
+        if t0 > t1: return False
+    return True
+
+def segment_rect_distance(rect, x0, y0, x1, y1):
+    """How close the segment comes to the rect; 0 if it touches it."""
+    if x0 == x1 and y0 == y1: return rect_point_distance(rect, x0, y0)
+    if segment_enters_rect(rect, x0, y0, x1, y1): return 0.0
+    # Apart, the nearest points are an end of the segment or a corner of the rect
+    l, t, r, b = rect.left, rect.top, rect.right, rect.bottom
+    return min(rect_point_distance(rect, x0, y0), rect_point_distance(rect, x1, y1),
+               *(segment_point_distance(x0, y0, x1, y1, cx, cy) for cx, cy in ((l, t), (r, t), (l, b), (r, b))))
+
+def overlaps(a, b):
+    """Boxes overlap as Rect.colliderect does; a circle touches a box within
+    its radius of the box's nearest point, and another circle within the sum.
+    A swept circle does if any disc on its path would."""
+    if type(a) is Box:
+        if type(b) is Box: return a.rect.colliderect(b.rect)
+        return segment_rect_distance(a.rect, b.px, b.py, b.x, b.y) <= b.r
+    if type(b) is Box: return segment_rect_distance(b.rect, a.px, a.py, a.x, a.y) <= a.r
+    # Both swept: b holds still and a moves by the difference
+    ox, oy = b.px - b.x, b.py - b.y
+    return segment_point_distance(a.px - ox, a.py - oy, a.x, a.y, b.x, b.y) <= a.r + b.r
+
+class Collider:
+    """One shape on a layer. `key` names what it belongs to: hits on a key
+    that was used up earlier in the tick are skipped. `once` marks colliders
+    used up by their first hit."""
+    __slots__ = ("layer", "shape", "owner", "data", "once", "order")
+
+    def __init__(self, layer, shape, owner, data, once, order):
+        self.reset(layer, shape, owner, data, once, order)
+
+    def reset(self, layer, shape, owner, data, once, order):
+        self.layer, self.shape, self.owner, self.data, self.once, self.order = layer, shape, owner, data, once, order
+        return self
+
+    @property
+    def key(self):
+        return (self.owner, self.data)
+
+class CollisionWorld:
+    """`rules` is a list of (attacker layer, target layer, rule name); hits
+    come back in that order, then in the order colliders were added."""
+
+    def __init__(self, rules, cell=128):
+        self.rules = list(rules)
+        self.cell = cell
+        self.layers = {}
+        self.cells = {}
+        self.count = 0
+        self.free = []  # Colliders from earlier ticks, ready for reset()
+        self.batches = {}  # layer: [(Boxes or Circles, owner, data, once)]
+        self.members = []  # Colliders made for batch members that hit
+        self.shapes = ShapePool()  # and their shapes
+
+    def clear(self):
+        for colliders in self.layers.values():
+            self.free += colliders
+            colliders.clear()
+        self.free += self.members
+        self.members.clear()
+        self.shapes.reset()
+        self.batches.clear()
+        self.cells.clear()
+        self.count = 0
+
+    def add(self, layer, shape, owner=None, data=None, once=False):
+        if self.free: collider = self.free.pop().reset(layer, shape, owner, data, once, self.count)
+        else: collider = Collider(layer, shape, owner, data, once, self.count)
+        self.count += 1
+        self.layers.setdefault(layer, []).append(collider)
+        return collider
+
+    def add_batch(self, layer, shapes, owner, data, once=False):
+        """Many shapes on `layer`: `shapes` holds arrays and `data` each one's
+        data (ints, indexed like the arrays). Batches meet plain colliders;
+        two batches never meet each other."""
+        self.batches.setdefault(layer, []).append((shapes, owner, data, once))
+
+    def _batch_hits(self, layer, batch, shape, attacking):
+        """Colliders for the members of `batch` that touch `shape`: one array
+        test of their bounds, then overlaps() for the few that are near. A
+        batch this small costs less checked member by member."""
+        shapes, owner, data, once = batch
+        left, top, right, bottom = shape.bounds()
+        if len(data) <= SCAN_LIMIT: near = range(len(data))
+        else: near = shapes.near(left, top, right, bottom).nonzero()[0].tolist()
+        members = []
+        for i in near:
+            member = shapes.shape(i, self.shapes)
+            l, t, r, b = member.bounds()
+            if l > right or left > r or t > bottom or top > b: continue
+            if not (overlaps(member, shape) if attacking else overlaps(shape, member)): continue
+            if self.free: collider = self.free.pop().reset(layer, member, owner, int(data[i]), once, -1)
+            else: collider = Collider(layer, member, owner, int(data[i]), once, -1)
+            self.members.append(collider)
+            members.append(collider)
+        return members
+
+    def _span(self, bounds):
+        """The grid columns and rows a shape's bounds cover."""
+        size = self.cell
+        left, top, right, bottom = bounds
+        return range(int(left // size), int(right // size) + 1), range(int(top // size), int(bottom // size) + 1)
+
+    def _hash(self, layer, colliders):
+        cells = self.cells
+        for collider in colliders:
+            columns, rows = self._span(collider.shape.bounds())
+            for cx in columns:
+                for cy in rows:
+                    bucket = cells.get((layer, cx, cy))
+                    if bucket is None: cells[layer, cx, cy] = [collider]
+                    else: bucket.append(collider)
+
+    def collide(self):
+        hits = []
+        cells, hashed = self.cells, set()
+        for attacker_layer, target_layer, rule in self.rules:
+            attackers = self.layers.get(attacker_layer)
+            targets = self.layers.get(target_layer)
+            if targets:
+                for batch in self.batches.get(attacker_layer, ()):
+                    for target in targets:
+                        for member in self._batch_hits(attacker_layer, batch, target.shape, True):
+                            hits.append(Hit(rule, member, target))
+            if attackers:
+                for batch in self.batches.get(target_layer, ()):
+                    for attacker in attackers:
+                        for member in self._batch_hits(target_layer, batch, attacker.shape, False):
+                            hits.append(Hit(rule, attacker, member))
+            if not attackers or not targets: continue
+            if len(targets) <= SCAN_LIMIT:
+                for attacker in attackers:
+                    for target in targets:
+                        if overlaps(attacker.shape, target.shape): hits.append(Hit(rule, attacker, target))
+                continue
+            if target_layer not in hashed:
+                self._hash(target_layer, targets)
+                hashed.add(target_layer)
+            for attacker in attackers:
+                near = {}
+                columns, rows = self._span(attacker.shape.bounds())
+                for cx in columns:
+                    for cy in rows:
+                        for target in cells.get((target_layer, cx, cy), ()): near[target.order] = target
+                for order in sorted(near):
+                    if overlaps(attacker.shape, near[order].shape):
+                        hits.append(Hit(rule, attacker, near[order]))
+        return hits
@@ -0,0 +1,58 @@
+import pygame
+from settings import BLACK
+
+class DirtyRenderer:
+    """Pushes only the parts of the screen that changed.
+
+    Each frame, begin() restores the background on the world layer under
+    everything drawn the frame before; the caller then draws the world as
+    usual, copy()s the old and new rects to the screen, draws the HUD and
+    passes every rect its draw calls returned to present(), which updates
+    just those. A full frame (first frame, new background, screen shake, or
+    the frame after a shake) is drawn and flipped normally.
+    """
+
+    def __init__(self, screen, world):
+        self.screen = screen
+        self.world = world
+        self.background = None
+        self.backdrop = None
+        self.prev = []
+        self.full = True
+        self.full_frame = True
+
+    def invalidate(self):
+        self.full = True
+
+    def begin(self, background, shaking=False):
+        """Start a frame over `background`. Returns True if only the changed
+        rects need drawing, False if the caller must draw the whole frame."""
+        if background is not self.background:
+            self.background = background
+            # Composite once so restoring a rect is a single blit
+            self.backdrop = pygame.Surface(self.world.get_size()).convert()
+            self.backdrop.fill(BLACK)
+            self.backdrop.blit(background, (0, 0))
+            self.full = True
+        # A shaken frame leaves everything offset, so the next one is full too
+        self.full_frame = self.full or shaking
+        self.full = shaking
+        if self.full_frame: return False
+        for r in self.prev:
+            self.world.blit(self.backdrop, r, r)
+        return True
+
+    def copy(self, rects):
+        """Copy the world layer to the screen under last frame's and `rects`."""
+        bounds = self.screen.get_rect()
+        for r in self.prev + [bounds.clip(r) for r in rects if r]:
+            self.screen.blit(self.world, r, r)
+
+    def present(self, rects):
+        bounds = self.screen.get_rect()
+        rects = [bounds.clip(r) for r in rects if r]
+        if self.full_frame:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.prev + rects)
+        self.prev = rects
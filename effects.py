@@ -0,0 +1,35 @@
+import pygame
+
+# Pre-rendered circle/ring surfaces keyed by (radius, color, width). Alpha is
+# applied per blit with set_alpha, which blends exactly like drawing with an
+# RGBA color, so pulsing effects only ever touch the few radii they cycle
+# through. "misses" counts surfaces created; in a steady fight it stops
+# growing after the first cast of each attack.
+_circles = {}
+stats = {"hits": 0, "misses": 0}
+
+def circle_surface(radius, color, width=0):
+    key = (radius, color, width)
+    surf = _circles.get(key)
+    if surf is None:
+        stats["misses"] += 1
+        surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, color, (radius, radius), radius, width)
+        _circles[key] = surf
+    else:
+        stats["hits"] += 1
+    return surf
+
+def blit_circle(screen, center, radius, color, alpha=255, width=0):
+    """Blit a (ring if width > 0) circle centered at `center` with `alpha`.
+    Returns the covered rect (None if the radius is zero)."""
+    radius = int(radius)
+    if radius <= 0: return None
+    surf = circle_surface(radius, color, width)
+    surf.set_alpha(int(alpha))
+    return screen.blit(surf, (center[0] - radius, center[1] - radius))
+
+def warm_ring_pulse(radii, color, width=0):
+    """Render every frame of a pulsing ring ahead of the first cast."""
+    for r in radii:
+        circle_surface(int(r), color, width)
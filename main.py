@@ -1,15 +1,28 @@
-import pygame, sys, random
+import pygame, random
 from settings import *
 from player import Player
-from bosses import PapiaBoss, HarusBoss, rect_point_distance
+from bosses import PapiaBoss, HarusBoss
+from sim import Fight
 from story import CutsceneManager, DialogueSystem
-from pygame.math import Vector2
+from registry import registry
+from scenes import story_scenes
+from preload import preloader
+from dirty import DirtyRenderer
+from surfaces import tune_blits
+from timestep import FixedTimestep
+from canvas import draw_rect, open_texture_canvas
 
 pygame.init()
 pygame.mixer.init()
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Vanitas")
+textured = RENDER_BACKEND == "sdl2"
+if textured:
+    screen = open_texture_canvas("Vanitas", (WIDTH, HEIGHT))
+else:
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Vanitas")
+if TUNE_BLITS: tune_blits(screen)
 clock = pygame.time.Clock()
+timestep = FixedTimestep(SIM_HZ, MAX_CATCHUP_TICKS, MAX_FRAME_TIME)
 
 # --- MUSIC ---
 try:
@@ -29,46 +42,38 @@ except:
     font_big = pygame.font.SysFont("times new roman", 60, bold=True)
 
 # --- LOAD ASSETS ---
-def load_img(path, scale=None):
-    try:
-        img = pygame.image.load(path).convert_alpha()
-        if scale:
-            img = pygame.transform.scale(img, scale)
-        return img
-    except Exception as e:
-        print(f"Missing Asset: {path}")
-        s = pygame.Surface((scale if scale else (100,100)))
-        s.fill((50, 0, 0)) 
-        return s
-
-# UI Assets
-wife_portrait = load_img("assets/story/wife.png", (100, 100))
-
-# Game Assets
-img_bg_fight = load_img("assets/story/bg1.png", (WIDTH, HEIGHT))
-
-# Story Assets
-img_title = load_img("assets/story/title.png", (WIDTH, HEIGHT))
-img_marriage = load_img("assets/story/marriage.png")
-img_hand1 = load_img("assets/story/hand1.png")
-img_hand2 = load_img("assets/story/hand2.png")
-img_cave = load_img("assets/story/cave.png")
-img_end = load_img("assets/story/end.png")
+registry.budget = ASSET_BUDGET_MB * 1024 * 1024
+scene = story_scenes()
+
+def set_state(state):
+    global current_state
+    current_state = state
+    scene.enter(state)
 
 # --- GAME VARIABLES ---
-current_state = STATE_MENU
+set_state(STATE_MENU)
 player = Player()
 boss = None
+fight = None
 base_memory_opacity = 255 
 checkpoint_reached = False 
 
 # Story Systems
 cutscene_mgr = CutsceneManager(screen)
 dialogue_sys = DialogueSystem(screen)
-
-# Screen Shake
+# Fights are drawn to the world layer, then put on the screen in one blit
+# (or one upscale) with the shake offset; the HUD goes on top unshaken.
+# The sdl2 backend draws them straight to the screen with the offset and
+# scale applied by the renderer instead.
+world = pygame.Surface((VIEW_W, VIEW_H)).convert()
+upscaled = None if RENDER_SCALE == 1 else pygame.Surface((WIDTH, HEIGHT)).convert()
+renderer = DirtyRenderer(screen, world)
+
+# Screen Shake (its own generator, so how often frames are drawn never
+# changes what the game rolls)
 shake_timer = 0.0
 shake_intensity = 0.0
+shake_rng = random.Random()
 
 def start_shake(intensity, duration=0.2):
     global shake_timer, shake_intensity
@@ -76,23 +81,24 @@ def start_shake(intensity, duration=0.2):
     shake_intensity = intensity
 
 def draw_ui(screen, player, boss_name, boss_hp, boss_max):
+    drawn = []
     # Health Bar
-    pygame.draw.rect(screen, RED, (20, 20, player.hp * 20, 20))
-    pygame.draw.rect(screen, WHITE, (20, 20, player.max_hp * 20, 20), 2)
+    drawn.append(draw_rect(screen, RED, (20, 20, player.hp * 20, 20)))
+    drawn.append(draw_rect(screen, WHITE, (20, 20, player.max_hp * 20, 20), 2))
     
     # Boss Health Bar
     if boss_hp > 0:
         bar_w = 300
         ratio = boss_hp / boss_max
-        pygame.draw.rect(screen, PURPLE, (WIDTH - 320, 20, bar_w * ratio, 20))
-        pygame.draw.rect(screen, WHITE, (WIDTH - 320, 20, bar_w, 20), 2)
-        txt = font_ui.render(boss_name, True, WHITE)
-        screen.blit(txt, (WIDTH - 320, 45))
+        drawn.append(draw_rect(screen, PURPLE, (WIDTH - 320, 20, bar_w * ratio, 20)))
+        drawn.append(draw_rect(screen, WHITE, (WIDTH - 320, 20, bar_w, 20), 2))
+        txt = render_text(font_ui, boss_name, True, WHITE)
+        drawn.append(screen.blit(txt, (WIDTH - 320, 45)))
 
     # --- WIFE PORTRAIT LOGIC ---
     # Draw Frame
     frame_rect = pygame.Rect(18, 58, 104, 104)
-    pygame.draw.rect(screen, (220, 220, 220), frame_rect, 3)
+    drawn.append(draw_rect(screen, (220, 220, 220), frame_rect, 3))
     
     # Calculate Opacity
     current_alpha = base_memory_opacity
@@ -105,29 +111,51 @@ def draw_ui(screen, player, boss_name, boss_hp, boss_max):
     
     # Draw Photo
     if current_alpha > 0:
+        wife_portrait = scene["wife"]
         wife_portrait.set_alpha(current_alpha)
-        screen.blit(wife_portrait, (20, 60))
+        drawn.append(screen.blit(wife_portrait, (20, 60)))
+
+    # Debug readout: its few values repeat, so each line comes from the text cache
+    if DEBUG_HUD: drawn += draw_debug_hud(screen)
+    return drawn
+
+def draw_debug_hud(screen):
+    lines = [f"FPS: {clock.get_fps():.0f}", f"Player HP: {player.hp}  State: {player.attack_state}"]
+    if boss: lines.append(f"Boss HP: {boss.hp}  State: {boss.state}")
+    drawn = []
+    for i, line in enumerate(lines):
+        surf = render_text(font_ui, line, True, YELLOW)
+        drawn.append(screen.blit(surf, surf.get_rect(bottomleft=(20, HEIGHT - 20 - i * 22))))
+    return drawn
+
+def present_world(offset):
+    if RENDER_SCALE == 1:
+        screen.blit(world, offset)
+    elif offset == (0, 0):
+        pygame.transform.scale(world, (WIDTH, HEIGHT), screen)
+    else:
+        screen.blit(pygame.transform.scale(world, (WIDTH, HEIGHT), upscaled), offset)
 
 def draw_text_centered(text, y_offset=0, color=WHITE, font=font_big):
-    surf = font.render(text, True, color)
+    surf = render_text(font, text, True, color)
     rect = surf.get_rect(center=(WIDTH//2, HEIGHT//2 + y_offset))
     screen.blit(surf, rect)
 
 # --- STORY FLOW ---
 
 def start_intro_cutscene():
-    global current_state
-    current_state = STATE_CUTSCENE
+    set_state(STATE_CUTSCENE)
+    # Decode Papia's fight while the cutscene plays
+    preloader.preload(PapiaBoss.asset_files())
     cutscene_mgr.start_sequence([
-        {"image": img_marriage, "text": "She was my beloved", "duration": 3.0},
-        {"image": img_hand1, "text": "But they...", "duration": 2.0},
-        {"image": img_hand2, "text": "They took her from me", "duration": 2.5},
-        {"image": img_cave, "text": "I finally tracked them, I must take my revenge", "duration": 3.0},
+        {"image": scene["marriage"], "text": "She was my beloved", "duration": 3.0},
+        {"image": scene["hand1"], "text": "But they...", "duration": 2.0},
+        {"image": scene["hand2"], "text": "They took her from me", "duration": 2.5},
+        {"image": scene["cave_full"], "text": "I finally tracked them, I must take my revenge", "duration": 3.0},
     ])
 
 def finish_intro_cutscene():
-    global current_state
-    current_state = STATE_DIALOGUE
+    set_state(STATE_DIALOGUE)
     dialogue_sys.start_dialogue(
         "To enter, you must shed the weight of your past.\nForget your FIRST DATE to gain speed?    ", 
         unlock_dash_and_start,
@@ -135,16 +163,18 @@ def finish_intro_cutscene():
     )
 
 def unlock_dash_and_start():
-    global current_state, boss, base_memory_opacity
+    global boss, fight, base_memory_opacity
     player.can_dash = True
     base_memory_opacity = 190 
-    current_state = STATE_GAME_PAPIA
+    set_state(STATE_GAME_PAPIA)
     boss = PapiaBoss()
-    player.pos = Vector2(100, GROUND_Y)
+    player.place(100, GROUND_Y)
+    fight = Fight(player, boss)
 
 def start_transition_dialogue():
-    global current_state
-    current_state = STATE_DIALOGUE
+    set_state(STATE_DIALOGUE)
+    # Decode Harus' fight while the player reads
+    preloader.preload(HarusBoss.asset_files())
     dialogue_sys.start_dialogue(
         "Papia falls, but the killer remains.\nForget her VOICE to gain strength?    ",
         unlock_checkpoint_and_start,
@@ -152,29 +182,56 @@ def start_transition_dialogue():
     )
 
 def unlock_checkpoint_and_start():
-    global current_state, boss, base_memory_opacity, checkpoint_reached
+    global boss, fight, base_memory_opacity, checkpoint_reached
     base_memory_opacity = 100
-    current_state = STATE_GAME_HARUS
+    set_state(STATE_GAME_HARUS)
     boss = HarusBoss()
-    player.pos = Vector2(100, GROUND_Y)
+    player.place(100, GROUND_Y)
     player.hp = player.max_hp
+    fight = Fight(player, boss)
     checkpoint_reached = True
 
 def start_ending_sequence():
-    global current_state, base_memory_opacity
-    current_state = STATE_ENDING
+    global base_memory_opacity
+    set_state(STATE_ENDING)
     base_memory_opacity = 0 
     cutscene_mgr.start_sequence([
-        {"image": img_end, "text": "My revenge is complete, yet I cannot remember her name", "duration": 999}
+        {"image": scene["end"], "text": "My revenge is complete, yet I cannot remember her name", "duration": 999}
     ])
 
+# --- GAME LOGIC ---
+
+def update_game(dt):
+    """Advance whatever is playing by one fixed tick."""
+    global boss, fight
+    if current_state in [STATE_CUTSCENE, STATE_ENDING]:
+        cutscene_mgr.update(dt)
+        if current_state == STATE_CUTSCENE and cutscene_mgr.finished:
+            finish_intro_cutscene()
+
+    elif current_state in [STATE_GAME_PAPIA, STATE_GAME_HARUS] and fight:
+        for name, value in fight.step(dt, pygame.key.get_pressed()):
+            if name == "shake": start_shake(value)
+            elif name == "player_hit": start_shake(5, 0.2)
+
+        if fight.outcome:
+            outcome = fight.outcome
+            if hasattr(boss, 'cleanup'): boss.cleanup()
+            boss = fight = None
+            if outcome == "lost":
+                set_state(STATE_GAMEOVER)
+            elif current_state == STATE_GAME_PAPIA:
+                start_transition_dialogue()
+            else:
+                start_ending_sequence()
+
 # --- MAIN LOOP ---
 running = True
 while running:
-    dt = clock.tick(FPS) / 1000.0
+    frame_time = clock.tick(MAX_FPS) / 1000.0
     
     for event in pygame.event.get():
-        if event.type == pygame.QUIT:
+        if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
             running = False
         
         if current_state == STATE_DIALOGUE:
@@ -188,134 +245,94 @@ while running:
                     
             elif current_state == STATE_ENDING:
                 if event.key == pygame.K_SPACE:
-                    current_state = STATE_MENU
+                    set_state(STATE_MENU)
+                    player.cleanup()
                     player = Player()
                     base_memory_opacity = 255
                     checkpoint_reached = False
                     
             elif current_state == STATE_GAMEOVER:
                 if event.key == pygame.K_SPACE:
+                    player.cleanup()
                     if checkpoint_reached:
                         start_transition_dialogue()
                         player = Player()
                         player.can_dash = True
                     else:
-                        current_state = STATE_MENU
+                        set_state(STATE_MENU)
                         player = Player()
                         base_memory_opacity = 255
                         checkpoint_reached = False
 
-    # Logic
-    if current_state in [STATE_CUTSCENE, STATE_ENDING]:
-        cutscene_mgr.update(dt)
-        if current_state == STATE_CUTSCENE and cutscene_mgr.finished:
-            finish_intro_cutscene()
-
-    elif current_state in [STATE_GAME_PAPIA, STATE_GAME_HARUS]:
-        keys = pygame.key.get_pressed()
-        player.update(dt, keys)
-        
-        if boss:
-            boss.update(dt, player)
-            if hasattr(boss, 'shake_requested') and boss.shake_requested > 0:
-                start_shake(boss.shake_requested)
-            
-            # Interactions
-            if player.attack_state == "active" and player.attack_hitbox:
-                if player.attack_hitbox.colliderect(boss.hurtbox()):
-                    if not player.attack_damage_applied:
-                        boss.hp -= 1
-                        player.attack_damage_applied = True
-                        if hasattr(boss, 'on_parried') and boss.parry_window: boss.on_parried()
-
-                if isinstance(boss, PapiaBoss) and boss.orb:
-                    if player.attack_hitbox.colliderect(pygame.Rect(boss.orb.pos.x - 20, boss.orb.pos.y - 20, 40, 40)):
-                        boss.orb = None
-                        boss.hp -= 1
-                        player.attack_damage_applied = True
-
-            # Damage
-            boss_hit = False
-            if hasattr(boss, 'attack_hitbox') and boss.attack_hitbox and boss.attack_active:
-                if boss.attack_hitbox.colliderect(player.hurtbox()): boss_hit = True
-            
-            if isinstance(boss, PapiaBoss):
-                for m in boss.meteors:
-                    if m.hits_player(player): boss_hit = True
-                if boss.orb and (boss.orb.pos - player.pos).length() < 40:
-                    boss_hit = True
-                    boss.orb = None 
-
-            if isinstance(boss, HarusBoss):
-                for s in boss.shockwaves:
-                    if s.rect.colliderect(player.hurtbox()):
-                        boss_hit = True
-                        s.active = False
-                if boss.attack_type == "swing" and boss.attack_active:
-                    if rect_point_distance(player.hurtbox(), boss.axe_tip_pos()) <= boss.swing_tip_radius:
-                        boss_hit = True
-
-            if boss_hit and player.hit_recovery_timer <= 0:
-                player.hp -= 1
-                player.hit_recovery_timer = 1.0
-                player.vel.x = -300 * player.facing
-                start_shake(5, 0.2)
-
-            if player.hp <= 0:
-                if hasattr(boss, 'cleanup'): boss.cleanup()
-                boss = None
-                current_state = STATE_GAMEOVER
-                
-            elif boss.hp <= 0:
-                if hasattr(boss, 'cleanup'): boss.cleanup()
-                boss = None
-                if current_state == STATE_GAME_PAPIA:
-                    start_transition_dialogue()
-                else:
-                    start_ending_sequence()
+    # Logic, in fixed ticks
+    for _ in range(timestep.advance(frame_time)):
+        update_game(timestep.step)
+    alpha = timestep.alpha
 
     # Drawing
     offset = (0, 0)
     if shake_timer > 0:
-        shake_timer -= dt
-        offset = (random.randint(-int(shake_intensity), int(shake_intensity)), 
-                  random.randint(-int(shake_intensity), int(shake_intensity)))
-
-    screen.fill(BLACK)
+        shake_timer -= frame_time
+        offset = (shake_rng.randint(-int(shake_intensity), int(shake_intensity)), 
+                  shake_rng.randint(-int(shake_intensity), int(shake_intensity)))
+
+    fighting = current_state in [STATE_GAME_PAPIA, STATE_GAME_HARUS]
+    # Dirty-rect mode restores the background only under what moved
+    dirty_rects = DIRTY_RECTS and RENDER_SCALE == 1 and not textured
+    partial = dirty_rects and fighting and renderer.begin(scene["bg_fight"], shaking=offset != (0, 0))
+    if not partial: screen.fill(BLACK)
     
     if current_state == STATE_MENU:
-        screen.blit(img_title, (0,0))
+        screen.blit(scene["title"], (0,0))
         if (pygame.time.get_ticks() // 500) % 2 == 0:
-            surf = font_ui.render("Press SPACE to Start", True, GRAY)
+            surf = render_text(font_ui, "Press SPACE to Start", True, GRAY)
             screen.blit(surf, surf.get_rect(center=(WIDTH//2, HEIGHT - 80)))
 
     elif current_state in [STATE_CUTSCENE, STATE_ENDING]:
         cutscene_mgr.draw()
         
     elif current_state == STATE_DIALOGUE:
-        pygame.draw.rect(screen, (15, 15, 20), (0,0,WIDTH,HEIGHT))
-        if current_state == STATE_DIALOGUE and img_cave and "FIRST DATE" in dialogue_sys.text:
-             s_cave = pygame.transform.scale(img_cave, (WIDTH, HEIGHT))
-             screen.blit(s_cave, (0,0))
+        draw_rect(screen, (15, 15, 20), (0,0,WIDTH,HEIGHT))
+        if current_state == STATE_DIALOGUE and "FIRST DATE" in dialogue_sys.text:
+             screen.blit(scene["cave_full"], (0,0))
              
         dialogue_sys.draw()
 
-    elif current_state in [STATE_GAME_PAPIA, STATE_GAME_HARUS]:
-        # Draw Background Image with offset
-        screen.blit(img_bg_fight, (offset[0], offset[1]))
+    elif fighting and textured:
+        with screen.layer(offset, RENDER_SCALE):
+            screen.blit(scene["bg_fight"], (0, 0))
+            if boss: boss.draw(screen, alpha=alpha)
+            player.draw(screen, alpha=alpha)
+        boss_name = "PAPIA" if current_state == STATE_GAME_PAPIA else "HARUS"
+        if boss: draw_ui(screen, player, boss_name, boss.hp, boss.max_hp)
+
+    elif fighting:
+        # Draw Background Image
+        if not partial:
+            world.fill(BLACK)
+            world.blit(scene["bg_fight"], (0, 0))
         
-        if boss: boss.draw(screen, offset)
-        player.draw(screen, offset)
+        drawn = []
+        if boss: drawn += boss.draw(world, alpha=alpha)
+        drawn += player.draw(world, alpha=alpha)
+        if partial: renderer.copy(drawn)
+        else: present_world(offset)
         
         boss_name = "PAPIA" if current_state == STATE_GAME_PAPIA else "HARUS"
-        if boss: draw_ui(screen, player, boss_name, boss.hp, boss.max_hp)
+        if boss: drawn += draw_ui(screen, player, boss_name, boss.hp, boss.max_hp)
 
     elif current_state == STATE_GAMEOVER:
         draw_text_centered("DEATH", -20, RED)
         msg = "(press space to retry)"
-        surf = font_ui.render(msg, True, WHITE)
+        surf = render_text(font_ui, msg, True, WHITE)
         screen.blit(surf, surf.get_rect(center=(WIDTH//2, HEIGHT//2 + 40)))
 
-    pygame.display.flip()
+    if dirty_rects and fighting:
+        renderer.present(drawn)
+    elif textured:
+        screen.present()
+    else:
+        renderer.invalidate()
+        pygame.display.flip()
 
 pygame.quit()
\ No newline at end of file
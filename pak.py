@@ -0,0 +1,170 @@
+"""Single-file asset pak: a JSON index followed by raw pixel and PCM payloads.
+
+    python pak.py [out.pak]
+
+Layout: b"VPAK", u32 version, u32 index length, the UTF-8 JSON index, then
+payloads aligned to 16 bytes. Images are stored as raw straight (not
+premultiplied) RGBA rows, what the loose PNG decodes to: every sprite is
+blitted with ordinary alpha blending and surfaces.prepare sorts images by
+their alpha, so premultiplied pixels would need BLEND_PREMULTIPLIED at every
+blit. Sounds are PCM in the mixer format the pak was built with. The
+loader mmaps the file so nothing is decoded at load time; anything missing
+from the pak (or a sound built for a different mixer format) is loaded from
+the loose file instead.
+Each entry records the size, mtime and a hash of the file it was packed
+from. A loose file whose size or mtime differs is hashed, so a checkout or
+clone that only touched it keeps the entry; one whose contents changed since
+(an edited sprite, atlas pages rewritten by bake.py) is loaded in place of
+the stale entry, with a warning.
+"""
+import hashlib, json, mmap, os, struct, sys, threading
+import pygame
+
+MAGIC = b"VPAK"
+VERSION = 3
+HEADER = struct.Struct("<4sII")
+ALIGN = 16
+PAK_PATH = "assets.pak"
+
+IMAGE_EXTS = (".png",)
+SOUND_EXTS = (".wav",)
+
+def norm(path):
+    return os.path.normpath(path).replace(os.sep, "/")
+
+def stamp(path):
+    """[size, mtime in ns] of a file, or None if it is not there."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+def digest(path):
+    """Hash of a file's contents, or None if it is not there."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except OSError:
+        return None
+
+class Pak:
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_len = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} pak")
+        index = json.loads(bytes(self.data[HEADER.size:HEADER.size + index_len]))
+        self.mixer = tuple(index["mixer"]) if index["mixer"] else None
+        self.entries = index["entries"]
+        self.view = memoryview(self.data)
+
+    def __contains__(self, path):
+        return norm(path) in self.entries
+
+    def entry(self, path, kind):
+        """The index entry for `path`, unless the loose file differs from the
+        one that was packed (a pak shipped without loose files is trusted)."""
+        e = self.entries.get(norm(path))
+        if e is None or e["kind"] != kind: return None
+        current = stamp(path)
+        if current is None or current == e["source"]: return e
+        if digest(path) != e["hash"]:
+            print(f"Stale pak entry: {path} changed since {self.path} was built, loading the file")
+            return None
+        e["source"] = current  # Same contents, only touched: don't hash it again
+        return e
+
+    def image(self, path):
+        """Surface backed by the mapped payload (convert it before use), or
+        None if it is not packed or is stale."""
+        e = self.entry(path, "image")
+        if e is None: return None
+        w, h = e["size"]
+        return pygame.image.frombuffer(self.view[e["offset"]:e["offset"] + w * h * 4], (w, h), "RGBA")
+
+    def sound(self, path):
+        """Sound built from the stored PCM, or None if it is not packed, is
+        stale or the current mixer format differs."""
+        e = self.entry(path, "sound")
+        if e is None: return None
+        if self.mixer != pygame.mixer.get_init(): return None
+        return pygame.mixer.Sound(buffer=self.view[e["offset"]:e["offset"] + e["length"]])
+
+    def close(self):
+        self.view.release()
+        self.data.close()
+        self.file.close()
+
+_default = []
+_opening = threading.Lock()  # Preload workers can ask for it at the same time
+
+def default_pak():
+    """The game's pak, opened on first use; None if there is none."""
+    if not _default:
+        with _opening:
+            if not _default:
+                try:
+                    _default.append(Pak(PAK_PATH))
+                except (OSError, ValueError):
+                    _default.append(None)
+    return _default[0]
+
+def collect(root="assets"):
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d != "raw")
+        for name in sorted(filenames):
+            if name.lower().endswith(IMAGE_EXTS + SOUND_EXTS):
+                files.append(norm(os.path.join(dirpath, name)))
+    return files
+
+def build(out=PAK_PATH, root="assets"):
+    pygame.init()
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        pass
+    mixer = pygame.mixer.get_init()
+
+    entries, payloads = {}, []
+    for path in collect(root):
+        if path.lower().endswith(IMAGE_EXTS):
+            surf = pygame.image.load(path)
+            entries[path] = {"kind": "image", "size": list(surf.get_size()), "source": stamp(path), "hash": digest(path)}
+            payloads.append(pygame.image.tostring(surf, "RGBA"))  # Straight alpha, as blitted
+        elif mixer:
+            raw = pygame.mixer.Sound(path).get_raw()
+            entries[path] = {"kind": "sound", "length": len(raw), "source": stamp(path), "hash": digest(path)}
+            payloads.append(raw)
+
+    def layout(index_len):
+        offset = HEADER.size + index_len
+        for e, data in zip(entries.values(), payloads):
+            offset += -offset % ALIGN
+            e["offset"] = offset
+            offset += len(data)
+
+    # Offsets depend on the index size and vice versa: reserve room for the
+    # offsets growing a few digits, then pad the final index to that size
+    layout(0)
+    reserved = len(json.dumps({"mixer": mixer, "entries": entries})) + 16 * len(entries)
+    layout(reserved)
+    index = json.dumps({"mixer": mixer, "entries": entries}).encode()
+    assert len(index) <= reserved
+    index = index.ljust(reserved)
+
+    with open(out, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(index)))
+        f.write(index)
+        for e, data in zip(entries.values(), payloads):
+            f.write(b"\0" * (e["offset"] - f.tell()))
+            f.write(data)
+        size = f.tell()
+    print(f"wrote {out}: {len(entries)} assets, {size / (1024 * 1024):.1f} MiB")
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    build(sys.argv[1] if len(sys.argv) > 1 else PAK_PATH)
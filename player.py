@@ -1,10 +1,21 @@
 import pygame
 from pygame.math import Vector2
 from settings import *
+from animations import load_animation
+from registry import AssetScope
+from collision import Box, Circle
 
 class Player:
+    __slots__ = ("pos", "prev_pos", "vel", "facing", "on_ground", "max_hp", "hp", "can_dash",
+                 "attack_state", "attack_timer", "attack_hitbox", "attack_damage_applied", "cooldown",
+                 "hit_recovery_timer", "jump_hold",
+                 "dash_cooldown", "dash_timer", "is_dashing", "dash_speed", "dash_time", "dash_cooldown_time",
+                 "anim_state", "anim_frame", "anim_timer", "assets", "animations", "sfx_dash", "sfx_slash",
+                 "hurt_rect", "sword_rect", "body", "center", "feet", "sword")
+
     def __init__(self):
         self.pos = Vector2(220, GROUND_Y)
+        self.prev_pos = Vector2(self.pos)  # Position one tick ago, for drawing between ticks
         self.vel = Vector2(0,0)
         self.facing = 1
         self.on_ground = True
@@ -32,31 +43,55 @@ class Player:
         self.dash_time = 0.14
         self.dash_cooldown_time = 0.6
 
-        # Animations
-        self.animations = {
-            "idle": load_strip("assets/protag/idle.png", 4),
-            "walk": load_strip("assets/protag/walk.png", 2),
-            "windup": load_strip("assets/protag/windup.png", 2),
-            "attack": load_strip("assets/protag/attack.png", 1),
-            "recovery": load_strip("assets/protag/recovery.png", 1),
-            "dash": load_strip("assets/protag/dash.png", 1)
-        }
         self.anim_state = "idle"
         self.anim_frame = 0
         self.anim_timer = 0
-        self.anim_speed = {"idle": 0.25, "walk": 0.15, "windup": 0.10, "attack": 0.20, "recovery": 0.20, "dash": 0.1}
+
+        # Geometry, moved in place once per tick rather than rebuilt per test
+        self.hurt_rect = pygame.Rect(0, 0, 40, 80)
+        self.sword_rect = pygame.Rect(0, 0, 50, 20)
+        self.body = Box(self.hurt_rect)
+        self.center = Circle(0, 0)
+        self.feet = Circle(0, 0)
+        self.sword = Box(self.sword_rect)
+        self.update_geometry()
+
+        self.assets = AssetScope()
+        with self.assets:
+            self.load_assets()
+
+    def load_assets(self):
+        # Animations (baked at their draw scale in both facings, see animations.py)
+        self.animations = {state: load_animation(f"protag/{state}")
+                           for state in ("idle", "walk", "windup", "attack", "recovery", "dash")}
 
         # SFX
         try:
-            self.sfx_dash = pygame.mixer.Sound("assets/SFX/DASH.wav")
-            self.sfx_slash = pygame.mixer.Sound("assets/SFX/SWORD SLASH.wav")
-            self.sfx_slash.set_volume(0.6)
+            self.sfx_dash = load_sound("assets/SFX/DASH.wav")
+            self.sfx_slash = load_sound("assets/SFX/SWORD SLASH.wav", 0.6)
         except:
             self.sfx_dash = None
             self.sfx_slash = None
 
+    def cleanup(self):
+        self.assets.release()
+
     def hurtbox(self):
-        return pygame.Rect(self.pos.x-20, self.pos.y-80, 40, 80)
+        """This tick's hurtbox; shared, so move() a copy rather than editing it."""
+        return self.hurt_rect
+
+    def update_geometry(self):
+        x, y = self.pos
+        self.hurt_rect.update(x-20, y-80, 40, 80)
+        self.center.move(*self.hurt_rect.center, 0)
+        self.feet.move(x, y, 0)
+
+    def add_colliders(self, world):
+        world.add("player", self.body, self)
+        world.add("player_center", self.center, self)
+        world.add("player_feet", self.feet, self)
+        if self.attack_state == "active" and self.attack_hitbox:
+            world.add("sword", self.sword, self)
 
     def start_attack(self):
         if self.attack_state != "ready" or self.is_dashing:
@@ -81,7 +116,14 @@ class Player:
         self.hit_recovery_timer = self.dash_time
         if self.sfx_dash: self.sfx_dash.play()
 
+    def place(self, x, y):
+        """Move without drawing the jump in between."""
+        self.pos.update(x, y)
+        self.prev_pos.update(x, y)
+        self.update_geometry()
+
     def update(self, dt, keys):
+        self.prev_pos.update(self.pos)
         if self.hit_recovery_timer > 0: self.hit_recovery_timer -= dt
         if self.dash_cooldown > 0: self.dash_cooldown -= dt
         if self.cooldown > 0: self.cooldown -= dt
@@ -130,7 +172,8 @@ class Player:
                 offset = 40 * self.facing 
                 w, h = 50, 20
                 x = self.pos.x + offset if self.facing == 1 else self.pos.x + offset - w
-                self.attack_hitbox = pygame.Rect(x, self.pos.y - 60, w, h)
+                self.attack_hitbox = self.sword_rect
+                self.attack_hitbox.update(x, self.pos.y - 60, w, h)
                 
         elif self.attack_state == "active":
             if self.attack_hitbox:
@@ -158,7 +201,8 @@ class Player:
             self.pos.y = GROUND_Y
             self.vel.y = 0
             self.on_ground = True
-            
+
+        self.update_geometry()
         self.update_animation(dt)
 
     def update_animation(self, dt):
@@ -176,26 +220,24 @@ class Player:
             self.anim_timer = 0
             
         self.anim_timer += dt
-        if self.anim_timer >= self.anim_speed.get(state, 0.2):
+        if self.anim_timer >= self.animations[self.anim_state].duration(self.anim_frame):
             self.anim_timer = 0
             self.anim_frame = (self.anim_frame + 1) % len(self.animations[self.anim_state])
 
-    def draw(self, screen, offset=(0,0)):
+    def draw(self, screen, offset=(0,0), alpha=1.0):
         if self.hit_recovery_timer > 0 and not self.is_dashing:
             if int(self.hit_recovery_timer * 10) % 2 == 0:
-                return
+                return []
 
         frames = self.animations.get(self.anim_state)
-        if not frames: return
+        if not frames: return []
         
-        frame = frames[self.anim_frame] if self.anim_frame < len(frames) else frames[0]
-        SCALE = 2.0
-        
-        if self.facing == -1:
-            frame = pygame.transform.flip(frame, True, False)
-            
-        frame = pygame.transform.scale(frame, (int(frame.get_width()*SCALE), int(frame.get_height()*SCALE)))
+        index = self.anim_frame if self.anim_frame < len(frames) else 0
+        frame = frames.frame(index, self.facing)
+        ox, oy = frames.offset(index, self.facing)
         
-        draw_x = self.pos.x - frame.get_width() // 2 + offset[0]
-        draw_y = self.pos.y - frame.get_height() + offset[1]
-        screen.blit(frame, (draw_x, draw_y))
\ No newline at end of file
+        pos = self.prev_pos.lerp(self.pos, alpha)
+        x, y = to_view(pos.x + offset[0], pos.y + offset[1])
+        draw_x = x - frames.width // 2 + ox
+        draw_y = y - frames.height + oy
+        return [screen.blit(frame, (draw_x, draw_y))]
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""Bot players for headless fights.
+
+A policy is a function of a sim.Fight returning the actions held this tick
+("left", "right", "jump", "attack", "dash"). POLICIES maps each name to a
+factory taking a seed, so random policies replay exactly.
+"""
+import math, random
+from settings import SIM_HZ
+from projectiles import METEOR, ORB, SHOCKWAVE, IMPACT, HOMING, SHOCKWAVE_W, rect_x
+
+REACH = 140
+DANGER = 250
+
+def toward(player, x):
+    return "right" if x > player.pos.x else "left"
+
+def away(player, x):
+    return "left" if x > player.pos.x else "right"
+
+def idle(fight):
+    return ()
+
+def chase(fight):
+    """Walk up to the boss and swing whenever it is in reach."""
+    player, boss = fight.player, fight.boss
+    if abs(boss.pos.x - player.pos.x) < REACH: return ("attack",)
+    return (toward(player, boss.pos.x),)
+
+def dodge(fight):
+    """Chase, but get out from under meteors, jump shockwaves, swing at
+    orbs, and keep clear of Harus' attacks unless one can be parried."""
+    player, boss = fight.player, fight.boss
+    px = player.pos.x
+    proj = boss.projectiles
+    # Meteors clip anything within ~50px of where they fall: clear out from under the shower
+    threats = [proj.x[i] for i in proj.live(METEOR) if proj.phase[i] != IMPACT and abs(proj.x[i] - px) < 60]
+    if threats: return ("dash", away(player, sum(threats) / len(threats)))
+    for i in proj.live(ORB):
+        if proj.phase[i] == HOMING and math.hypot(proj.x[i] - px, proj.y[i] - player.pos.y) < 120:
+            # Orbs home faster than the player runs: turn and cut them down
+            return (toward(player, proj.x[i]), "attack")
+    for i in proj.live(SHOCKWAVE):
+        direction = 1 if proj.vx[i] > 0 else -1
+        if 0 < (rect_x(proj.x[i]) + SHOCKWAVE_W // 2 - px) * -direction < 120: return ("jump",)
+    state = getattr(boss, "state", "")
+    if state == "active" and boss.parry_window and abs(boss.pos.x - px) < REACH:
+        return ("attack",)
+    if state in ("telegraph", "parry", "active"):
+        # Spin covers 200px either side of Harus, the swing about 190px
+        return (away(player, boss.pos.x),) if abs(boss.pos.x - px) < DANGER else ()
+    return chase(fight)
+
+def button_masher(seed):
+    """Random held actions, changed every quarter second."""
+    rng = random.Random(seed)
+    held = ()
+    def policy(fight):
+        nonlocal held
+        if fight.tick % (SIM_HZ // 4) == 0:
+            held = tuple(a for a in ("left", "right", "jump", "attack", "dash") if rng.random() < 0.3)
+        return held
+    return policy
+
+POLICIES = {
+    "idle": lambda seed: idle,
+    "chase": lambda seed: chase,
+    "dodge": lambda seed: dodge,
+    "random": button_masher,
+}
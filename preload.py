@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from pak import default_pak
+from registry import registry
+from surfaces import prepare
+
+def decode_image(path):
+    """Decode an image file (or pak entry) without converting it."""
+    pak = default_pak()
+    img = pak.image(path) if pak else None
+    return img if img is not None else pygame.image.load(path)
+
+def load_converted(path):
+    return prepare(decode_image(path), path)
+
+def decode_sound(path):
+    pak = default_pak()
+    sound = pak.sound(path) if pak else None
+    return sound if sound is not None else pygame.mixer.Sound(path)
+
+class Preloader:
+    """Decodes files on worker threads ahead of time.
+
+    pygame releases the GIL while decoding and converting, so images and
+    sounds for the next encounter can be read during dialogue or cutscenes.
+    load_image and load_sound pick the finished result up with take()
+    instead of decoding again. Images are converted to the display format on
+    the worker (see surfaces.prepare), so only preload once the display mode
+    is set.
+    """
+
+    def __init__(self, workers=2):
+        self.workers = workers
+        self.pool = None
+        self.pending = {}
+
+    def preload(self, paths):
+        if self.pool is None:
+            self.pool = ThreadPoolExecutor(self.workers, thread_name_prefix="preload")
+        for path in paths:
+            is_sound = path.lower().endswith(".wav")
+            key = ("sound" if is_sound else "image", path)
+            if key in self.pending or key in registry.entries: continue
+            self.pending[key] = self.pool.submit(decode_sound if is_sound else load_converted, path)
+
+    def take(self, kind, path):
+        """The preloaded result for a file (waiting for it if still decoding),
+        or None if it was never requested. Decode errors are re-raised."""
+        future = self.pending.pop((kind, path), None)
+        return future.result() if future is not None else None
+
+    def busy(self):
+        return any(not f.done() for f in self.pending.values())
+
+preloader = Preloader()
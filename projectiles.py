@@ -0,0 +1,301 @@
+"""Boss projectiles (meteors, orbs, shockwaves) as columns of NumPy arrays.
+
+Each boss owns one Projectiles and spawns into it. Every projectile is a
+slot: kind, phase, position, velocity and a timer, one array per field.
+update() steps the slots one by one over the columns as lists, cheaper
+than array calls at the counts a fight reaches, and writes them back once;
+hits are tested against the columns in one array pass per layer. Dead slots
+are squeezed out in place through preallocated scratch arrays. Capacity doubles when a pattern
+outgrows it, so a fight settles into never allocating.
+"""
+import math
+import numpy as np
+import pygame
+from settings import *
+from effects import blit_circle
+from canvas import draw_rect, draw_circle
+from collision import Boxes, Circles
+
+METEOR, ORB, SHOCKWAVE = range(3)
+DEAD, WINDUP, FALLING, IMPACT, HOMING, SLIDING = range(6)
+
+METEOR_RADIUS = 26
+METEOR_FALL_SPEED = 700.0
+METEOR_TARGET_Y = GROUND_Y - 6
+METEOR_IMPACT_TIME = 0.30
+ORB_RADIUS = 20
+ORB_WINDUP = 0.45
+SHOCKWAVE_SPEED = 380
+SHOCKWAVE_W, SHOCKWAVE_H = 80, 60
+ROCK_REACH = 30  # Slightly larger than the falling sprite
+BLAST_REACH = METEOR_RADIUS + 20
+ORB_REACH = 40
+
+FLOAT_FIELDS = ("x", "y", "prev_x", "prev_y", "vx", "vy", "timer", "life", "speed", "frame")
+INT_FIELDS = ("kind", "phase")
+
+def rect_x(x):
+    """What `rect.x = x` stores: rounded half away from zero."""
+    return np.trunc(x + np.copysign(0.5, x))
+
+def advance_frame(frame, dt, durations, wrap):
+    frame += dt / durations[int(frame) % len(durations)]
+    return 0.0 if wrap and frame >= len(durations) else frame
+
+def clamp01(t):
+    return max(0.0, min(1.0, t))
+
+class Projectiles:
+    def __init__(self, capacity=32):
+        self.n = 0  # Slots in use, live or dead-but-not-yet-compacted
+        self.frames = {}
+        self.durations = {}
+        self._resize(capacity)
+
+    def _resize(self, capacity):
+        for name in FLOAT_FIELDS + INT_FIELDS:
+            new = np.zeros(capacity, np.float64 if name in FLOAT_FIELDS else np.int8)
+            old = getattr(self, name, None)
+            if old is not None: new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+        self._float_scratch = np.empty(capacity, np.float64)
+        self._int_scratch = np.empty(capacity, np.int8)
+        self.capacity = capacity
+
+    def animate(self, kind, frames):
+        """Draw `kind` with the strip `frames`, advancing through its frame durations."""
+        if frames:
+            self.frames[kind] = frames
+            self.durations[kind] = [float(d) for d in frames.durations]
+
+    def clear(self):
+        self.n = 0
+
+    # --- Spawning ---
+
+    def spawn(self, kind, phase, x, y, timer=0.0, vx=0.0, speed=0.0, life=0.0):
+        if self.n == self.capacity: self._resize(self.capacity * 2)
+        i = self.n
+        self.n += 1
+        self.kind[i], self.phase[i] = kind, phase
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i], self.vy[i] = vx, 0.0
+        self.timer[i], self.life[i], self.speed[i], self.frame[i] = timer, life, speed, 0.0
+        return i
+
+    def add_meteor(self, x, delay):
+        """A meteor that waits `delay` seconds over column x, then falls."""
+        return self.spawn(METEOR, WINDUP, x, -80, timer=delay)
+
+    def add_orb(self, x, y, speed, life, windup=ORB_WINDUP):
+        """An orb that launches at the player after `windup` and homes for `life` seconds."""
+        return self.spawn(ORB, WINDUP, x, y, timer=windup, speed=speed, life=life)
+
+    def add_shockwave(self, x, y, direction):
+        """A ground wave whose rect's left edge starts at x, sliding along `direction`."""
+        return self.spawn(SHOCKWAVE, SLIDING, float(int(x)), y, vx=SHOCKWAVE_SPEED * direction)
+
+    # --- Queries ---
+
+    def live(self, kind):
+        """Slot indices of the live projectiles of `kind`."""
+        n = self.n
+        return np.flatnonzero((self.kind[:n] == kind) & (self.phase[:n] != DEAD))
+
+    def count(self, kind, phase=None):
+        n = self.n
+        if not n: return 0
+        mask = self.kind[:n] == kind
+        mask &= (self.phase[:n] != DEAD) if phase is None else (self.phase[:n] == phase)
+        return int(np.count_nonzero(mask))
+
+    # --- Update ---
+
+    def update(self, dt, target):
+        """Advance every projectile one tick; orbs home on `target` (a position).
+        Returns how many meteors hit the ground this tick."""
+        n = self.n
+        if not n: return 0
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        kinds, phases = self.kind[:n].tolist(), self.phase[:n].tolist()
+        xs, ys, vxs, vys = self.x[:n].tolist(), self.y[:n].tolist(), self.vx[:n].tolist(), self.vy[:n].tolist()
+        timers, frames = self.timer[:n].tolist(), self.frame[:n].tolist()
+        speeds, lifes = self.speed[:n].tolist(), self.life[:n].tolist()
+        rock_frames, wave_frames = self.durations.get(METEOR), self.durations.get(SHOCKWAVE)
+        tx, ty = target
+        k = min(1.0, 2.0 * dt)
+        landed = dead = 0
+        for i in range(n):
+            phase = phases[i]
+            if phase == DEAD: dead += 1
+            elif phase == IMPACT:
+                timers[i] -= dt
+                if timers[i] <= 0:
+                    phases[i] = DEAD
+                    dead += 1
+            elif phase == FALLING:
+                ys[i] += METEOR_FALL_SPEED * dt
+                if rock_frames: frames[i] = advance_frame(frames[i], dt, rock_frames, wrap=False)
+                if ys[i] >= METEOR_TARGET_Y:
+                    ys[i], phases[i], timers[i] = METEOR_TARGET_Y, IMPACT, METEOR_IMPACT_TIME
+                    landed += 1
+            elif phase == HOMING:
+                if timers[i] <= 0:
+                    phases[i] = DEAD
+                    dead += 1
+                    continue
+                dx, dy = tx - xs[i], ty - ys[i]
+                length = math.sqrt(dx * dx + dy * dy)
+                if length > 0.1:
+                    # Vector2.lerp: a * (1 - t) + b * t
+                    vxs[i] = vxs[i] * (1 - k) + dx / length * speeds[i] * k
+                    vys[i] = vys[i] * (1 - k) + dy / length * speeds[i] * k
+                xs[i] = min(max(xs[i] + vxs[i] * dt, 0), WIDTH)
+                ys[i] = min(max(ys[i] + vys[i] * dt, -200), HEIGHT + 200)
+                timers[i] -= dt
+            elif phase == SLIDING:
+                xs[i] += vxs[i] * dt
+                left = rect_x(xs[i])
+                if left + SHOCKWAVE_W < 0 or left > WIDTH:
+                    phases[i] = DEAD
+                    dead += 1
+                elif wave_frames: frames[i] = advance_frame(frames[i], dt, wave_frames, wrap=True)
+            elif phase == WINDUP:
+                timers[i] -= dt
+                if timers[i] > 0: continue
+                if kinds[i] == METEOR: phases[i] = FALLING
+                elif kinds[i] == ORB:
+                    dx, dy = tx - xs[i], ty - ys[i]
+                    length = math.sqrt(dx * dx + dy * dy)
+                    if length == 0: dx, dy, length = 1.0, 0.0, 1.0
+                    vxs[i], vys[i] = dx / length * speeds[i], dy / length * speeds[i]
+                    phases[i], timers[i] = HOMING, lifes[i]
+        self.phase[:n], self.x[:n], self.y[:n], self.vx[:n], self.vy[:n] = phases, xs, ys, vxs, vys
+        self.timer[:n], self.frame[:n] = timers, frames
+        if dead: self.compact()
+        return landed
+
+    def compact(self):
+        """Drop dead slots, keeping the live ones in spawn order."""
+        n = self.n
+        keep = self.phase[:n] != DEAD
+        live = int(np.count_nonzero(keep))
+        if live == n: return
+        for name in FLOAT_FIELDS + INT_FIELDS:
+            column = getattr(self, name)
+            scratch = (self._float_scratch if name in FLOAT_FIELDS else self._int_scratch)[:live]
+            np.compress(keep, column[:n], out=scratch)
+            column[:live] = scratch
+        self.n = live
+
+    # --- Hits ---
+
+    def add_colliders(self, world):
+        """Falling rocks and shockwaves hit the player's hurtbox, blasts reach
+        for its center, orbs for its feet; the sword can cut orbs down. Rocks
+        orbs and shockwaves sweep the path they moved along this tick. Each
+        layer gets one batch of slots for the world to test in one array pass."""
+        n = self.n
+        if not n: return
+        kind, phase = self.kind[:n], self.phase[:n]
+        counts = np.bincount(phase, minlength=SLIDING + 1).tolist()
+        columns = self.x[:n], self.y[:n], self.prev_x[:n], self.prev_y[:n]
+        def pick(mask):
+            slots = mask.nonzero()[0]
+            # A group of every slot (a volley all in one phase) reads the columns
+            # as they are, and an empty one doesn't read them at all
+            return slots, (columns if slots.size in (0, n) else [c[slots] for c in columns])
+        if counts[FALLING] or counts[IMPACT]:
+            x, y, px, py = columns
+            # A rock that just landed still fell the rest of the way this tick
+            rocks, (rx, ry, rpx, rpy) = pick((phase == FALLING) | ((phase == IMPACT) & (py < y)))
+            if rocks.size: world.add_batch("hazard", Circles(rx, ry, ROCK_REACH, rpx, rpy), self, rocks)
+            if counts[IMPACT]:
+                blasts, (bx, _, _, _) = pick(phase == IMPACT)
+                world.add_batch("blast", Circles(bx, GROUND_Y, BLAST_REACH, bx, GROUND_Y), self, blasts)
+        if counts[SLIDING]:
+            waves, (x, y, px, _) = pick(phase == SLIDING)
+            # Slides straight across, so the box swept since last tick is a wider box
+            left, was = rect_x(x), rect_x(px)
+            top = np.trunc(y - 40)
+            box = Boxes(np.minimum(left, was), top, np.maximum(left, was) + SHOCKWAVE_W, top + SHOCKWAVE_H)
+            world.add_batch("hazard", box, self, waves, once=True)
+        if not (counts[WINDUP] or counts[HOMING]): return
+        orbs = kind == ORB
+        if counts[DEAD]: orbs &= phase != DEAD
+        orbs, (x, y, px, py) = pick(orbs)
+        if orbs.size:
+            left, top = np.trunc(x - ORB_RADIUS), np.trunc(y - ORB_RADIUS)
+            world.add_batch("orb", Boxes(left, top, left + 2 * ORB_RADIUS, top + 2 * ORB_RADIUS), self, orbs, once=True)
+            world.add_batch("seeker", Circles(x, y, ORB_REACH, px, py), self, orbs, once=True)
+
+    def kill(self, i):
+        self.phase[i] = DEAD
+
+    # --- Drawing ---
+
+    def draw(self, screen, offset=(0,0), alpha=1.0):
+        n = self.n
+        kinds, phases = self.kind[:n].tolist(), self.phase[:n].tolist()
+        xs, ys, pxs, pys = self.x[:n].tolist(), self.y[:n].tolist(), self.prev_x[:n].tolist(), self.prev_y[:n].tolist()
+        timers, frames_at, vxs = self.timer[:n].tolist(), self.frame[:n].tolist(), self.vx[:n].tolist()
+        drawn = []
+        for i in range(n):
+            kind, phase = kinds[i], phases[i]
+            if phase == DEAD: continue
+            if kind == METEOR: drawn += self._draw_meteor(screen, offset, alpha, phase, xs[i], ys[i], pys[i], timers[i], frames_at[i])
+            elif kind == ORB: drawn += self._draw_orb(screen, offset, alpha, phase, xs[i], ys[i], pxs[i], pys[i], timers[i])
+            else: drawn += self._draw_shockwave(screen, offset, alpha, xs[i], ys[i], pxs[i], vxs[i], frames_at[i])
+        return drawn
+
+    def _draw_meteor(self, screen, offset, alpha, phase, x, y, prev_y, timer, frame_at):
+        x_draw, y_draw_g = map(int, to_view(x + offset[0], GROUND_Y + offset[1]))
+        y = prev_y + (y - prev_y) * alpha
+        y_draw_cur = int(to_view(0, y + offset[1])[1])
+
+        # Telegraph (shadow on the ground), the falling rock, then the blast
+        if phase == WINDUP:
+            t = clamp01(1.0 - timer / 1.0)
+            r = int(METEOR_RADIUS + 10 * (0.8 + 0.2 * math.sin(pygame.time.get_ticks()/150)))
+            return [blit_circle(screen, (x_draw, y_draw_g), view_len(r), (220,90,40), int(100 + 120 * t), view_len(3))]
+        if phase == FALLING:
+            frames = self.frames.get(METEOR)
+            if not frames: return [draw_circle(screen, ORANGE, (x_draw, y_draw_cur), view_len(12))]
+            index = int(frame_at)
+            ox, oy = frames.offset(index)
+            draw_x = x_draw - frames.width // 2 + ox
+            draw_y = y_draw_cur - frames.height // 2 + oy
+            return [screen.blit(frames.frame(index), (draw_x, draw_y))]
+        t = clamp01(timer / METEOR_IMPACT_TIME)
+        r = int(METEOR_RADIUS * (1.2 + 1.4 * (1-t)))
+        return [blit_circle(screen, (x_draw, y_draw_g), view_len(r), (240,120,60), int(180 * t))]
+
+    def _draw_orb(self, screen, offset, alpha, phase, x, y, prev_x, prev_y, timer):
+        x = prev_x * (1 - alpha) + x * alpha
+        y = prev_y * (1 - alpha) + y * alpha
+        x_draw, y_draw = map(int, to_view(x + offset[0], y + offset[1]))
+        drawn = []
+        if phase == WINDUP and timer > 0:
+            t = clamp01(1.0 - timer / ORB_WINDUP)
+            r = int(ORB_RADIUS + 10 * (1.0 - t))
+            drawn.append(blit_circle(screen, (x_draw, y_draw), view_len(r), (140,80,200), int(130*t), view_len(3)))
+        drawn.append(draw_circle(screen, PURPLE, (x_draw, y_draw), view_len(ORB_RADIUS)))
+        drawn.append(blit_circle(screen, (x_draw, y_draw), view_len(ORB_RADIUS*2), (120,60,180), 60))
+        return drawn
+
+    def _draw_shockwave(self, screen, offset, alpha, x, y, prev_x, vx, frame_at):
+        # Shift by how far the wave is behind its current position
+        offset = (offset[0] + (prev_x - x) * (1 - alpha), offset[1])
+        rect = pygame.Rect(int(rect_x(x)), y - 40, SHOCKWAVE_W, SHOCKWAVE_H)
+        frames = self.frames.get(SHOCKWAVE)
+        if frames:
+            direction = 1 if vx > 0 else -1
+            index = int(frame_at)
+            ox, oy = frames.offset(index, direction)
+            x, y = to_view(rect.centerx + offset[0], rect.bottom + offset[1])
+            dx = x - frames.width // 2 + ox
+            dy = y - frames.height + oy
+            return [screen.blit(frames.frame(index, direction), (dx, dy))]
+        return [draw_rect(screen, RED, view_rect(rect.move(offset)), view_len(2))]
@@ -0,0 +1,156 @@
+from collections import OrderedDict
+import pygame
+
+def asset_bytes(value):
+    """Rough resident size of a cached asset, in bytes."""
+    if isinstance(value, pygame.Surface):
+        # Subsurfaces share their parent's pixels
+        if value.get_parent() is not None: return 0
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    if isinstance(value, pygame.mixer.Sound):
+        init = pygame.mixer.get_init()
+        if not init: return 0
+        freq, size, channels = init
+        return int(value.get_length() * freq) * (abs(size) // 8) * channels
+    if isinstance(value, dict):
+        return sum(asset_bytes(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(asset_bytes(v) for v in value)
+    if hasattr(value, "variants"):
+        return asset_bytes(value.variants)
+    return 0
+
+class AssetEntry:
+    def __init__(self, value, error=None):
+        self.value = value
+        self.error = error
+        self.refs = 0
+        self.deps = []
+        self.size = asset_bytes(value)
+
+class AssetRegistry:
+    """Process-wide cache of decoded assets, reference counted per key.
+
+    Keys are tuples such as ("image", path) or ("strip", path, count, w, h).
+    Failed loads are cached too and re-raise the original error.
+    Assets acquired while another asset is loading become its dependencies and
+    are released when it is dropped. Assets acquired inside an AssetScope are
+    released together when the scope is.
+
+    Unreferenced assets stay cached so reloading them is free, until the
+    resident total goes over `budget` bytes (None means no limit); then the
+    least recently used unreferenced ones are evicted first.
+    """
+
+    def __init__(self, budget=None):
+        self.entries = OrderedDict()
+        self.budget = budget
+        self.resident_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._loading = []
+        self._scopes = []
+
+    def acquire(self, key, loader):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+        else:
+            self.misses += 1
+            self._loading.append([])
+            try:
+                entry = AssetEntry(loader())
+            except Exception as e:
+                # Remember the failure so a missing file is only probed once
+                entry = AssetEntry(None, e)
+            entry.deps = self._loading.pop()
+            self.entries[key] = entry
+            self.resident_bytes += entry.size
+
+        if entry.error is not None:
+            raise entry.error
+        entry.refs += 1
+        if self._loading:
+            self._loading[-1].append(key)
+        elif self._scopes:
+            self._scopes[-1].keys.append(key)
+        if entry.refs == 1:
+            self.evict()
+        return entry.value
+
+    def release(self, key):
+        entry = self.entries.get(key)
+        if entry is not None and entry.refs > 0:
+            entry.refs -= 1
+            if entry.refs == 0:
+                self.entries.move_to_end(key)
+
+    def _drop(self, key):
+        entry = self.entries.pop(key)
+        self.resident_bytes -= entry.size
+        for dep in entry.deps:
+            self.release(dep)
+
+    def evict(self):
+        """Drop least recently used unreferenced assets until within budget."""
+        dropped = 0
+        while self.budget is not None and self.resident_bytes > self.budget:
+            victim = next((k for k, e in self.entries.items() if e.refs == 0), None)
+            if victim is None: break
+            self._drop(victim)
+            dropped += 1
+        self.evictions += dropped
+        return dropped
+
+    def purge(self):
+        """Drop every unreferenced asset (and release what it depended on)."""
+        dropped = 0
+        while True:
+            unused = [k for k, e in self.entries.items() if e.refs == 0]
+            if not unused: return dropped
+            for key in unused:
+                self._drop(key)
+                dropped += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.resident_bytes = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "referenced": sum(1 for e in self.entries.values() if e.refs > 0),
+            "resident_bytes": self.resident_bytes,
+            "budget": self.budget,
+            "evictions": self.evictions,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+class AssetScope:
+    """Collects the keys acquired inside a `with` block so an owner (player,
+    boss) can release everything it loaded in one call."""
+
+    def __init__(self, assets=None):
+        self.registry = assets if assets is not None else registry
+        self.keys = []
+
+    def __enter__(self):
+        self.registry._scopes.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        self.registry._scopes.remove(self)
+        return False
+
+    def release(self):
+        for key in self.keys:
+            self.registry.release(key)
+        self.keys = []
+        self.registry.evict()
+
+registry = AssetRegistry()
@@ -0,0 +1,62 @@
+from registry import AssetScope
+from settings import *
+
+class SceneAssets:
+    """Loads the assets a game state declares when it is entered and releases
+    them when it is left.
+
+    loaders maps an asset name to a function that loads it through the
+    registry; scenes maps each state to the names it needs. Assets shared by
+    the old and new state stay resident across the switch, and released ones
+    are evicted by the registry once it is over budget.
+    """
+
+    def __init__(self, loaders, scenes):
+        self.loaders = loaders
+        self.scenes = scenes
+        self.state = None
+        self.scope = AssetScope()
+        self.loaded = {}
+
+    def enter(self, state):
+        if state == self.state: return
+        old_scope = self.scope
+        self.state = state
+        self.scope = AssetScope()
+        self.loaded = {}
+        with self.scope:
+            for name in self.scenes.get(state, ()):
+                self.loaded[name] = self.loaders[name]()
+        # Release only after acquiring, so shared assets are never dropped
+        old_scope.release()
+
+    def __getitem__(self, name):
+        if name not in self.loaded:
+            # Not declared for this scene: load it on demand and keep it with the scene
+            with self.scope:
+                self.loaded[name] = self.loaders[name]()
+        return self.loaded[name]
+
+# Every full-screen / UI image the story and fights draw, as load_img args
+IMAGES = {
+    "wife": ("assets/story/wife.png", (100, 100)),
+    "bg_fight": ("assets/story/bg1.png", (VIEW_W, VIEW_H)),
+    "title": ("assets/story/title.png", (WIDTH, HEIGHT)),
+    "marriage": ("assets/story/marriage.png", None),
+    "hand1": ("assets/story/hand1.png", None),
+    "hand2": ("assets/story/hand2.png", None),
+    "cave_full": ("assets/story/cave.png", (WIDTH, HEIGHT)),
+    "end": ("assets/story/end.png", None),
+}
+
+SCENE_ASSETS = {
+    STATE_MENU: ["title"],
+    STATE_CUTSCENE: ["marriage", "hand1", "hand2", "cave_full"],
+    STATE_DIALOGUE: ["cave_full"],
+    STATE_GAME_PAPIA: ["bg_fight", "wife"],
+    STATE_GAME_HARUS: ["bg_fight", "wife"],
+    STATE_ENDING: ["end"],
+}
+
+def story_scenes():
+    return SceneAssets({name: (lambda args=args: load_img(*args)) for name, args in IMAGES.items()}, SCENE_ASSETS)
@@ -0,0 +1,65 @@
+"""Scripts: generators that say how long to wait before they go on.
+
+A script yields a wait in seconds and is sent the dt of the tick that
+resumes it:
+
+    def strike(boss):
+        boss.state = "telegraph"
+        yield 0.7           # resumes on the tick the 0.7 s run out
+        boss.state = "active"
+        while boss.swinging:
+            dt = yield      # resumes next tick
+
+A Scheduler counts each task's wait down by dt every update() and resumes
+it on the tick it reaches zero, the tick a timer counted down by hand would
+run out, so a script that is waiting costs one subtraction a tick. Scripts
+run one inside another with `yield from`, and side by side through spawn().
+"""
+
+class Task:
+    """A script the Scheduler runs, and how long until it goes on."""
+    __slots__ = ("script", "wait")
+
+    def __init__(self, script):
+        self.script, self.wait = script, 0.0
+
+    @property
+    def done(self):
+        return self.script is None
+
+class Scheduler:
+    __slots__ = ("tasks",)
+
+    def __init__(self):
+        self.tasks = []
+
+    def spawn(self, script):
+        """Start `script` now: it runs up to its first yield, and that wait
+        counts down from the next update()."""
+        task = Task(script)
+        self.tasks.append(task)
+        self._resume(task, None)
+        return task
+
+    def cancel(self, task):
+        """Stop a task where it waits; nothing after its yield runs."""
+        if task.done: return
+        task.script.close()
+        task.script = None
+        self.tasks.remove(task)
+
+    def update(self, dt):
+        """Count every wait down by dt and resume the tasks whose wait ran out,
+        the latest spawned first, so a script sees what the ones it started did
+        on the same tick."""
+        for task in self.tasks[::-1]:
+            if task.done: continue
+            task.wait -= dt
+            if task.wait <= 0: self._resume(task, dt)
+
+    def _resume(self, task, value):
+        try:
+            task.wait = task.script.send(value) or 0.0
+        except StopIteration:
+            task.script = None
+            self.tasks.remove(task)
@@ -1,8 +1,26 @@
 import pygame
+from registry import registry
+from preload import preloader, decode_image, decode_sound
+from textcache import text_cache
+from surfaces import prepare, formats
 
 # Screen
 WIDTH, HEIGHT = 960, 540
-FPS = 60
+# Frame rate cap (0 = draw as fast as the display path allows). The game
+# itself always advances in fixed ticks of 1/SIM_HZ seconds, and frames
+# between ticks are drawn interpolated.
+MAX_FPS = 0
+SIM_HZ = 120
+# Ticks run per frame at most; a slower machine runs the game slowed down
+# instead of stalling to catch up. Frame times are clamped to MAX_FRAME_TIME.
+MAX_CATCHUP_TICKS = 8
+MAX_FRAME_TIME = 0.25
+
+# Fights are composed on a WIDTH/RENDER_SCALE x HEIGHT/RENDER_SCALE surface
+# with sprites at their native size, then upscaled once per frame (1 draws
+# straight to the screen). Re-run bake.py after changing it.
+RENDER_SCALE = 1
+VIEW_W, VIEW_H = WIDTH // RENDER_SCALE, HEIGHT // RENDER_SCALE
 
 # CHANGED: Increased GROUND_Y so characters stand lower (closer to bottom)
 # Screen height is 540, so 515 leaves a small 25px margin.
@@ -20,6 +38,27 @@ PURPLE = (160, 80, 200)
 DARK_GREY = (40, 40, 40)
 CRIMSON = (120, 0, 0)
 
+# Print asset load details (trim savings, etc.) to the console
+DEBUG_ASSETS = False
+
+# Fights redraw and push only the rects that changed (full flip during shake)
+DIRTY_RECTS = False
+
+# "surface" draws with Surface blits, "sdl2" with pygame._sdl2.video textures
+# (GPU renderer if available, else SDL's software renderer). Dirty rects are
+# a surface-backend feature.
+RENDER_BACKEND = "surface"
+
+# Time the blit paths at startup; colorkeys are only used if they beat alpha
+TUNE_BLITS = False
+
+# Draw an FPS / state readout over the fights
+DEBUG_HUD = False
+
+# Unreferenced assets stay cached for reuse until the total resident size
+# passes this budget; then the least recently used are evicted
+ASSET_BUDGET_MB = 48
+
 # Game State Keys
 STATE_MENU = "menu"
 STATE_CUTSCENE = "cutscene"
@@ -30,20 +69,75 @@ STATE_GAME_HARUS = "harus_fight"
 STATE_ENDING = "ending"
 STATE_GAMEOVER = "gameover"
 
+def to_view(x, y):
+    """World (screen-sized) coordinates to render target coordinates."""
+    return x / RENDER_SCALE, y / RENDER_SCALE
+
+def view_len(n):
+    """A world length (radius, line width) on the render target."""
+    return max(1, round(n / RENDER_SCALE)) if n else 0
+
+def view_rect(rect):
+    if RENDER_SCALE == 1: return pygame.Rect(rect)
+    return pygame.Rect(rect.x // RENDER_SCALE, rect.y // RENDER_SCALE,
+                       view_len(rect.w), view_len(rect.h))
+
+def render_text(font, text, antialias, color):
+    """font.render through the shared text cache."""
+    return text_cache.render(font, text, antialias, color)
+
+def load_image(path):
+    def decode():
+        img = preloader.take("image", path)
+        if img is None: img = prepare(decode_image(path), path)
+        if DEBUG_ASSETS: print(f"format {path}: {formats[path]}")
+        return img
+    return registry.acquire(("image", path), decode)
+
+def load_img(path, scale=None):
+    try:
+        if not scale:
+            return load_image(path)
+        name = f"{path}@{scale[0]}x{scale[1]}"
+        def scaled():
+            img = prepare(pygame.transform.scale(load_image(path), scale), name, rle=True)
+            if DEBUG_ASSETS: print(f"format {name}: {formats[name]}")
+            return img
+        return registry.acquire(("image", path, scale), scaled)
+    except Exception as e:
+        print(f"Missing Asset: {path}")
+        s = pygame.Surface((scale if scale else (100,100)))
+        s.fill((50, 0, 0)) 
+        return s
+
 def load_strip(path, frame_count, frame_w=None, frame_h=None):
+    def slice_strip():
+        sheet = load_image(path)
+        w, h = frame_w, frame_h
+        if w is None:
+            w = sheet.get_width() // frame_count
+            h = sheet.get_height()
+        return [sheet.subsurface((i * w, 0, w, h)) for i in range(frame_count)]
+
     try:
-        sheet = pygame.image.load(path).convert_alpha()
-        frames = []
-        if frame_w is None:
-            frame_w = sheet.get_width() // frame_count
-            frame_h = sheet.get_height()
-            
-        for i in range(frame_count):
-            frame = sheet.subsurface((i * frame_w, 0, frame_w, frame_h))
-            frames.append(frame)
-        return frames
+        return registry.acquire(("strip", path, frame_count, frame_w, frame_h), slice_strip)
     except Exception as e:
         print(f"ERROR loading {path}: {e}")
         s = pygame.Surface((frame_w or 64, frame_h or 64))
         s.fill((255, 0, 255))
-        return [s]
\ No newline at end of file
+        return [s]
+
+def load_sound(path, volume=None):
+    # Raises like pygame.mixer.Sound so callers keep their fallbacks
+    def decode():
+        sound = preloader.take("sound", path)
+        return sound if sound is not None else decode_sound(path)
+    if volume is None:
+        return registry.acquire(("sound", path), decode)
+    # Volume is set on the Sound itself, so each volume gets its own copy of
+    # the shared samples instead of changing it for every other holder
+    def at_volume():
+        sound = pygame.mixer.Sound(buffer=registry.acquire(("sound", path), decode).get_raw())
+        sound.set_volume(volume)
+        return sound
+    return registry.acquire(("sound", path, volume), at_volume)
@@ -0,0 +1,158 @@
+"""Boss fights as plain game state, stepped without a window or sound.
+
+    import sim
+    sim.headless()
+    state, events = sim.simulate("harus", lambda fight: {"right", "attack"}, 120 * 60, seed=1)
+
+main.py runs the same Fight.step() each tick with the real keyboard and
+turns the events into screen shake and state changes.
+"""
+import random
+import pygame
+import animations
+from settings import SIM_HZ, GROUND_Y
+from player import Player
+from bosses import PapiaBoss, HarusBoss
+from collision import CollisionWorld
+
+BOSSES = {"papia": PapiaBoss, "harus": HarusBoss}
+
+# Who can hit whom: (attacker layer, target layer, rule). Player and bosses
+# put their colliders on these layers in add_colliders(); colliders added
+# with once=True are used up by their first hit through owner.kill(data).
+RULES = [
+    ("sword", "boss", "strike"),
+    ("sword", "orb", "cut"),
+    ("weapon", "player", "hurt"),
+    ("hazard", "player", "hurt"),
+    ("blast", "player_center", "hurt"),
+    ("seeker", "player_feet", "hurt"),
+]
+
+# Input actions and the keys Player.update reads them from
+ACTIONS = {"left": pygame.K_a, "right": pygame.K_d, "jump": pygame.K_w, "attack": pygame.K_j, "dash": pygame.K_k}
+
+class Held:
+    """What pygame.key.get_pressed() returns while `actions` are held."""
+
+    def __init__(self, actions=()):
+        self.keys = {ACTIONS[a] for a in actions}
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+def headless():
+    """Load animations as frame timings only; no display or mixer is needed."""
+    animations.timing_only = True
+
+class Fight:
+    """A player, a boss, and the hit rules between them.
+
+    step() advances one tick and returns what happened as (name, value)
+    pairs: ("shake", intensity), ("boss_hit", boss hp), ("parry", None),
+    ("orb_destroyed", boss hp), ("player_hit", player hp), and finally
+    ("won", None) or ("lost", None), after which `outcome` is set. A parried
+    boss's weapon hits nothing more that tick.
+    """
+
+    def __init__(self, player, boss):
+        self.player = player
+        self.boss = boss
+        self.world = CollisionWorld(RULES)
+        self.tick = 0
+        self.outcome = None
+
+    def step(self, dt, keys):
+        player, boss = self.player, self.boss
+        events = []
+        player.update(dt, keys)
+        boss.update(dt, player)
+        if boss.shake_requested > 0:
+            events.append(("shake", boss.shake_requested))
+
+        world = self.world
+        world.clear()
+        player.add_colliders(world)
+        boss.add_colliders(world)
+        used = set()  # Keys of colliders used up (or parried away) this tick
+        boss_hit = False
+        for rule, attacker, target in world.collide():
+            if attacker.key in used or target.key in used: continue
+            if rule == "strike":
+                if player.attack_damage_applied: continue
+                boss.hp -= 1
+                player.attack_damage_applied = True
+                events.append(("boss_hit", boss.hp))
+                if boss.on_struck():
+                    used.add((boss, "weapon"))
+                    events.append(("parry", None))
+            elif rule == "cut":
+                boss.hp -= 1
+                player.attack_damage_applied = True
+                events.append(("orb_destroyed", boss.hp))
+            else:
+                boss_hit = True
+            for c in (attacker, target):
+                if c.once:
+                    used.add(c.key)
+                    c.owner.kill(c.data)
+
+        if boss_hit and player.hit_recovery_timer <= 0:
+            player.hp -= 1
+            player.hit_recovery_timer = 1.0
+            player.vel.x = -300 * player.facing
+            events.append(("player_hit", player.hp))
+
+        if player.hp <= 0: self.outcome = "lost"
+        elif boss.hp <= 0: self.outcome = "won"
+        if self.outcome: events.append((self.outcome, None))
+        self.tick += 1
+        return events
+
+    def state(self):
+        player, boss = self.player, self.boss
+        return {
+            "tick": self.tick,
+            "outcome": self.outcome,
+            "player_hp": player.hp,
+            "player_pos": (player.pos.x, player.pos.y),
+            "player_state": player.attack_state,
+            "boss": type(boss).__name__,
+            "boss_hp": boss.hp,
+            "boss_max_hp": boss.max_hp,
+            "boss_pos": (boss.pos.x, boss.pos.y),
+            "boss_state": boss.state,
+        }
+
+    def cleanup(self):
+        if hasattr(self.boss, 'cleanup'): self.boss.cleanup()
+        self.player.cleanup()
+
+def new_fight(name, seed=None):
+    """A fresh fight against "papia" or "harus", set up the way the game
+    starts it. The boss rolls its choices from Random(seed)."""
+    player = Player()
+    player.can_dash = True
+    player.place(100, GROUND_Y)
+    return Fight(player, BOSSES[name](rng=random.Random(seed)))
+
+def simulate(fight, inputs, ticks, seed=None, dt=1.0 / SIM_HZ):
+    """Step `fight` (a Fight, or a boss name for new_fight) for up to `ticks`
+    ticks, stopping early once it is decided.
+
+    `inputs` gives the actions held on each tick: a sequence indexed by tick
+    (nothing held past its end) or a function of the Fight. Returns the final
+    state() and every event as (tick, name, value).
+    """
+    owned = isinstance(fight, str)
+    if owned: fight = new_fight(fight, seed)
+    log = []
+    for _ in range(ticks):
+        if callable(inputs): actions = inputs(fight)
+        else: actions = inputs[fight.tick] if fight.tick < len(inputs) else ()
+        tick = fight.tick
+        log.extend((tick, name, value) for name, value in fight.step(dt, Held(actions)))
+        if fight.outcome: break
+    state = fight.state()
+    if owned: fight.cleanup()
+    return state, log
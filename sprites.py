@@ -0,0 +1,139 @@
+from contextlib import contextmanager
+import pygame
+from settings import load_strip, DEBUG_ASSETS
+from surfaces import prepare, format_counts
+from registry import registry
+
+# Every flip/scale the sprite layer performs is counted here. "baked" grows
+# while strips are loaded; "runtime" only grows if a draw asks for a variant
+# that was not baked, so it must stay at 0 during fights.
+transform_stats = {"baked": 0, "runtime": 0}
+
+def scale_frame(frame, scale=1.0, size=None, flip=False):
+    if flip:
+        frame = pygame.transform.flip(frame, True, False)
+    if size is None:
+        size = (int(frame.get_width() * scale), int(frame.get_height() * scale))
+    if size != frame.get_size():
+        frame = pygame.transform.scale(frame, size)
+    return frame
+
+def trim_frame(frame):
+    """Crop a frame to its opaque area. Returns the cropped copy and its
+    offset inside the original frame."""
+    rect = frame.get_bounding_rect()
+    return frame.subsurface(rect).copy(), (rect.x, rect.y)
+
+def bake_frames(frames, scale=1.0, size=None, trim=False, flip=False):
+    """Flip, scale and optionally trim frames for one facing.
+
+    Returns (frames, offsets, full_size). full_size is the untrimmed frame
+    size and offsets place each frame inside it.
+    """
+    baked = []
+    for f in frames:
+        transform_stats["baked"] += 1
+        baked.append(scale_frame(f, scale, size, flip))
+    full_size = baked[0].get_size() if baked else (0, 0)
+    offsets = [(0, 0)] * len(baked)
+    if trim and baked:
+        baked, offsets = (list(t) for t in zip(*[trim_frame(f) for f in baked]))
+    return baked, offsets, full_size
+
+def frame_bytes(frames):
+    return sum(f.get_width() * f.get_height() * 4 for f in frames)
+
+class SpriteStrip:
+    """Animation frames pre-scaled to their draw size, one list per facing.
+
+    Frames may be trimmed to their opaque area: offset() gives where a frame
+    sits inside the full frame, whose size is kept as width/height for
+    placement. durations holds how long each frame is shown, in seconds.
+    """
+
+    def __init__(self, variants, offsets, full_size, durations=None, name=""):
+        self.name = name
+        self.width, self.height = full_size
+        self.variants = variants
+        self.offsets = offsets
+        self.durations = list(durations) if durations else [0.2] * len(self)
+
+    def __len__(self):
+        return len(self.variants[1])
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def _facing(self, facing):
+        if facing not in self.variants:
+            # Facing was never baked: build it once and remember it
+            transform_stats["runtime"] += len(self)
+            self.variants[facing] = [prepare(pygame.transform.flip(f, True, False), rle=True)
+                                     for f in self.variants[1]]
+            self.offsets[facing] = [(self.width - ox - f.get_width(), oy)
+                                    for f, (ox, oy) in zip(self.variants[1], self.offsets[1])]
+        return facing
+
+    def frame(self, index, facing=1):
+        frames = self.variants[self._facing(facing)]
+        return frames[index % len(frames)]
+
+    def offset(self, index, facing=1):
+        offsets = self.offsets[self._facing(facing)]
+        return offsets[index % len(offsets)]
+
+    def duration(self, index):
+        return self.durations[index % len(self.durations)]
+
+# (name, bytes before trim, bytes after trim) for every trimmed strip loaded
+trim_report = []
+
+def format_trim(name, full, trimmed):
+    saved = full - trimmed
+    pct = 100 * saved / full if full else 0
+    return f"trim {name}: {full // 1024} KiB -> {trimmed // 1024} KiB ({saved // 1024} KiB, {pct:.0f}% saved)"
+
+def prepare_frames(frames, name):
+    """Store each frame in its cheapest format; frames that own their pixels
+    (not subsurfaces of a sheet or page) get RLE colorkeys."""
+    return [prepare(f, f"{name}#{i}", rle=f.get_parent() is None) for i, f in enumerate(frames)]
+
+def make_strip(frames, scale=1.0, size=None, flip=True, trim=False, durations=None, name=""):
+    variants, offsets = {}, {}
+    full_size = (0, 0)
+    for facing in ((1, -1) if flip else (1,)):
+        variants[facing], offsets[facing], full_size = bake_frames(frames, scale, size, trim, facing == -1)
+        variants[facing] = prepare_frames(variants[facing], f"{name}/{facing}")
+    if DEBUG_ASSETS:
+        print(f"format {name}: {format_counts(name + '/')}")
+    if trim:
+        full = full_size[0] * full_size[1] * 4 * len(frames) * len(variants)
+        trimmed = sum(frame_bytes(v) for v in variants.values())
+        trim_report.append((name, full, trimmed))
+        if DEBUG_ASSETS:
+            print(format_trim(name, full, trimmed))
+    return SpriteStrip(variants, offsets, full_size, durations, name)
+
+def load_sprites(path, frame_count, frame_w=None, frame_h=None, scale=1.0, size=None, flip=True, trim=False, durations=None):
+    key = ("sprites", path, frame_count, frame_w, frame_h, scale, size, flip, trim)
+    return registry.acquire(key, lambda: make_strip(load_strip(path, frame_count, frame_w, frame_h),
+                                                    scale, size, flip, trim, durations, path))
+
+@contextmanager
+def count_transforms():
+    """Count every pygame.transform call made inside the block, by name."""
+    counts = {}
+    originals = {}
+    for name in ("flip", "scale", "smoothscale", "rotate", "rotozoom", "scale_by"):
+        fn = getattr(pygame.transform, name, None)
+        if fn is None: continue
+        originals[name] = fn
+        def counted(*args, _name=name, _fn=fn, **kwargs):
+            counts[_name] = counts.get(_name, 0) + 1
+            return _fn(*args, **kwargs)
+        setattr(pygame.transform, name, counted)
+    try:
+        yield counts
+    finally:
+        for name, fn in originals.items():
+            setattr(pygame.transform, name, fn)
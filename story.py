@@ -1,5 +1,6 @@
 import pygame
 from settings import *
+from canvas import draw_rect
 
 class CutsceneManager:
     def __init__(self, screen):
@@ -12,10 +13,14 @@ class CutsceneManager:
             self.font = pygame.font.SysFont("georgia", 24, bold=True)
             
         self.scenes = [] 
+        self.slides = []
         self.current_index = 0
         self.timer = 0
         self.finished = False
         self.fade_alpha = 0
+        # One black overlay, faded with set_alpha
+        self.fade = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self.fade.fill(BLACK)
 
     def start_sequence(self, sequence_data):
         """
@@ -25,11 +30,38 @@ class CutsceneManager:
         ]
         """
         self.scenes = sequence_data
+        self.slides = [self.compose(data) for data in sequence_data]
         self.current_index = 0
         self.timer = sequence_data[0]["duration"]
         self.finished = False
         self.fade_alpha = 255
 
+    def compose(self, data):
+        """Render a slide (image scaled to the screen, shadowed caption) once."""
+        slide = pygame.Surface((WIDTH, HEIGHT)).convert()
+        slide.fill(BLACK)
+
+        # 1. Draw Image
+        img = data.get("image")
+        if img:
+            # Scale to fit screen
+            if img.get_size() != (WIDTH, HEIGHT):
+                img = pygame.transform.scale(img, (WIDTH, HEIGHT))
+            slide.blit(img, (0,0))
+
+        # 2. Draw Text (Centered at bottom with shadow)
+        if data.get("text"):
+            text_str = data["text"]
+            
+            # Shadow
+            shad = render_text(self.font, text_str, True, BLACK)
+            slide.blit(shad, shad.get_rect(center=(WIDTH//2, HEIGHT - 50 + 2)))
+            
+            # Main Text
+            surf = render_text(self.font, text_str, True, WHITE)
+            slide.blit(surf, surf.get_rect(center=(WIDTH//2, HEIGHT - 50)))
+        return slide
+
     def update(self, dt):
         if self.finished: return
 
@@ -43,44 +75,20 @@ class CutsceneManager:
             self.current_index += 1
             if self.current_index >= len(self.scenes):
                 self.finished = True
+                self.slides = []
             else:
                 self.timer = self.scenes[self.current_index]["duration"]
                 self.fade_alpha = 255 # Reset fade for next slide
 
     def draw(self):
         if self.finished: return
-        
-        data = self.scenes[self.current_index]
-        
-        # 1. Draw Image
-        if data.get("image"):
-            # Scale to fit screen
-            img = data["image"]
-            img = pygame.transform.scale(img, (WIDTH, HEIGHT))
-            self.screen.blit(img, (0,0))
-        else:
-            self.screen.fill(BLACK)
-        
-        # 2. Draw Text (Centered at bottom with shadow)
-        if data.get("text"):
-            text_str = data["text"]
-            
-            # Shadow
-            shad = self.font.render(text_str, True, BLACK)
-            shad_rect = shad.get_rect(center=(WIDTH//2, HEIGHT - 50 + 2))
-            self.screen.blit(shad, shad_rect)
-            
-            # Main Text
-            surf = self.font.render(text_str, True, WHITE)
-            rect = surf.get_rect(center=(WIDTH//2, HEIGHT - 50))
-            self.screen.blit(surf, rect)
 
-        # 3. Fade Transition
+        self.screen.blit(self.slides[self.current_index], (0,0))
+
+        # Fade Transition
         if self.fade_alpha > 0:
-            fade = pygame.Surface((WIDTH, HEIGHT))
-            fade.fill(BLACK)
-            fade.set_alpha(int(self.fade_alpha))
-            self.screen.blit(fade, (0,0))
+            self.fade.set_alpha(int(self.fade_alpha))
+            self.screen.blit(self.fade, (0,0))
 
 class DialogueSystem:
     def __init__(self, screen):
@@ -96,6 +104,10 @@ class DialogueSystem:
         self.choices = ["YES", "NO"]
         self.selected_index = 0
         self.on_confirm = None 
+        # Box background with slight transparency, made once
+        self.box = pygame.Surface((600, 200))
+        self.box.set_alpha(220)
+        self.box.fill((20, 20, 20))
 
     def start_dialogue(self, text, callback_yes, refusal_text="I won't turn back."):
         self.active = True
@@ -125,23 +137,18 @@ class DialogueSystem:
         if not self.active: return
         
         # Draw Box (Centered)
-        box_w, box_h = 600, 200
+        box_w, box_h = self.box.get_size()
         box_rect = pygame.Rect((WIDTH - box_w)//2, (HEIGHT - box_h)//2, box_w, box_h)
-        
-        # Background with slight transparency
-        s = pygame.Surface((box_w, box_h))
-        s.set_alpha(220)
-        s.fill((20, 20, 20))
-        self.screen.blit(s, (box_rect.x, box_rect.y))
+        self.screen.blit(self.box, (box_rect.x, box_rect.y))
         
         # Border
-        pygame.draw.rect(self.screen, (150, 150, 150), box_rect, 3)
+        draw_rect(self.screen, (150, 150, 150), box_rect, 3)
         
         # Draw Main Text (Wrapped)
         lines = self.text.split('\n')
         y_off = 40
         for line in lines:
-            surf = self.font.render(line, True, WHITE)
+            surf = render_text(self.font, line, True, WHITE)
             rect = surf.get_rect(center=(WIDTH//2, box_rect.y + y_off))
             self.screen.blit(surf, rect)
             y_off += 30
@@ -151,12 +158,12 @@ class DialogueSystem:
         
         # YES
         col_yes = (255, 215, 0) if self.selected_index == 0 else (100, 100, 100)
-        yes_txt = self.font.render(f"> YES <" if self.selected_index == 0 else "  YES  ", True, col_yes)
+        yes_txt = render_text(self.font, f"> YES <" if self.selected_index == 0 else "  YES  ", True, col_yes)
         yes_rect = yes_txt.get_rect(center=(box_rect.centerx - 80, y_choice))
         self.screen.blit(yes_txt, yes_rect)
 
         # NO
         col_no = (255, 215, 0) if self.selected_index == 1 else (100, 100, 100)
-        no_txt = self.font.render(f"> NO <" if self.selected_index == 1 else "  NO  ", True, col_no)
+        no_txt = render_text(self.font, f"> NO <" if self.selected_index == 1 else "  NO  ", True, col_no)
         no_rect = no_txt.get_rect(center=(box_rect.centerx + 80, y_choice))
         self.screen.blit(no_txt, no_rect)
\ No newline at end of file
@@ -0,0 +1,104 @@
+import time
+import pygame
+
+# How an image is stored once loaded, picked from its alpha channel:
+#   opaque   - no transparent pixels: convert(), a plain copy blit
+#   colorkey - every pixel fully opaque or fully transparent: convert() plus
+#              a colorkey, RLE-accelerated when the surface owns its pixels
+#   alpha    - real translucency: convert_alpha(), per-pixel blending
+OPAQUE, COLORKEY, ALPHA = "opaque", "colorkey", "alpha"
+
+# Candidate keys, used only if a key color doesn't already occur in the image
+KEYS = [(255, 0, 255), (0, 255, 255), (1, 2, 3), (254, 1, 253)]
+
+# Set by tune_blits() if colorkeys turn out slower than alpha on this machine
+use_colorkey = True
+# Path chosen for every prepared image, by name
+formats = {}
+
+def classify(surf):
+    """OPAQUE, COLORKEY (binary alpha) or ALPHA for a surface with per-pixel alpha."""
+    if not surf.get_flags() & pygame.SRCALPHA:
+        return COLORKEY if surf.get_colorkey() is not None else OPAQUE
+    w, h = surf.get_size()
+    solid = pygame.mask.from_surface(surf, 254).count()
+    if solid == w * h: return OPAQUE
+    visible = pygame.mask.from_surface(surf, 0).count()
+    return COLORKEY if solid == visible else ALPHA
+
+def colorkeyed(surf, rle=False):
+    """A display-format copy of a binary-alpha surface with its transparent
+    pixels keyed out, or None if every candidate key is used by the image."""
+    w, h = surf.get_size()
+    transparent = w * h - pygame.mask.from_surface(surf, 0).count()
+    for key in KEYS:
+        out = pygame.Surface((w, h)).convert()
+        out.fill(key)
+        out.blit(surf, (0, 0))
+        if pygame.mask.from_threshold(out, key, (1, 1, 1, 255)).count() != transparent: continue
+        out.set_colorkey(key, pygame.RLEACCEL if rle else 0)
+        return out
+    return None
+
+def prepare(surf, name=None, rle=False):
+    """Convert a loaded surface to the cheapest format that draws it the same.
+
+    Only pass rle=True for surfaces nothing takes subsurfaces of: RLE
+    surfaces are re-encoded whenever a subsurface of them is locked.
+    """
+    kind = classify(surf)
+    out = None
+    if kind == OPAQUE:
+        out = surf.convert()
+    elif kind == COLORKEY and use_colorkey:
+        if surf.get_colorkey() is None or surf.get_flags() & pygame.SRCALPHA:
+            out = colorkeyed(surf, rle)
+        else:
+            # Already keyed: still convert it to the display format, keeping
+            # its key and any RLE it had
+            rle = rle or bool(surf.get_flags() & (pygame.RLEACCEL | pygame.RLEACCELOK))
+            out = surf.convert()
+            out.set_colorkey(surf.get_colorkey(), pygame.RLEACCEL if rle else 0)
+    if out is None:
+        kind, out = ALPHA, surf.convert_alpha()
+    if name is not None:
+        formats[name] = kind + ("+rle" if rle and kind == COLORKEY else "")
+    return out
+
+def format_counts(prefix=""):
+    """How many prepared images whose names start with prefix use each path."""
+    counts = {}
+    for name, kind in formats.items():
+        if name.startswith(prefix):
+            counts[kind] = counts.get(kind, 0) + 1
+    return counts
+
+def blit_timings(screen, repeat=2000):
+    """Microseconds per blit of the same 128px sprite in each format."""
+    sprite = pygame.Surface((128, 128), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (200, 140, 60), (64, 64), 60)
+    pygame.draw.rect(sprite, (60, 120, 200), (30, 20, 40, 90))
+    paths = {
+        ALPHA: (sprite.convert_alpha(), 0),
+        COLORKEY: (colorkeyed(sprite), 0),
+        COLORKEY + "+rle": (colorkeyed(sprite, rle=True), 0),
+        "premultiplied": (sprite.convert_alpha().premul_alpha(), pygame.BLEND_PREMULTIPLIED),
+    }
+    timings = {}
+    for name, (surf, flags) in paths.items():
+        screen.blit(surf, (0, 0), special_flags=flags)
+        start = time.perf_counter()
+        for i in range(repeat):
+            screen.blit(surf, (i % 64, 0), special_flags=flags)
+        timings[name] = (time.perf_counter() - start) / repeat * 1e6
+    return timings
+
+def tune_blits(screen):
+    """Time the blit paths once at startup and stop using colorkeys if they
+    are not faster than alpha blending here."""
+    global use_colorkey
+    timings = blit_timings(screen)
+    use_colorkey = min(timings[COLORKEY], timings[COLORKEY + "+rle"]) < timings[ALPHA]
+    print("blit paths (us): " + ", ".join(f"{k} {v:.1f}" for k, v in timings.items())
+          + f" -> {'colorkey' if use_colorkey else 'alpha'} for binary-alpha art")
+    return timings
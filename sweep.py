@@ -0,0 +1,124 @@
+"""Boss balance sweeps over headless fights.
+
+    python sweep.py harus --grid swing_telegraph_time=0.5,0.6,0.7 \\
+        --grid swing_active_time=0.3,0.35 --policy dodge --fights 500
+
+Every combination of --grid values (boss attributes, set after the boss is
+built; ints, floats or True/False) is played --fights times by the --policy bot from policies.py, on the
+same seeds for every combination. Batches of fights run on a process pool
+with one worker per core; each batch sends back only a few sums, so the
+sweep scales with the number of workers. One CSV row per combination: win
+and timeout rates, damage taken, boss hp left and fight length.
+"""
+import argparse, csv, itertools, os, sys, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import sim
+from policies import POLICIES
+from settings import SIM_HZ
+
+BOOLS = {"true": True, "false": False}
+
+def parse_value(text):
+    """An int, float or True/False from a --grid value."""
+    if text.lower() in BOOLS: return BOOLS[text.lower()]
+    try: return int(text)
+    except ValueError: return float(text)
+
+def parse_grid(items):
+    """{attribute: [values]} from ATTR=V1,V2 items; ValueError names a bad one."""
+    grid = {}
+    for item in items:
+        name, _, values = item.partition("=")
+        if not name or not values: raise ValueError(f"expected ATTR=V1,V2,..., got {item!r}")
+        try: grid[name] = [parse_value(v) for v in values.split(",")]
+        except ValueError: raise ValueError(f"bad value in {item!r}: use numbers or True/False") from None
+    return grid
+
+def play(boss, params, policy, seeds, max_ticks):
+    """Play one batch of fights. Returns (wins, timeouts, damage taken, boss
+    hp left, [fight length in ticks])."""
+    wins = timeouts = damage = boss_hp = 0
+    lengths = []
+    for seed in seeds:
+        fight = sim.new_fight(boss, seed)
+        for name, value in params:
+            setattr(fight.boss, name, value)
+        state, _ = sim.simulate(fight, POLICIES[policy](seed), max_ticks)
+        fight.cleanup()
+        wins += state["outcome"] == "won"
+        timeouts += state["outcome"] is None
+        damage += fight.player.max_hp - state["player_hp"]
+        boss_hp += max(0, state["boss_hp"])
+        lengths.append(state["tick"])
+    return wins, timeouts, damage, boss_hp, lengths
+
+def summarize(fights, wins, timeouts, damage, boss_hp, lengths):
+    lengths = sorted(lengths)
+    return {
+        "fights": fights,
+        "win_rate": round(wins / fights, 4),
+        "timeout_rate": round(timeouts / fights, 4),
+        "damage_taken": round(damage / fights, 3),
+        "boss_hp_left": round(boss_hp / fights, 3),
+        "duration_s": round(sum(lengths) / fights / SIM_HZ, 2),
+        "duration_p90_s": round(lengths[int(0.9 * (fights - 1))] / SIM_HZ, 2),
+    }
+
+def run_sweep(boss, grid, policy, fights, workers=None, batch=50, max_seconds=600):
+    """Play the sweep; returns ([row dict per combination], total ticks)."""
+    names = list(grid)
+    combos = [tuple(zip(names, values)) for values in itertools.product(*grid.values())]
+    totals = {c: [0, 0, 0, 0, []] for c in combos}
+    ticks = 0
+    with ProcessPoolExecutor(workers, initializer=sim.headless) as pool:
+        jobs = {pool.submit(play, boss, c, policy, range(s, min(s + batch, fights)), int(max_seconds * SIM_HZ)): c
+                for c in combos for s in range(0, fights, batch)}
+        for job in as_completed(jobs):
+            acc = totals[jobs[job]]
+            *sums, lengths = job.result()
+            for i, v in enumerate(sums): acc[i] += v
+            acc[4] += lengths
+            ticks += sum(lengths)
+    rows = [dict(c, boss=boss, policy=policy, **summarize(fights, *totals[c])) for c in combos]
+    return rows, ticks
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play boss fights headless over a grid of boss settings.")
+    parser.add_argument("boss", choices=sorted(sim.BOSSES))
+    parser.add_argument("--grid", action="append", default=[], metavar="ATTR=V1,V2,...",
+                        help="boss attribute and the values to try (repeatable)")
+    parser.add_argument("--policy", default="dodge", choices=sorted(POLICIES))
+    parser.add_argument("--fights", type=int, default=200, help="fights per combination")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: one per core)")
+    parser.add_argument("--batch", type=int, default=50, help="fights per job sent to a worker")
+    parser.add_argument("--max-seconds", type=float, default=600, help="game time before a fight counts as a timeout")
+    parser.add_argument("--out", default="sweep_results.csv")
+    args = parser.parse_args(argv)
+
+    try:
+        grid = parse_grid(args.grid)
+    except ValueError as e:
+        parser.error(str(e))
+    sim.headless()
+    probe = sim.new_fight(args.boss)
+    probe.cleanup()
+    for name in grid:
+        if not hasattr(probe.boss, name):
+            parser.error(f"{type(probe.boss).__name__} has no attribute {name!r}")
+
+    start = time.perf_counter()
+    rows, ticks = run_sweep(args.boss, grid, args.policy, args.fights, args.workers, args.batch, args.max_seconds)
+    elapsed = time.perf_counter() - start
+
+    with open(args.out, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    fights = len(rows) * args.fights
+    print(f"{fights} fights ({len(rows)} combinations) in {elapsed:.1f}s on {args.workers or os.cpu_count()} workers: "
+          f"{fights / elapsed:.0f} fights/s, {ticks / elapsed:.0f} ticks/s -> {args.out}")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,32 @@
+class FixedTimestep:
+    """Turns variable frame times into whole fixed-length simulation ticks.
+
+    Each frame, advance(frame_time) adds the real time elapsed to an
+    accumulator and returns how many ticks of `step` seconds to run; what is
+    left over becomes `alpha`, how far the renderer is between the last two
+    ticks. A long hitch is clamped to max_frame, and at most max_steps ticks
+    run per frame: beyond that the game slows down instead of spending
+    every frame catching up. `skipped` totals the simulation time given up.
+    """
+
+    def __init__(self, hz, max_steps=8, max_frame=0.25):
+        self.step = 1.0 / hz
+        self.max_steps = max_steps
+        self.max_frame = max_frame
+        self.accumulator = 0.0
+        self.skipped = 0.0
+
+    def advance(self, frame_time):
+        self.accumulator += min(frame_time, self.max_frame)
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            behind = (steps - self.max_steps) * self.step
+            self.accumulator -= behind
+            self.skipped += behind
+            steps = self.max_steps
+        self.accumulator -= steps * self.step
+        return steps
+
+    @property
+    def alpha(self):
+        return min(1.0, self.accumulator / self.step)
@@ -0,0 +1,525 @@
+"""Many boss fights at once, held in NumPy arrays.
+
+    import numpy as np
+    from vecenv import VecFightEnv, ATTACK
+    env = VecFightEnv("harus", 1024, seed=1)
+    obs = env.reset()
+    obs, reward, done, info = env.step(np.full(1024, ATTACK))
+
+The rules of Player, PapiaBoss (Meteor, LargeOrb), HarusBoss (Shockwave) and
+sim.Fight.step(), with every attribute turned into an array over fights, so
+one step() advances all of them in a handful of array operations. It is for
+training and tuning bots at rates sim.simulate can't reach. It is not
+bit-exact with sim.simulate: positions stay floats where the objects round
+into Rects, and all fights roll from one numpy Generator, so the same seed
+does not give the same fight.
+"""
+import numpy as np
+from settings import WIDTH, HEIGHT, GROUND_Y, SIM_HZ
+
+# Actions are a bitmask per fight
+LEFT, RIGHT, JUMP, ATTACK, DASH = 1, 2, 4, 8, 16
+ACTIONS = {"left": LEFT, "right": RIGHT, "jump": JUMP, "attack": ATTACK, "dash": DASH}
+
+PLAYER_STATES = ("ready", "windup", "active", "recovery")
+HARUS_STATES = ("idle", "telegraph", "parry", "active", "recovery", "stunned")
+READY, WINDUP, ACTIVE, RECOVERY = range(4)
+H_IDLE, H_TELEGRAPH, H_PARRY, H_ACTIVE, H_RECOVERY, H_STUNNED = range(6)
+
+# Boss settings that can be given per fight (scalar or one value per fight), as in bosses.py
+PAPIA = {"hp": 25, "meteor_count": 6, "meteor_delay_between": 0.14, "orb_speed": 560.0, "orb_life": 1.7,
+         "use_phase_combo": True}
+HARUS = {"hp": 45, "swing_reach": 160, "swing_tip_radius": 28, "swing_telegraph_time": 0.7,
+         "swing_active_time": 0.35, "spin_telegraph_time": 0.8, "spin_active_time": 0.75}
+
+# Columns of observe()
+OBS = ("player_x", "player_y", "player_vx", "player_vy", "player_hp", "player_facing", "player_state",
+       "dash_cooldown", "boss_x", "boss_hp", "boss_state", "boss_timer", "threat", "threat_dx", "threat_dy")
+
+PLAYER_HP = 8
+DASH_TIME = 0.14
+# Meteor columns, split by parity (PapiaBoss.grid_positions)
+GRID = np.arange(80, WIDTH - 80, 40, dtype=np.float64)
+GRID_BY_PARITY = np.stack([GRID[0::2], GRID[1::2]])
+# A swing's wave is off screen within ~3s and swings come at most every ~2.5s
+MAX_SHOCKWAVES = 4
+
+SWING_SAMPLES = 128
+
+def swing_arc(start, target):
+    """Rows of (angle, cos, sin) at SWING_SAMPLES + 1 even steps in time through
+    an eased swing, as bosses.swing_arc()."""
+    e = 1 - (1 - np.arange(SWING_SAMPLES + 1) / SWING_SAMPLES) ** 2
+    angle = (1 - e) * start + e * target
+    return np.stack([angle, np.cos(np.radians(angle)), np.sin(np.radians(angle))], 1)
+
+# Swings to the right and to the left (HarusBoss.swing_attack)
+SWING_ARCS = np.stack([swing_arc(-200, 60), swing_arc(20, -240)])
+
+def overlap(ax, ay, aw, ah, bx, by, bw, bh):
+    """Rect.colliderect over arrays."""
+    return (ax < bx + bw) & (bx < ax + aw) & (ay < by + bh) & (by < ay + ah)
+
+def rect_point_distance(x, y, w, h, px, py):
+    dx = np.maximum(np.maximum(x - px, px - (x + w)), 0)
+    dy = np.maximum(np.maximum(y - py, py - (y + h)), 0)
+    return np.hypot(dx, dy)
+
+def rect_drop_distance(x, y, w, h, px, top, bottom):
+    """rect_point_distance to the nearest point of the vertical segment from
+    (px, top) down to (px, bottom)."""
+    dx = np.maximum(np.maximum(x - px, px - (x + w)), 0)
+    dy = np.maximum(np.maximum(y - bottom, top - (y + h)), 0)
+    return np.hypot(dx, dy)
+
+def segment_point_distance(x0, y0, x1, y1, px, py):
+    dx, dy = x1 - x0, y1 - y0
+    length2 = dx * dx + dy * dy
+    t = np.clip(((px - x0) * dx + (py - y0) * dy) / np.where(length2 > 0, length2, 1), 0, 1)
+    return np.hypot(px - x0 - t * dx, py - y0 - t * dy)
+
+def arc_at(side, t):
+    """(angle, cos, sin) columns `t` of the way through each fight's SWING_ARCS[side]."""
+    f = t * SWING_SAMPLES
+    i = np.minimum(f.astype(np.intp), SWING_SAMPLES - 1)
+    f = (f - i)[..., None]
+    a, b = SWING_ARCS[side, i], SWING_ARCS[side, i + 1]
+    return np.moveaxis(a + (b - a) * f, -1, 0)
+
+def tick_down(timer, dt, mask=True):
+    """`if timer > 0: timer -= dt` for every fight in `mask`."""
+    np.subtract(timer, dt, out=timer, where=mask & (timer > 0))
+
+class VecFightEnv:
+    """`n` fights against "papia" or "harus", stepped together.
+
+    step(actions) takes one action bitmask per fight and returns
+    (observations, reward, done, info). The reward is damage dealt minus
+    damage taken this tick. Finished fights start over at once, so done
+    marks the tick a fight ended: info["outcome"] is 1 (won), -1 (lost) or
+    0 (ran past max_seconds) there and info["ticks"] its length.
+    The state arrays (px, bx, h_state, m_x, ...) are public for policies.
+    """
+
+    def __init__(self, boss, n, seed=None, max_seconds=600, dt=1.0 / SIM_HZ, **params):
+        defaults = {"papia": PAPIA, "harus": HARUS}[boss]
+        unknown = sorted(set(params) - set(defaults))
+        if unknown: raise ValueError(f"no {boss} setting named {', '.join(unknown)}")
+        self.boss, self.n, self.dt = boss, n, dt
+        self.max_ticks = int(round(max_seconds / dt))
+        self.rng = np.random.default_rng(seed)
+        self.params = {k: np.broadcast_to(np.asarray(params.get(k, v)), (n,)) for k, v in defaults.items()}
+        self.max_hp = self.params["hp"].astype(np.int32)
+        f, b, i = (lambda dtype, shape=(n,): np.zeros(shape, dtype)), np.bool_, np.int32
+        self.tick = f(i)
+
+        # Player
+        self.px, self.py, self.vx, self.vy, self.facing = (f(np.float64) for _ in range(5))
+        self.hp, self.state = f(i), f(np.int8)
+        self.timer, self.hit_x, self.hit_y = f(np.float64), f(np.float64), f(np.float64)
+        self.recov, self.jump_hold, self.dash_cd, self.dash_timer = (f(np.float64) for _ in range(4))
+        self.on_ground, self.applied, self.dashing = f(b), f(b), f(b)
+
+        # Boss
+        self.bx, self.boss_hp, self.cd = f(np.float64), f(i), f(np.float64)
+        if boss == "papia":
+            self.meteors = int(min(self.params["meteor_count"].max(), GRID_BY_PARITY.shape[1]))
+            m = (n, self.meteors)
+            self.cast, self.casting, self.busy, self.combo = f(np.float64), f(b), f(b), f(b)
+            self.m_x, self.m_y, self.m_wind, self.m_imp_t = (f(np.float64, m) for _ in range(4))
+            self.m_alive, self.m_active, self.m_impact = f(b, m), f(b, m), f(b, m)
+            self.m_prev_y = f(np.float64, m)
+            self.o_x, self.o_y, self.o_vx, self.o_vy, self.o_wind, self.o_life = (f(np.float64) for _ in range(6))
+            self.o_prev_x, self.o_prev_y = f(np.float64), f(np.float64)
+            self.o_alive, self.o_launched = f(b), f(b)
+        else:
+            s = (n, MAX_SHOCKWAVES)
+            self.h_state, self.h_facing, self.att_facing = f(np.int8), f(np.float64), f(np.float64)
+            self.h_timer, self.stun_t, self.rot, self.start_ang, self.target_ang = (f(np.float64) for _ in range(5))
+            self.prev_tip, self.spin_x = f(np.float64), f(np.float64)
+            # How far through its swing_arc() (row arc_side) the axe is, and was the tick before
+            self.arc_side, self.swing_t, self.last_t = f(np.intp), f(np.float64), f(np.float64)
+            self.tip_c, self.tip_s, self.swing_end = f(np.float64), f(np.float64), f(b)
+            self.h_spin, self.h_active, self.parry, self.spawned = f(b), f(b), f(b), f(b)
+            self.s_x, self.s_prev_x, self.s_dir, self.s_alive = f(np.float64, s), f(np.float64, s), f(np.float64, s), f(b, s)
+        self.reset()
+
+    # --- Setup ---
+
+    def reset(self):
+        self._reset(np.ones(self.n, np.bool_))
+        return self.observe()
+
+    def _reset(self, r):
+        """new_fight() for the fights in mask `r`."""
+        self.tick[r] = 0
+        self.px[r], self.py[r], self.vx[r], self.vy[r], self.facing[r] = 100, GROUND_Y, 0, 0, 1
+        self.hp[r], self.state[r], self.timer[r] = PLAYER_HP, READY, 0
+        self.recov[r] = self.jump_hold[r] = self.dash_cd[r] = self.dash_timer[r] = 0
+        self.on_ground[r], self.applied[r], self.dashing[r] = True, False, False
+        self.bx[r], self.boss_hp[r] = 700, self.max_hp[r]
+        if self.boss == "papia":
+            self.cd[r], self.cast[r] = 0.8, 0
+            self.casting[r] = self.busy[r] = self.combo[r] = self.o_alive[r] = False
+            self.m_alive[r] = False
+        else:
+            self.cd[r], self.h_state[r], self.h_timer[r], self.stun_t[r] = 0, H_IDLE, 0, 0
+            self.h_facing[r] = self.att_facing[r] = -1
+            self.rot[r], self.prev_tip[r], self.last_t[r], self.swing_end[r] = 0, np.nan, np.nan, False
+            self.h_spin[r] = self.h_active[r] = self.parry[r] = self.spawned[r] = False
+            self.s_alive[r] = False
+
+    # --- Stepping ---
+
+    def step(self, actions):
+        actions = np.asarray(actions)
+        hp, boss_hp = self.hp.copy(), self.boss_hp.copy()
+        self._update_player(actions)
+        if self.boss == "papia":
+            self._update_papia()
+            boss_hit = self._papia_hits()
+        else:
+            self._update_harus()
+            boss_hit = self._harus_hits()
+
+        hurt = boss_hit & (self.recov <= 0)
+        self.hp -= hurt
+        self.recov[hurt] = 1.0
+        self.vx[hurt] = -300 * self.facing[hurt]
+
+        self.tick += 1
+        lost = self.hp <= 0
+        won = ~lost & (self.boss_hp <= 0)
+        done = lost | won | (self.tick >= self.max_ticks)
+        reward = ((boss_hp - self.boss_hp) - (hp - self.hp)).astype(np.float32)
+        info = {"outcome": won.astype(np.int8) - lost, "ticks": np.where(done, self.tick, 0)}
+        if done.any(): self._reset(done)
+        return self.observe(), reward, done, info
+
+    def _update_player(self, act):
+        dt = self.dt
+        left, right, jump = (act & LEFT) != 0, (act & RIGHT) != 0, (act & JUMP) != 0
+        tick_down(self.recov, dt)
+        tick_down(self.dash_cd, dt)
+        self.vy += 1300 * dt
+
+        move = ((self.state == READY) | (self.state == RECOVERY)) & ~self.dashing
+        go_left, go_right = move & left, move & ~left & right
+        self.facing[go_left], self.facing[go_right] = -1, 1
+        self.vx[move] = np.where(go_left, -200.0, np.where(go_right, 200.0, 0.0))[move]
+
+        jumped = move & jump & self.on_ground
+        self.vy[jumped], self.jump_hold[jumped], self.on_ground[jumped] = -300, 0.3, False
+        self.jump_hold[move & ~jump] = 0
+        hold = move & (self.jump_hold > 0)
+        self.vy[hold] -= 900 * dt
+        self.jump_hold[hold] -= dt
+
+        swing = move & ((act & ATTACK) != 0) & (self.state == READY)
+        self.state[swing], self.timer[swing], self.applied[swing] = WINDUP, 0.10, False
+        dash = move & ((act & DASH) != 0) & (self.dash_cd <= 0) & (self.state == READY)
+        self.dashing |= dash
+        self.dash_timer[dash], self.dash_cd[dash], self.recov[dash] = DASH_TIME, 0.6, DASH_TIME
+        self.vx[dash] = 700 * self.facing[dash]
+        self.vx[~move & ~self.dashing] = 0
+
+        self.dash_timer[self.dashing] -= dt
+        stop = self.dashing & (self.dash_timer <= 0)
+        self.dashing[stop], self.vx[stop] = False, 0
+
+        s = self.state.copy()
+        self.timer[s != READY] -= dt
+        due = self.timer <= 0
+        out = (s == WINDUP) & due
+        self.state[out], self.timer[out], self.hit_y[out] = ACTIVE, 0.12, self.py[out] - 60
+        # The hitbox follows the player while active (facing can't change then)
+        self.hit_x = self.px + np.where(self.facing > 0, 40, -90)
+        back = (s == ACTIVE) & due
+        self.state[back], self.timer[back], self.applied[back] = RECOVERY, 0.20, False
+        self.state[(s == RECOVERY) & due] = READY
+
+        fast = ~self.dashing & (np.abs(self.vx) > 400)
+        self.vx[fast] = 400 * np.sign(self.vx[fast])
+        self.px += self.vx * dt
+        self.py += self.vy * dt
+        landed = self.py >= GROUND_Y
+        self.py[landed], self.vy[landed], self.on_ground[landed] = GROUND_Y, 0, True
+
+    def _player_strikes(self, x, y, w, h):
+        """Player attack hitboxes that overlap the given rect and still deal damage."""
+        return ((self.state == ACTIVE) & ~self.applied
+                & overlap(self.hit_x, self.hit_y, 50, 20, x, y, w, h))
+
+    # --- Papia ---
+
+    def _update_papia(self):
+        dt = self.dt
+        np.copyto(self.m_prev_y, self.m_y)
+        np.copyto(self.o_prev_x, self.o_x)
+        np.copyto(self.o_prev_y, self.o_y)
+        live = self.m_alive
+        self.m_imp_t[live & self.m_impact] -= dt
+        wind = live & ~self.m_impact & (self.m_wind > 0)
+        self.m_wind[wind] -= dt
+        self.m_active |= wind & (self.m_wind <= 0)
+        fall = live & ~self.m_impact & ~wind & self.m_active
+        self.m_y[fall] += 700 * dt
+        landed = fall & (self.m_y >= GROUND_Y - 6)
+        self.m_y[landed], self.m_imp_t[landed] = GROUND_Y - 6, 0.30
+        self.m_impact |= landed
+        self.m_active &= ~landed
+        self.m_alive &= ~(self.m_impact & (self.m_imp_t <= 0))
+
+        orb = self.o_alive
+        wind = orb & (self.o_wind > 0)
+        self.o_wind[wind] -= dt
+        launch = wind & (self.o_wind <= 0)
+        if launch.any():
+            ux, uy = self._toward_player(self.o_x, self.o_y, (1.0, 0.0))
+            speed = self.params["orb_speed"]
+            self.o_vx[launch], self.o_vy[launch] = (ux * speed)[launch], (uy * speed)[launch]
+            self.o_launched |= launch
+        self.o_alive &= ~(orb & ~wind & (self.o_life <= 0))
+        fly = self.o_alive & ~wind & self.o_launched
+        if fly.any():
+            ux, uy = self._toward_player(self.o_x, self.o_y, None)
+            speed, k = self.params["orb_speed"], min(1.0, 2.0 * dt)
+            steer = fly & ~np.isnan(ux)
+            self.o_vx[steer] += ((ux * speed - self.o_vx) * k)[steer]
+            self.o_vy[steer] += ((uy * speed - self.o_vy) * k)[steer]
+            self.o_x[fly] = np.clip(self.o_x + self.o_vx * dt, 0, WIDTH)[fly]
+            self.o_y[fly] = np.clip(self.o_y + self.o_vy * dt, -200, HEIGHT + 200)[fly]
+            self.o_life[fly] -= dt
+
+        tick_down(self.cd, dt)
+        casting = self.cast > 0
+        self.cast[casting] -= dt
+        self.casting &= ~(casting & (self.cast <= 0))
+        self.combo |= self.params["use_phase_combo"].astype(bool) & (self.boss_hp <= self.max_hp // 2)
+
+        pick = ~self.busy & (self.cd <= 0) & ~self.m_alive.any(1) & ~self.o_alive & ~self.casting
+        if pick.any(): self._papia_cast(pick)
+        self.busy &= self.casting
+
+    def _toward_player(self, x, y, zero):
+        """Unit vectors toward the player; `zero` (or NaN) where within 0.1px."""
+        dx, dy = self.px - x, self.py - y
+        d = np.hypot(dx, dy)
+        near = d <= (0.0 if zero else 0.1)
+        d[near] = 1
+        ux, uy = dx / d, dy / d
+        ux[near], uy[near] = zero or (np.nan, np.nan)
+        return ux, uy
+
+    def _papia_cast(self, pick):
+        n, rng = self.n, self.rng
+        roll, kind, cooldown = rng.random((3, n))
+        combo = pick & self.combo & (roll < 0.38)
+        shower = pick & ~combo & (kind < 0.65)
+        orb = combo | (pick & ~combo & (kind >= 0.65))
+        # A combo is a shower and an orb delayed 0.45s; the orb's cast and cooldown win
+        delayed = np.where(combo, 0.45, 0.0)
+        self.cast[shower], self.cd[shower] = 0.9, 1.0 + cooldown[shower] * 0.6
+        self.cast[orb], self.cd[orb] = 0.55 + delayed[orb], (1.0 + cooldown * 0.5 + delayed)[orb]
+        self.busy |= pick
+        self.casting |= pick
+
+        shower |= combo
+        if shower.any():
+            idx = np.flatnonzero(shower)
+            grid = GRID_BY_PARITY[rng.integers(0, 2, idx.size)]
+            near = np.argsort(np.abs(grid - np.trunc(self.px[idx])[:, None]), axis=1, kind="stable")
+            slots = np.arange(self.meteors)
+            self.m_x[idx] = np.take_along_axis(grid, near[:, :self.meteors], 1)
+            self.m_y[idx] = self.m_prev_y[idx] = -80
+            self.m_wind[idx] = 0.9 + slots * self.params["meteor_delay_between"][idx, None]
+            self.m_active[idx] = self.m_impact[idx] = False
+            self.m_alive[idx] = slots < self.params["meteor_count"][idx, None]
+        if orb.any():
+            idx = np.flatnonzero(orb)
+            self.o_x[idx] = self.o_prev_x[idx] = self.bx[idx] + rng.integers(-40, 41, idx.size)
+            self.o_y[idx] = self.o_prev_y[idx] = GROUND_Y - 120 + rng.integers(-10, 11, idx.size)
+            self.o_vx[idx] = self.o_vy[idx] = 0
+            self.o_wind[idx] = 0.45 + delayed[idx]
+            self.o_life[idx] = self.params["orb_life"][idx]
+            self.o_launched[idx], self.o_alive[idx] = False, True
+
+    def _papia_hits(self):
+        struck = self._player_strikes(self.bx - 36, GROUND_Y - 120, 72, 120)
+        self.boss_hp -= struck
+        self.applied |= struck
+        # Orbs can be cut down even by a swing that already hit
+        cut = (self.state == ACTIVE) & self.o_alive & overlap(self.hit_x, self.hit_y, 50, 20,
+                                                              self.o_x - 20, self.o_y - 20, 40, 40)
+        self.o_alive &= ~cut
+        self.boss_hp -= cut
+        self.applied |= cut
+
+        px, py = self.px[:, None], self.py[:, None]
+        boom = self.m_impact & (np.hypot(px - self.m_x, py - 40 - GROUND_Y) <= 46)
+        # Rocks and orbs sweep the way they moved this tick, a rock's landing included
+        dropped = self.m_active | (self.m_impact & (self.m_prev_y < self.m_y))
+        falling = dropped & (rect_drop_distance(px - 20, py - 80, 40, 80, self.m_x, self.m_prev_y, self.m_y) <= 30)
+        hit = (self.m_alive & (boom | falling)).any(1)
+        orb = self.o_alive & (segment_point_distance(self.o_prev_x, self.o_prev_y, self.o_x, self.o_y,
+                                                     self.px, self.py) <= 40)
+        self.o_alive &= ~orb
+        return hit | orb
+
+    # --- Harus ---
+
+    def _update_harus(self):
+        dt, p = self.dt, self.params
+        s = self.h_state.copy()
+        self.swing_end[:] = False
+        toward = np.where(self.px > self.bx, 1.0, -1.0)
+        dist = np.abs(self.px - self.bx)
+        idle = s == H_IDLE
+        self.h_facing[idle] = toward[idle]
+
+        stunned = s == H_STUNNED
+        self.stun_t[stunned] -= dt
+        woke = stunned & (self.stun_t <= 0)
+        self.h_state[woke], self.h_timer[woke] = H_RECOVERY, 0.7
+        live = ~stunned
+        tick_down(self.cd, dt, live)
+
+        walk = idle & (dist > 350)
+        self.bx[walk] += toward[walk] * 90 * dt
+        ready = idle & (dist <= 350) & (self.cd <= 0)
+        if ready.any():
+            r = self.rng.random(self.n)
+            spin = ready & (dist < 350) & (r < np.where(dist < 160, 0.7, 0.2))
+            self._start_attack(spin, ready & (dist < 350) & ~spin)
+            self.cd[ready & (dist >= 350)] = 0.6
+
+        swing = ~self.h_spin
+        tele = s == H_TELEGRAPH
+        self.h_timer[tele] -= dt
+        self.swing_t[tele & swing] = 0
+        self.rot[tele & ~swing] += 120 * dt
+        self.parry[tele] = False
+        self.h_active[tele & swing] = False
+        go = tele & (self.h_timer <= 0)
+        self.h_state[go], self.h_timer[go], self.spawned[go] = H_PARRY, 0.12, False
+        self.att_facing[go] = self.h_facing[go]
+
+        parry = s == H_PARRY
+        self.h_timer[parry] -= dt
+        go = parry & (self.h_timer <= 0)
+        self.h_state[go] = H_ACTIVE
+        self.h_timer[go] = np.where(swing, p["swing_active_time"], p["spin_active_time"])[go]
+        self.h_active[go] = self.parry[go] = True
+        self.swing_t[go & swing] = 0
+
+        active = s == H_ACTIVE
+        swinging = active & swing
+        tip_y = GROUND_Y - 120 + self.tip_s * p["swing_reach"]
+        crossed = swinging & ~self.spawned & (self.prev_tip < GROUND_Y - 6) & (tip_y >= GROUND_Y - 6)
+        if crossed.any(): self._spawn_shockwave(crossed)
+        self.spawned |= crossed
+        self.prev_tip[swinging] = tip_y[swinging]
+        total = p["swing_active_time"]
+        t = np.clip((total - self.h_timer) / total, 0, 1)
+        self.swing_t[swinging] = t[swinging]
+        self.h_active[swinging] = True
+        self.h_timer[active] -= dt
+        done = active & (self.h_timer <= 0)
+        self.h_state[done], self.h_timer[done] = H_RECOVERY, 1.0
+        self.h_active[done] = self.parry[done] = False
+        # The rest of the arc still sweeps this tick, however coarse the ticks
+        self.swing_end |= done & swing
+        self.swing_t[self.swing_end] = 1
+        moved = swing & (tele | go | active)
+        if moved.any():
+            idx = np.flatnonzero(moved)
+            self.rot[idx], self.tip_c[idx], self.tip_s[idx] = arc_at(self.arc_side[idx], self.swing_t[idx])
+
+        recovery = s == H_RECOVERY
+        self.h_timer[recovery] -= dt
+        done = recovery & (self.h_timer <= 0)
+        self.h_state[done], self.cd[done] = H_IDLE, 0.4
+        self.h_active[done] = self.parry[done] = False
+
+        waves = self.s_alive & live[:, None]
+        np.copyto(self.s_prev_x, self.s_x)
+        self.s_x += np.where(waves, self.s_dir * 380 * dt, 0)
+        self.s_alive &= ~(waves & ((self.s_x + 80 < 0) | (self.s_x > WIDTH)))
+
+    def _start_attack(self, spin, swing):
+        new = spin | swing
+        self.att_facing[new] = self.h_facing[new]
+        self.h_state[new], self.h_spin[new] = H_TELEGRAPH, spin[new]
+        self.h_timer[new] = np.where(spin, self.params["spin_telegraph_time"], self.params["swing_telegraph_time"])[new]
+        right = self.att_facing > 0
+        self.start_ang[swing] = np.where(right, -200, 20)[swing]
+        self.target_ang[swing] = np.where(right, 60, -240)[swing]
+        self.arc_side[swing], self.swing_t[swing] = np.where(right, 0, 1)[swing], 0
+        self.tip_c[swing], self.tip_s[swing] = SWING_ARCS[self.arc_side[swing], 0, 1:].T
+        self.rot[new] = np.where(spin, 0, self.start_ang)[new]
+        self.prev_tip[swing] = np.nan
+        self.parry[new] = self.h_active[swing] = self.spawned[swing] = False
+        self.spin_x[spin] = self.bx[spin] - 200
+
+    def _spawn_shockwave(self, mask):
+        idx = np.flatnonzero(mask)
+        slot = np.argmin(self.s_alive[idx], axis=1)  # First free slot
+        self.s_x[idx, slot] = self.s_prev_x[idx, slot] = self.bx[idx] + 5 + self.att_facing[idx] * 120
+        self.s_dir[idx, slot] = self.att_facing[idx]
+        self.s_alive[idx, slot] = True
+
+    def _harus_hits(self):
+        struck = self._player_strikes(self.bx - 70, GROUND_Y - 180, 140, 180)
+        self.boss_hp -= struck
+        self.applied |= struck
+        parried = struck & self.parry
+        self.h_state[parried], self.stun_t[parried] = H_STUNNED, 0.9
+        self.h_active[parried] = self.parry[parried] = False
+        self.bx[parried] -= self.att_facing[parried] * 30
+
+        hx, hy = self.px - 20, self.py - 80
+        hit = self.h_spin & self.h_active & overlap(self.spin_x, GROUND_Y - 90, 400, 70, hx, hy, 40, 80)
+        # A wave slides straight across, so what it swept this tick is a wider box
+        left, swept = np.minimum(self.s_x, self.s_prev_x), np.abs(self.s_x - self.s_prev_x)
+        wave = self.s_alive & overlap(left, GROUND_Y - 40, 80 + swept, 60, hx[:, None], hy[:, None], 40, 80)
+        self.s_alive &= ~wave
+        axe = ~self.h_spin & (self.h_active | self.swing_end)
+        if axe.any():
+            idx = np.flatnonzero(axe)
+            axe[idx] = self._tip_distance(idx, hx[idx], hy[idx]) <= self.params["swing_tip_radius"][idx]
+        self.last_t = np.where(~self.h_spin & self.h_active, self.swing_t, np.nan)
+        return hit | wave.any(1) | axe
+
+    def _tip_distance(self, idx, hx, hy):
+        """How close the axe tip of fights `idx` came to their hurtboxes along
+        the arc since last tick, tested at steps no longer than a step of
+        SWING_ARCS (within half a pixel of sweeping it exactly)."""
+        t1, t0 = self.swing_t[idx], self.last_t[idx]
+        t0 = np.where(np.isnan(t0), t1, t0)
+        steps = int(np.ceil((t1 - t0).max() * SWING_SAMPLES)) + 1
+        t = t0[:, None] + (t1 - t0)[:, None] * np.linspace(0, 1, steps + 1)
+        _, cos, sin = arc_at(self.arc_side[idx, None], t)
+        reach = self.params["swing_reach"][idx, None]
+        x, y = self.bx[idx, None] + cos * reach, GROUND_Y - 120 + sin * reach
+        return rect_point_distance(hx[:, None], hy[:, None], 40, 80, x, y).min(1)
+
+    # --- Observations ---
+
+    def observe(self):
+        """One row of OBS columns per fight; threat_dx/dy point from the player
+        to the nearest (in x) meteor, orb or shockwave, if threat is 1."""
+        if self.boss == "papia":
+            boss_state, boss_timer = self.casting, self.cd
+            xs = np.concatenate([self.m_x, self.o_x[:, None]], 1)
+            ys = np.concatenate([self.m_y, self.o_y[:, None]], 1)
+            live = np.concatenate([self.m_alive & ~self.m_impact, self.o_alive[:, None]], 1)
+        else:
+            boss_state, boss_timer = self.h_state, self.h_timer
+            xs, ys, live = self.s_x + 40, np.full(self.s_x.shape, GROUND_Y - 10.0), self.s_alive
+        dx, dy = xs - self.px[:, None], ys - self.py[:, None]
+        near = np.argmin(np.where(live, np.abs(dx), np.inf), axis=1)[:, None]
+        threat = np.take_along_axis(live, near, 1)[:, 0]
+        dx = np.where(threat, np.take_along_axis(dx, near, 1)[:, 0], 0)
+        dy = np.where(threat, np.take_along_axis(dy, near, 1)[:, 0], 0)
+        return np.stack([self.px, self.py, self.vx, self.vy, self.hp, self.facing, self.state, self.dash_cd,
+                         self.bx, self.boss_hp, boss_state, boss_timer, threat, dx, dy], axis=1).astype(np.float32)